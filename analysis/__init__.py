@@ -3,9 +3,22 @@ Módulo de análisis y modelos predictivos para la aplicación de Análisis NBA
 """
 
 from .predictions import predecir_probabilidad, calcular_net_rating
+from .comparaciones import comparar_equipos, ComparacionesMaterializadas
+from .rankings import calcular_rankings, calcular_indices_orden
+from .similitud import IndiceSimilitud
+from .season_cube import CuboTemporadas, CuboCompartido, construir_cubo, sincronizar_cubo
 
 __all__ = [
     'predecir_probabilidad',
-    'calcular_net_rating'
+    'calcular_net_rating',
+    'comparar_equipos',
+    'ComparacionesMaterializadas',
+    'calcular_rankings',
+    'calcular_indices_orden',
+    'CuboTemporadas',
+    'CuboCompartido',
+    'construir_cubo',
+    'sincronizar_cubo',
+    'IndiceSimilitud'
 ]
 
@@ -0,0 +1,5 @@
+"""
+Comparación vectorizada entre equipos (compatibilidad: vive en ``core.comparaciones``)
+"""
+
+from core.comparaciones import signos_direccion, comparar_equipos, ComparacionesMaterializadas  # noqa: F401
@@ -0,0 +1,79 @@
+"""
+Rankings y percentiles de liga por métrica
+"""
+
+import numpy as np
+import pandas as pd
+
+from core.comparaciones import signos_direccion
+
+
+def calcular_rankings(df_nba):
+    """
+    Calcula el ranking y el percentil de cada equipo en todas las métricas numéricas.
+    
+    Se hace en una sola pasada vectorizada: las métricas donde menor es mejor
+    se invierten de signo para que el rango 1 sea siempre el mejor equipo.
+    
+    Args:
+        df_nba (pd.DataFrame): DataFrame procesado de una temporada
+        
+    Returns:
+        tuple: (rangos, percentiles), ambos DataFrames con índice=equipos y
+        columnas=métricas. El percentil vale 100 para el mejor y 0 para el peor.
+    """
+    metricas = [col for col in df_nba.select_dtypes(include='number').columns]
+    valores = df_nba[metricas].set_axis(df_nba['Equipo'], axis=0)
+    
+    signos = signos_direccion(metricas)
+    rangos = (valores * signos).rank(method='min', ascending=False)
+    
+    # Percentil: fracción de equipos a los que se supera o iguala
+    num_equipos = valores.notna().sum().to_numpy()
+    percentiles = (num_equipos - rangos) / np.maximum(num_equipos - 1, 1) * 100
+    
+    return rangos.astype('Int64'), percentiles
+
+
+def formatear_rango(rango):
+    """
+    Formatea un rango como badge de texto.
+    
+    Args:
+        rango: Rango del equipo (puede ser NA)
+        
+    Returns:
+        str: Texto tipo "#3", o cadena vacía si no hay rango
+    """
+    if pd.isna(rango):
+        return ''
+    return f"#{int(rango)}"
+
+
+def calcular_indices_orden(df_nba):
+    """
+    Precalcula la permutación de orden (mejor primero) para cada métrica.
+    
+    Se calcula una sola vez por snapshot con un único ``np.argsort`` sobre la
+    matriz equipos × métricas; para ordenar la tabla basta con indexar por
+    posición (``df.iloc[orden]``), sin volver a ordenar el DataFrame.
+    
+    Args:
+        df_nba (pd.DataFrame): DataFrame procesado de una temporada
+        
+    Returns:
+        dict: Mapa {métrica: np.ndarray de posiciones}; incluye 'Equipo' en orden alfabético.
+        Los valores faltantes quedan al final.
+    """
+    metricas = [col for col in df_nba.select_dtypes(include='number').columns]
+    valores = df_nba[metricas].to_numpy(dtype=np.float64)
+    
+    signos = signos_direccion(metricas)
+    claves = -(valores * signos)
+    claves[np.isnan(claves)] = np.inf
+    orden = np.argsort(claves, axis=0, kind='stable')
+    
+    indices = {metrica: orden[:, i] for i, metrica in enumerate(metricas)}
+    if 'Equipo' in df_nba.columns:
+        indices['Equipo'] = np.argsort(df_nba['Equipo'].to_numpy(dtype=str), kind='stable')
+    return indices
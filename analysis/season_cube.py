@@ -0,0 +1,438 @@
+"""
+Cubo de temporadas: arreglo denso temporadas × equipos × métricas
+"""
+
+import glob
+import json
+import os
+import threading
+import uuid
+
+import numpy as np
+import pandas as pd
+
+from config import COLUMNAS_SELECCIONADAS, SNAPSHOT_DIR, CUBO_DIR
+from core.metricas import metricas_derivadas
+from core.procesamiento import procesar_datos_nba
+from core.snapshots import cargar_snapshot, listar_snapshots
+
+# Métricas numéricas que forman el tercer eje del cubo
+METRICAS_CUBO = [col for col in COLUMNAS_SELECCIONADAS.values() if col != 'Equipo'] + metricas_derivadas()
+
+# Serializa las actualizaciones de un cubo compartido entre sesiones
+_LOCK_SINCRONIZACION = threading.Lock()
+
+
+def _matriz_temporada(df_nba, metricas):
+    """
+    Convierte los datos crudos de una temporada en una matriz equipos × métricas.
+
+    Args:
+        df_nba (pd.DataFrame): DataFrame crudo con TEAM_ID
+        metricas (list): Métricas en el orden del cubo
+
+    Returns:
+        tuple: (ids de equipo, matriz de valores, nombres de equipo)
+    """
+    df_procesado = procesar_datos_nba(df_nba)
+    ids = df_nba.loc[df_procesado.index, 'TEAM_ID'].to_numpy(dtype=np.int64)
+    matriz = df_procesado.reindex(columns=metricas).to_numpy(dtype=np.float64)
+    nombres = df_procesado['Equipo'].tolist() if 'Equipo' in df_procesado.columns else [''] * len(ids)
+    return ids, matriz, nombres
+
+
+class CuboTemporadas:
+    """
+    Arreglo 3-D (temporada, equipo, métrica) con índices por eje.
+
+    Las celdas sin dato (un equipo que no existía en una temporada, o una
+    métrica ausente en el snapshot) contienen NaN.
+    """
+
+    def __init__(self, temporadas, equipos, metricas, valores, nombres=None, huellas=None):
+        """
+        Args:
+            temporadas (list): Temporadas en formato "YYYY-YY", ordenadas
+            equipos (array-like): TEAM_ID de cada posición del eje de equipos
+            metricas (list): Nombres de las métricas del tercer eje
+            valores (np.ndarray): Arreglo float64 de forma (temporadas, equipos, métricas)
+            nombres (dict): Último nombre conocido de cada TEAM_ID
+            huellas (dict): Huella del snapshot usado para cada temporada
+        """
+        self.temporadas = list(temporadas)
+        self.equipos = np.asarray(equipos, dtype=np.int64)
+        self.metricas = list(metricas)
+        self.valores = valores
+        self.nombres = {int(k): v for k, v in (nombres or {}).items()}
+        self.huellas = dict(huellas or {})
+        self._reindexar()
+
+    @classmethod
+    def vacio(cls, metricas=None):
+        """Crea un cubo sin temporadas ni equipos."""
+        metricas = list(metricas or METRICAS_CUBO)
+        return cls([], [], metricas, np.empty((0, 0, len(metricas))))
+
+    def _reindexar(self):
+        self._idx_temporada = {t: i for i, t in enumerate(self.temporadas)}
+        self._idx_equipo = {int(e): i for i, e in enumerate(self.equipos)}
+        self._idx_metrica = {m: i for i, m in enumerate(self.metricas)}
+
+    @property
+    def shape(self):
+        return self.valores.shape
+
+    def _indices(self, claves, indice):
+        if claves is None:
+            return slice(None)
+        return [indice[c] for c in claves]
+
+    def seleccionar(self, temporadas=None, equipos=None, metricas=None):
+        """
+        Extrae un sub-arreglo por etiquetas de cada eje.
+
+        Args:
+            temporadas (list): Temporadas a incluir (None = todas)
+            equipos (list): TEAM_ID a incluir (None = todos)
+            metricas (list): Métricas a incluir (None = todas)
+
+        Returns:
+            np.ndarray: Sub-arreglo con los tres ejes preservados
+        """
+        idx_t = self._indices(temporadas, self._idx_temporada)
+        idx_e = self._indices(equipos, self._idx_equipo)
+        idx_m = self._indices(metricas, self._idx_metrica)
+        resultado = self.valores[idx_t]
+        resultado = resultado[:, idx_e]
+        return resultado[:, :, idx_m]
+
+    def serie(self, equipo, metrica):
+        """
+        Devuelve la evolución de una métrica de un equipo a lo largo de las temporadas.
+
+        Args:
+            equipo (int): TEAM_ID
+            metrica (str): Nombre de la métrica
+
+        Returns:
+            pd.Series: Valores indexados por temporada
+        """
+        valores = self.valores[:, self._idx_equipo[int(equipo)], self._idx_metrica[metrica]]
+        return pd.Series(valores, index=self.temporadas, name=metrica)
+
+    def mejores(self, metrica, n=5, temporadas=None, menor_es_mejor=False):
+        """
+        Obtiene los n mejores registros equipo-temporada para una métrica.
+
+        Ejemplo: mejor defensa de las últimas 5 temporadas con
+        ``cubo.mejores('Rating Defensivo', temporadas=cubo.temporadas[-5:], menor_es_mejor=True)``.
+
+        Args:
+            metrica (str): Nombre de la métrica
+            n (int): Número de registros a devolver
+            temporadas (list): Temporadas a considerar (None = todas)
+            menor_es_mejor (bool): Si True, los valores bajos son mejores
+
+        Returns:
+            list: Tuplas (temporada, TEAM_ID, valor) ordenadas de mejor a peor
+        """
+        idx_t = self._indices(temporadas, self._idx_temporada)
+        bloque = self.valores[idx_t, :, self._idx_metrica[metrica]]
+        etiquetas_t = np.asarray(self.temporadas if temporadas is None else temporadas)
+
+        # Convertir a "mayor es mejor" y mandar los NaN al final
+        plano = bloque.ravel() * (-1.0 if menor_es_mejor else 1.0)
+        plano = np.where(np.isnan(plano), -np.inf, plano)
+        n = min(n, int(np.isfinite(plano).sum()))
+        if n == 0:
+            return []
+
+        candidatos = np.argpartition(-plano, n - 1)[:n]
+        orden = candidatos[np.argsort(-plano[candidatos], kind='stable')]
+        filas, columnas = np.unravel_index(orden, bloque.shape)
+        return [
+            (str(etiquetas_t[f]), int(self.equipos[c]), float(bloque[f, c]))
+            for f, c in zip(filas, columnas)
+        ]
+
+    def tendencias(self, equipos, metricas, temporadas=None, etiquetas=None):
+        """
+        Arma las series por temporada de varias métricas para varios equipos.
+
+        Args:
+            equipos (list): TEAM_ID de los equipos
+            metricas (list): Métricas a extraer
+            temporadas (list): Temporadas a incluir (None = todas); se ignoran las ausentes
+            etiquetas (list): Nombre a mostrar para cada equipo (por defecto el TEAM_ID)
+
+        Returns:
+            dict: Mapa {métrica: DataFrame con índice=temporadas y columnas=equipos}
+        """
+        temporadas = [t for t in (temporadas or self.temporadas) if t in self._idx_temporada]
+        etiquetas = etiquetas or [str(e) for e in equipos]
+        pares = [(e, et) for e, et in zip(equipos, etiquetas) if int(e) in self._idx_equipo]
+        equipos = [e for e, _ in pares]
+        etiquetas = [et for _, et in pares]
+        bloque = self.seleccionar(temporadas, equipos, metricas)
+        return {
+            metrica: pd.DataFrame(bloque[:, :, i], index=temporadas, columns=etiquetas)
+            for i, metrica in enumerate(metricas)
+        }
+
+    def agregar(self, metrica, funcion=np.nanmean, por='temporada'):
+        """
+        Agrega una métrica sobre uno de los ejes.
+
+        Args:
+            metrica (str): Nombre de la métrica
+            funcion (callable): Función de reducción compatible con NumPy (acepta ``axis``)
+            por (str): 'temporada' (reduce equipos) o 'equipo' (reduce temporadas)
+
+        Returns:
+            pd.Series: Valor agregado por temporada o por TEAM_ID
+        """
+        bloque = self.valores[:, :, self._idx_metrica[metrica]]
+        if por == 'temporada':
+            return pd.Series(funcion(bloque, axis=1), index=self.temporadas, name=metrica)
+        return pd.Series(funcion(bloque, axis=0), index=self.equipos, name=metrica)
+
+    def copiar(self):
+        """Devuelve una copia independiente del cubo (el arreglo se copia a memoria)."""
+        return CuboTemporadas(
+            self.temporadas, self.equipos.copy(), self.metricas, np.array(self.valores),
+            nombres=self.nombres, huellas=self.huellas
+        )
+
+    def _asegurar_escritura(self):
+        # Un cubo cargado con mmap es de solo lectura; se copia a memoria al modificarlo
+        if not self.valores.flags.writeable:
+            self.valores = np.array(self.valores)
+
+    def actualizar_temporada(self, temporada, df_nba, huella=None):
+        """
+        Reemplaza (o agrega) los datos de una temporada sin reconstruir el cubo.
+
+        Args:
+            temporada (str): Temporada en formato "YYYY-YY"
+            df_nba (pd.DataFrame): DataFrame crudo de la temporada (con TEAM_ID)
+            huella (str): Huella del snapshot de origen
+        """
+        ids, matriz, nombres = _matriz_temporada(df_nba, self.metricas)
+        self._asegurar_escritura()
+
+        # Equipos nuevos: ampliar el eje de equipos con NaN
+        nuevos = [int(e) for e in ids if int(e) not in self._idx_equipo]
+        if nuevos:
+            relleno = np.full((self.valores.shape[0], len(nuevos), len(self.metricas)), np.nan)
+            self.valores = np.concatenate([self.valores, relleno], axis=1)
+            self.equipos = np.concatenate([self.equipos, np.asarray(nuevos, dtype=np.int64)])
+
+        # Temporada nueva: insertarla en su posición ordenada
+        if temporada not in self._idx_temporada:
+            posicion = int(np.searchsorted(np.asarray(self.temporadas, dtype=object), temporada))
+            self.valores = np.insert(self.valores, posicion, np.nan, axis=0)
+            self.temporadas.insert(posicion, temporada)
+
+        self._reindexar()
+        idx_t = self._idx_temporada[temporada]
+        posiciones = np.fromiter((self._idx_equipo[int(e)] for e in ids), dtype=np.intp, count=len(ids))
+        self.valores[idx_t] = np.nan
+        self.valores[idx_t, posiciones] = matriz
+
+        self.nombres.update({int(e): nombre for e, nombre in zip(ids, nombres)})
+        if huella is not None:
+            self.huellas[temporada] = huella
+
+    def eliminar_temporada(self, temporada):
+        """Quita una temporada del cubo."""
+        idx_t = self._idx_temporada[temporada]
+        self.valores = np.delete(self.valores, idx_t, axis=0)
+        del self.temporadas[idx_t]
+        self.huellas.pop(temporada, None)
+        self._reindexar()
+
+    def guardar(self, directorio=CUBO_DIR):
+        """
+        Persiste el cubo como un arreglo ``valores-<id>.npy`` más ``meta.json``.
+
+        Cada guardado escribe el arreglo en un archivo nuevo y después reemplaza
+        ``meta.json`` (que apunta a él) de forma atómica: ese reemplazo es el
+        punto de confirmación, así que una interrupción deja el cubo anterior
+        completo. Los arreglos que ya no apunta ningún meta se borran al final.
+
+        Args:
+            directorio (str): Carpeta destino
+        """
+        os.makedirs(directorio, exist_ok=True)
+        nombre_valores = f"valores-{uuid.uuid4().hex[:12]}.npy"
+        np.save(os.path.join(directorio, nombre_valores), np.ascontiguousarray(self.valores))
+
+        meta = {
+            'valores': nombre_valores,
+            'temporadas': self.temporadas,
+            'equipos': self.equipos.tolist(),
+            'metricas': self.metricas,
+            'nombres': {str(k): v for k, v in self.nombres.items()},
+            'huellas': self.huellas
+        }
+        ruta_meta = os.path.join(directorio, 'meta.json')
+        ruta_tmp = f"{ruta_meta}.{os.getpid()}.tmp"
+        with open(ruta_tmp, 'w', encoding='utf-8') as f:
+            json.dump(meta, f, ensure_ascii=False)
+        os.replace(ruta_tmp, ruta_meta)
+
+        for ruta in glob.glob(os.path.join(directorio, 'valores*.npy')):
+            if os.path.basename(ruta) != nombre_valores:
+                try:
+                    os.remove(ruta)
+                except OSError:  # Mapeado por otro proceso en un sistema que no permite borrarlo
+                    pass
+
+    @classmethod
+    def cargar(cls, directorio=CUBO_DIR, mmap=True, metricas=None):
+        """
+        Carga un cubo persistido.
+
+        Un cubo con otro eje de métricas (el registro cambió) o cuyo arreglo no
+        coincide con los ejes de ``meta.json`` se descarta en lugar de servirse.
+
+        Args:
+            directorio (str): Carpeta con ``meta.json`` y el arreglo al que apunta
+            mmap (bool): Si True, el arreglo se mapea en memoria en modo lectura
+            metricas (list): Eje de métricas esperado (por defecto METRICAS_CUBO)
+
+        Returns:
+            CuboTemporadas: Cubo cargado, o None si no existe o no es válido
+        """
+        ruta_meta = os.path.join(directorio, 'meta.json')
+        if not os.path.exists(ruta_meta):
+            return None
+        with open(ruta_meta, encoding='utf-8') as f:
+            meta = json.load(f)
+        if meta['metricas'] != list(metricas or METRICAS_CUBO):
+            return None
+
+        ruta_valores = os.path.join(directorio, meta.get('valores', 'valores.npy'))
+        if not os.path.exists(ruta_valores):
+            return None
+        valores = np.load(ruta_valores, mmap_mode='r' if mmap else None)
+        if valores.shape != (len(meta['temporadas']), len(meta['equipos']), len(meta['metricas'])):
+            return None
+        return cls(
+            meta['temporadas'],
+            meta['equipos'],
+            meta['metricas'],
+            valores,
+            nombres=meta.get('nombres'),
+            huellas=meta.get('huellas')
+        )
+
+
+def construir_cubo(frames, huellas=None, metricas=None):
+    """
+    Construye un cubo a partir de los DataFrames crudos de varias temporadas.
+
+    Args:
+        frames (dict): Mapa {temporada: DataFrame crudo}
+        huellas (dict): Mapa opcional {temporada: huella del snapshot}
+        metricas (list): Métricas del tercer eje (por defecto METRICAS_CUBO)
+
+    Returns:
+        CuboTemporadas: Cubo con todas las temporadas
+    """
+    huellas = huellas or {}
+    cubo = CuboTemporadas.vacio(metricas)
+    for temporada in sorted(frames):
+        if not frames[temporada].empty:
+            cubo.actualizar_temporada(temporada, frames[temporada], huellas.get(temporada))
+    return cubo
+
+
+def sincronizar_cubo(cubo=None, directorio_snapshots=SNAPSHOT_DIR, directorio_cubo=CUBO_DIR):
+    """
+    Pone al día el cubo con los snapshots en disco, recargando solo las temporadas que cambiaron.
+
+    El cubo recibido nunca se modifica: si hay cambios se actualiza una copia,
+    de modo que otros hilos que lo estén leyendo siguen viendo datos coherentes.
+
+    Args:
+        cubo (CuboTemporadas): Cubo en memoria; si es None se carga el persistido
+        directorio_snapshots (str): Carpeta de snapshots por temporada
+        directorio_cubo (str): Carpeta donde se persiste el cubo
+
+    Returns:
+        CuboTemporadas: El mismo cubo si no hubo cambios, o uno nuevo actualizado
+    """
+    with _LOCK_SINCRONIZACION:
+        if cubo is None:
+            # Un cubo persistido con otras métricas (o inválido) se reconstruye desde los snapshots
+            original = None
+            cubo = CuboTemporadas.cargar(directorio_cubo) or CuboTemporadas.vacio()
+        else:
+            original = cubo
+
+        huellas = listar_snapshots(directorio_snapshots)
+        cambiadas = [t for t, h in huellas.items() if cubo.huellas.get(t) != h]
+        eliminadas = [t for t in cubo.temporadas if t not in huellas]
+        if not (cambiadas or eliminadas):
+            return cubo
+        if cubo is original:
+            cubo = cubo.copiar()
+
+        for temporada in eliminadas:
+            cubo.eliminar_temporada(temporada)
+        for temporada in cambiadas:
+            df_nba = cargar_snapshot(temporada, directorio_snapshots)
+            if not df_nba.empty:
+                cubo.actualizar_temporada(temporada, df_nba, huellas[temporada])
+
+        cubo.guardar(directorio_cubo)
+    return cubo
+
+
+class CuboCompartido:
+    """
+    Cubo de temporadas compartido entre hilos con copia al escribir.
+
+    Los lectores usan el cubo que devuelve ``actual()``, que nunca se modifica:
+    cuando cambian los snapshots se construye un cubo nuevo y se publica con
+    una sola asignación. Los snapshots solo se vuelven a listar cuando cambia
+    la fecha de modificación de su carpeta (``guardar_snapshot`` escribe
+    renombrando, así que cada guardado la actualiza).
+    """
+
+    def __init__(self, directorio_snapshots=SNAPSHOT_DIR, directorio_cubo=CUBO_DIR):
+        """
+        Args:
+            directorio_snapshots (str): Carpeta de snapshots por temporada
+            directorio_cubo (str): Carpeta donde se persiste el cubo
+        """
+        self.directorio_snapshots = directorio_snapshots
+        self.directorio_cubo = directorio_cubo
+        self._estado = (None, None)  # (firma de la carpeta, cubo publicado)
+        self._lock = threading.Lock()
+
+    def _firma(self):
+        try:
+            return os.stat(self.directorio_snapshots).st_mtime_ns
+        except FileNotFoundError:
+            return -1
+
+    def actual(self):
+        """
+        Devuelve el cubo vigente, sincronizándolo solo si la carpeta de snapshots cambió.
+
+        Returns:
+            CuboTemporadas: Cubo de solo lectura para quien lo recibe
+        """
+        firma = self._firma()
+        firma_publicada, cubo = self._estado
+        if cubo is not None and firma == firma_publicada:
+            return cubo
+
+        with self._lock:
+            firma_publicada, cubo = self._estado
+            if cubo is None or firma != firma_publicada:
+                cubo = sincronizar_cubo(cubo, self.directorio_snapshots, self.directorio_cubo)
+                self._estado = (firma, cubo)
+            return cubo
@@ -0,0 +1,158 @@
+"""
+Búsqueda de equipos similares entre temporadas (vecinos más cercanos)
+"""
+
+import threading
+
+import numpy as np
+
+# Métricas que describen el estilo y nivel de un equipo
+METRICAS_SIMILITUD = ['Ritmo de Juego', 'Rating Ofensivo', 'Rating Defensivo', 'AST/TO', '3P%']
+
+
+def _estandarizar(matriz):
+    """
+    Convierte una matriz equipos × métricas en z-scores por columna.
+
+    Se estandariza dentro de cada temporada para que la comparación entre
+    épocas mida el perfil del equipo respecto a su liga, no la inflación
+    general de ritmo o anotación.
+
+    Args:
+        matriz (np.ndarray): Valores crudos de una temporada
+
+    Returns:
+        np.ndarray: Matriz estandarizada (las columnas sin varianza quedan en 0)
+    """
+    media = np.nanmean(matriz, axis=0)
+    desviacion = np.nanstd(matriz, axis=0)
+    desviacion[~(desviacion > 0)] = 1.0
+    return (matriz - media) / desviacion
+
+
+class IndiceSimilitud:
+    """
+    Índice de vectores estandarizados equipo-temporada con búsqueda top-k.
+
+    Cada temporada se guarda como un bloque independiente, de modo que al
+    cambiar un snapshot solo se recalcula ese bloque.
+    """
+
+    def __init__(self, metricas=None):
+        """
+        Args:
+            metricas (list): Métricas que forman cada vector (por defecto METRICAS_SIMILITUD)
+        """
+        self.metricas = list(metricas or METRICAS_SIMILITUD)
+        self.huellas = {}
+        self._bloques = {}
+        self._lock = threading.Lock()
+        self._compilar()
+
+    def __len__(self):
+        return len(self._equipos)
+
+    def _compilar(self):
+        temporadas = sorted(self._bloques)
+        if temporadas:
+            self._temporadas = np.concatenate([
+                np.full(len(self._bloques[t][0]), t, dtype=object) for t in temporadas
+            ])
+            self._equipos = np.concatenate([self._bloques[t][0] for t in temporadas])
+            self._vectores = np.concatenate([self._bloques[t][1] for t in temporadas])
+        else:
+            self._temporadas = np.empty(0, dtype=object)
+            self._equipos = np.empty(0, dtype=np.int64)
+            self._vectores = np.empty((0, len(self.metricas)))
+        self._posiciones = {
+            (t, int(e)): i for i, (t, e) in enumerate(zip(self._temporadas, self._equipos))
+        }
+
+    def actualizar_temporada(self, temporada, equipos, matriz, huella=None):
+        """
+        Reemplaza el bloque de una temporada.
+
+        Args:
+            temporada (str): Temporada en formato "YYYY-YY"
+            equipos (np.ndarray): TEAM_ID de cada fila
+            matriz (np.ndarray): Valores crudos equipos × métricas
+            huella (str): Huella del snapshot de origen
+        """
+        with self._lock:
+            self._actualizar_bloque(temporada, equipos, matriz, huella)
+            self._compilar()
+
+    def _actualizar_bloque(self, temporada, equipos, matriz, huella):
+        # Los equipos sin ningún dato en la temporada no entran al índice
+        validos = ~np.all(np.isnan(matriz), axis=1)
+        vectores = np.nan_to_num(_estandarizar(matriz[validos]))
+        self._bloques[temporada] = (np.asarray(equipos, dtype=np.int64)[validos], vectores)
+        self.huellas[temporada] = huella
+
+    def actualizar_desde_cubo(self, cubo):
+        """
+        Sincroniza el índice con un cubo de temporadas, reconstruyendo solo las temporadas que cambiaron.
+
+        Args:
+            cubo (CuboTemporadas): Cubo con los datos de todas las temporadas
+
+        Returns:
+            bool: True si hubo cambios
+        """
+        with self._lock:
+            cambiadas = [
+                t for t in cubo.temporadas
+                if t not in self._bloques or self.huellas.get(t) != cubo.huellas.get(t)
+            ]
+            vigentes = set(cubo.temporadas)
+            eliminadas = [t for t in self._bloques if t not in vigentes]
+
+            for temporada in eliminadas:
+                del self._bloques[temporada]
+                self.huellas.pop(temporada, None)
+            for temporada in cambiadas:
+                matriz = cubo.seleccionar([temporada], metricas=self.metricas)[0]
+                self._actualizar_bloque(temporada, cubo.equipos, matriz, cubo.huellas.get(temporada))
+
+            if cambiadas or eliminadas:
+                self._compilar()
+            return bool(cambiadas or eliminadas)
+
+    def buscar(self, temporada, equipo, k=5, excluir_misma_temporada=True):
+        """
+        Busca los k equipo-temporada más parecidos a un equipo dado.
+
+        Args:
+            temporada (str): Temporada del equipo de referencia
+            equipo (int): TEAM_ID del equipo de referencia
+            k (int): Número de resultados
+            excluir_misma_temporada (bool): Si True, solo devuelve equipos de otras temporadas
+
+        Returns:
+            list: Tuplas (temporada, TEAM_ID, distancia) de más a menos parecido;
+            vacía si el equipo no está en el índice
+        """
+        with self._lock:
+            posiciones, temporadas, equipos, vectores = (
+                self._posiciones, self._temporadas, self._equipos, self._vectores
+            )
+        posicion = posiciones.get((temporada, int(equipo)))
+        if posicion is None:
+            return []
+
+        # Distancia euclídea vectorizada contra todo el índice
+        diferencias = vectores - vectores[posicion]
+        distancias = np.sqrt(np.einsum('ij,ij->i', diferencias, diferencias))
+        distancias[posicion] = np.inf
+        if excluir_misma_temporada:
+            distancias[temporadas == temporada] = np.inf
+
+        k = min(k, int(np.isfinite(distancias).sum()))
+        if k == 0:
+            return []
+        candidatos = np.argpartition(distancias, k - 1)[:k]
+        orden = candidatos[np.argsort(distancias[candidatos], kind='stable')]
+        return [
+            (temporadas[i], int(equipos[i]), float(distancias[i]))
+            for i in orden
+        ]
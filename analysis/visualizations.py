@@ -3,106 +3,213 @@ Funciones para crear visualizaciones de datos de NBA - Estilo Betting/Fintech
 """
 
 import pandas as pd
-import plotly.express as px
 import plotly.graph_objects as go
+import plotly.io as pio
+from plotly.subplots import make_subplots
 
+from config import MAX_FIGURAS_CACHE, DECIMALES_GRAFICOS
+from core.cache import CacheMemoria
+from core.metricas import formato_metrica
 
-def crear_grafico_ratings(comparacion_df, equipo_a, equipo_b):
+# Plantilla oscura compartida por todos los gráficos (estilo betting/fintech)
+PLANTILLA_NBA = 'nba_betting'
+pio.templates[PLANTILLA_NBA] = go.layout.Template(layout=dict(
+    title=dict(font=dict(size=18, color='#00d9ff', family='Arial Black'), x=0.5, xanchor='center'),
+    xaxis=dict(
+        tickfont=dict(size=13, color='#b4b4ff', family='monospace'),
+        gridcolor='rgba(180, 180, 255, 0.1)'
+    ),
+    yaxis=dict(
+        title=dict(font=dict(size=12, color='#b4b4ff')),
+        tickfont=dict(size=11, color='#b4b4ff', family='monospace'),
+        gridcolor='rgba(180, 180, 255, 0.1)',
+        zeroline=False
+    ),
+    plot_bgcolor='#0f1422',
+    paper_bgcolor='#0a0e27',
+    font=dict(color='#e0e0e0'),
+    height=450,
+    legend=dict(
+        orientation="h",
+        yanchor="bottom",
+        y=1.02,
+        xanchor="center",
+        x=0.5,
+        font=dict(size=12, color='#b4b4ff'),
+        bgcolor='rgba(0,0,0,0)',
+        bordercolor='rgba(180, 180, 255, 0.3)'
+    ),
+    margin=dict(l=20, r=20, t=80, b=50),
+    annotationdefaults=dict(font=dict(size=14, color='#00d9ff', family='Arial Black'))
+), data=dict(
+    bar=[go.Bar(
+        marker_line_color='#00d9ff',
+        marker_line_width=2,
+        textposition='outside',
+        textfont=dict(size=16, color='#00d9ff', family='monospace', weight='bold')
+    )],
+    scatter=[go.Scatter(mode='lines+markers', marker_size=8)]
+))
+
+# Figuras compartidas entre sesiones; clave (gráfico, temporada, equipo A, equipo B, huella)
+CACHE_FIGURAS = CacheMemoria(max_entradas=MAX_FIGURAS_CACHE, nombre='figuras', capa='figuras')
+
+
+def _huella_datos(comparacion_df):
+    """Resume el contenido de un DataFrame en una clave hashable."""
+    return (
+        tuple(comparacion_df.index),
+        tuple(comparacion_df.columns),
+        tuple(comparacion_df.to_numpy().ravel().tolist())
+    )
+
+
+def obtener_grafico(crear_grafico, comparacion_df, equipo_a, equipo_b, temporada=None):
     """
-    Crea un gráfico de barras mejorado comparando ratings ofensivos y defensivos.
+    Devuelve un gráfico de comparación desde una cache LRU, construyéndolo si no está.
+    
+    La clave combina el gráfico, la temporada, el par de equipos y una huella
+    de los datos, de modo que una actualización de datos nunca devuelve una
+    figura obsoleta. La figura se comparte entre sesiones: no debe modificarse.
     
     Args:
+        crear_grafico (callable): Función ``crear_grafico_*`` a usar
         comparacion_df (pd.DataFrame): DataFrame con datos de comparación
         equipo_a (str): Nombre del equipo A
         equipo_b (str): Nombre del equipo B
+        temporada (str): Temporada de los datos
         
     Returns:
         plotly.graph_objects.Figure: Gráfico de Plotly
     """
-    ratings_data = comparacion_df.loc[['Rating Ofensivo', 'Rating Defensivo']].T
-    ratings_data.index = [equipo_a, equipo_b]
-    
-    # Crear gráfico con valores exactos
-    fig = go.Figure()
+    clave = (crear_grafico.__name__, temporada, equipo_a, equipo_b, _huella_datos(comparacion_df))
+    fig, _ = CACHE_FIGURAS.obtener_o_calcular(clave, lambda: crear_grafico(comparacion_df, equipo_a, equipo_b))
+    return fig
+
+
+def invalidar_graficos(temporada):
+    """
+    Elimina de la cache las figuras de una temporada.
     
-    # Datos
-    equipos = [equipo_a, equipo_b]
-    off_ratings = [ratings_data.loc[eq, 'Rating Ofensivo'] for eq in equipos]
-    def_ratings = [ratings_data.loc[eq, 'Rating Defensivo'] for eq in equipos]
+    Args:
+        temporada (str): Temporada en formato "YYYY-YY"
+        
+    Returns:
+        int: Figuras eliminadas
+    """
+    return CACHE_FIGURAS.invalidar_si(lambda clave: clave[1] == temporada)
+
+
+def _recortar(valores):
+    """Redondea los valores numéricos de una traza para reducir el JSON enviado al navegador."""
+    return [round(float(valor), DECIMALES_GRAFICOS) for valor in valores]
+
+
+def _barras_duelo(comparacion_df, metrica, equipo_a, equipo_b, etiqueta=None, detalle=''):
+    """
+    Crea la traza de barras de una métrica para los dos equipos, resaltando el mayor valor.
     
-    # Barras de Rating Ofensivo (verde neón)
-    fig.add_trace(go.Bar(
-        name='Rating Ofensivo',
-        x=equipos,
-        y=off_ratings,
-        marker_color='#00ff88',
-        marker_line_color='#00d9ff',
-        marker_line_width=2,
-        text=[f'{val:.2f}' for val in off_ratings],
-        textposition='outside',
-        textfont=dict(size=14, color='#00ff88', family='monospace'),
-        hovertemplate='<b>%{x}</b><br>Rating Ofensivo: %{y:.2f}<extra></extra>'
-    ))
+    Args:
+        comparacion_df (pd.DataFrame): DataFrame con datos de comparación
+        metrica (str): Métrica a graficar
+        equipo_a (str): Nombre del equipo A
+        equipo_b (str): Nombre del equipo B
+        etiqueta (str): Nombre a mostrar en el tooltip (por defecto, la métrica)
+        detalle (str): Texto adicional para el tooltip
+        
+    Returns:
+        plotly.graph_objects.Bar: Traza de Plotly (el estilo común viene de la plantilla)
+    """
+    valor_a = comparacion_df.loc[metrica, equipo_a]
+    valor_b = comparacion_df.loc[metrica, equipo_b]
+    formato = formato_metrica(metrica)
     
-    # Barras de Rating Defensivo (rojo)
-    fig.add_trace(go.Bar(
-        name='Rating Defensivo',
-        x=equipos,
-        y=def_ratings,
-        marker_color='#ff4444',
-        marker_line_color='#ff8c00',
-        marker_line_width=2,
-        text=[f'{val:.2f}' for val in def_ratings],
-        textposition='outside',
-        textfont=dict(size=14, color='#ff4444', family='monospace'),
-        hovertemplate='<b>%{x}</b><br>Rating Defensivo: %{y:.2f}<extra></extra>'
-    ))
+    color_a = '#00ff88' if valor_a >= valor_b else '#b4b4ff'
+    color_b = '#00ff88' if valor_b >= valor_a else '#b4b4ff'
     
+    return go.Bar(
+        x=[equipo_a, equipo_b],
+        y=_recortar([valor_a, valor_b]),
+        marker_color=[color_a, color_b],
+        text=[f'{valor_a:{formato}}', f'{valor_b:{formato}}'],
+        showlegend=False,
+        hovertemplate=f'<b>%{{x}}</b><br>{etiqueta or metrica}: %{{y:{formato}}}{detalle}<extra></extra>'
+    )
+
+
+def _trazas_ratings(comparacion_df, equipo_a, equipo_b):
+    """Devuelve las barras agrupadas de Rating Ofensivo (verde neón) y Defensivo (rojo)."""
+    equipos = [equipo_a, equipo_b]
+    formato = formato_metrica('Rating Ofensivo')
+    trazas = []
+    for metrica, color, color_borde in [
+        ('Rating Ofensivo', '#00ff88', '#00d9ff'),
+        ('Rating Defensivo', '#ff4444', '#ff8c00')
+    ]:
+        valores = comparacion_df.loc[metrica, equipos].tolist()
+        trazas.append(go.Bar(
+            name=metrica,
+            legendgroup=metrica,
+            x=equipos,
+            y=_recortar(valores),
+            marker_color=color,
+            marker_line_color=color_borde,
+            text=[f'{val:{formato}}' for val in valores],
+            textfont=dict(size=14, color=color, weight='normal'),
+            hovertemplate=f'<b>%{{x}}</b><br>{metrica}: %{{y:{formato}}}<extra></extra>'
+        ))
+    return trazas
+
+
+def _trazas_pace(comparacion_df, equipo_a, equipo_b):
+    """Devuelve la barra de ritmo de juego (mayor pace resaltado, depende del estilo de juego)."""
+    return [_barras_duelo(comparacion_df, 'Ritmo de Juego', equipo_a, equipo_b,
+                          etiqueta='Pace', detalle=' posesiones/48min')]
+
+
+def _trazas_ast_to(comparacion_df, equipo_a, equipo_b):
+    """Devuelve la barra del ratio AST/TO (mayor es mejor)."""
+    return [_barras_duelo(comparacion_df, 'AST/TO', equipo_a, equipo_b, detalle='<br>Mayor es mejor')]
+
+
+def _trazas_3p(comparacion_df, equipo_a, equipo_b):
+    """Devuelve la barra del porcentaje de triples (mayor es mejor)."""
+    return [_barras_duelo(comparacion_df, '3P%', equipo_a, equipo_b, detalle='<br>Mayor es mejor')]
+
+
+# Gráficos del duelo: (título, título del eje Y, formato del eje Y, trazas)
+GRAFICOS_DUELO = {
+    'ratings': ('<b>⚡ Ratings Ofensivo vs Defensivo</b>', 'Puntos por 100 Posesiones', None, _trazas_ratings),
+    'pace': ('<b>🏃 Ritmo de Juego (Pace)</b>', 'Posesiones por 48 minutos', None, _trazas_pace),
+    'ast_to': ('<b>🎯 Ratio Asistencias/Pérdidas (AST/TO)</b>', 'Relación AST/TO', None, _trazas_ast_to),
+    '3p': ('<b>🏀 Porcentaje de Tiros de 3 Puntos</b>', 'Porcentaje de Efectividad', '.0%', _trazas_3p),
+}
+
+
+def _crear_grafico_duelo(clave, comparacion_df, equipo_a, equipo_b):
+    """Crea la figura individual de uno de los GRAFICOS_DUELO."""
+    titulo, eje_y, formato_eje, trazas = GRAFICOS_DUELO[clave]
+    fig = go.Figure(trazas(comparacion_df, equipo_a, equipo_b))
     fig.update_layout(
-        title=dict(
-            text='<b>⚡ Ratings Ofensivo vs Defensivo</b>',
-            font=dict(size=18, color='#00d9ff', family='Arial Black'),
-            x=0.5,
-            xanchor='center'
-        ),
-        xaxis=dict(
-            title='',
-            tickfont=dict(size=13, color='#b4b4ff', family='monospace'),
-            gridcolor='rgba(180, 180, 255, 0.1)'
-        ),
-        yaxis=dict(
-            title=dict(text='Puntos por 100 Posesiones', font=dict(size=12, color='#b4b4ff')),
-            tickfont=dict(size=11, color='#b4b4ff', family='monospace'),
-            gridcolor='rgba(180, 180, 255, 0.1)',
-            zeroline=False
-        ),
+        template=PLANTILLA_NBA,
+        title_text=titulo,
+        yaxis_title_text=eje_y,
+        yaxis_tickformat=formato_eje,
         barmode='group',
-        plot_bgcolor='#0f1422',
-        paper_bgcolor='#0a0e27',
-        font=dict(color='#e0e0e0'),
-        height=450,
-        showlegend=True,
-        legend=dict(
-            orientation="h",
-            yanchor="bottom",
-            y=1.02,
-            xanchor="center",
-            x=0.5,
-            font=dict(size=12, color='#b4b4ff'),
-            bgcolor='rgba(0,0,0,0)',
-            bordercolor='rgba(180, 180, 255, 0.3)'
-        ),
-        margin=dict(l=20, r=20, t=80, b=50)
+        showlegend=clave == 'ratings'
     )
-    
     return fig
 
 
-def crear_grafico_pace(comparacion_df, equipo_a, equipo_b):
+def crear_panel_duelo(claves, comparacion_df, equipo_a, equipo_b):
     """
-    Crea un gráfico de barras mejorado comparando el ritmo de juego.
+    Crea una sola figura con varios gráficos del duelo lado a lado.
+    
+    Una figura por pestaña en lugar de una por gráfico supone un solo mensaje
+    y un solo render en el navegador.
     
     Args:
+        claves (list): Claves de GRAFICOS_DUELO, en orden de columna
         comparacion_df (pd.DataFrame): DataFrame con datos de comparación
         equipo_a (str): Nombre del equipo A
         equipo_b (str): Nombre del equipo B
@@ -110,62 +217,24 @@ def crear_grafico_pace(comparacion_df, equipo_a, equipo_b):
     Returns:
         plotly.graph_objects.Figure: Gráfico de Plotly
     """
-    pace_a = comparacion_df.loc['Ritmo de Juego', equipo_a]
-    pace_b = comparacion_df.loc['Ritmo de Juego', equipo_b]
-    
-    # Determinar mejor (mayor pace generalmente es mejor, pero depende del estilo de juego)
-    mejor_pace = max(pace_a, pace_b)
-    
-    fig = go.Figure()
-    
-    # Colores según qué equipo tiene mayor pace
-    color_a = '#00ff88' if pace_a >= pace_b else '#b4b4ff'
-    color_b = '#00ff88' if pace_b >= pace_a else '#b4b4ff'
-    
-    fig.add_trace(go.Bar(
-        x=[equipo_a, equipo_b],
-        y=[pace_a, pace_b],
-        marker_color=[color_a, color_b],
-        marker_line_color='#00d9ff',
-        marker_line_width=2,
-        text=[f'{pace_a:.2f}', f'{pace_b:.2f}'],
-        textposition='outside',
-        textfont=dict(size=16, color='#00d9ff', family='monospace', weight='bold'),
-        hovertemplate='<b>%{x}</b><br>Pace: %{y:.2f} posesiones/48min<extra></extra>'
-    ))
-    
-    fig.update_layout(
-        title=dict(
-            text='<b>🏃 Ritmo de Juego (Pace)</b>',
-            font=dict(size=18, color='#00d9ff', family='Arial Black'),
-            x=0.5,
-            xanchor='center'
-        ),
-        xaxis=dict(
-            title='',
-            tickfont=dict(size=13, color='#b4b4ff', family='monospace'),
-            gridcolor='rgba(180, 180, 255, 0.1)'
-        ),
-        yaxis=dict(
-            title=dict(text='Posesiones por 48 minutos', font=dict(size=12, color='#b4b4ff')),
-            tickfont=dict(size=11, color='#b4b4ff', family='monospace'),
-            gridcolor='rgba(180, 180, 255, 0.1)',
-            zeroline=False
-        ),
-        plot_bgcolor='#0f1422',
-        paper_bgcolor='#0a0e27',
-        font=dict(color='#e0e0e0'),
-        height=450,
-        showlegend=False,
-        margin=dict(l=20, r=20, t=80, b=50)
+    fig = make_subplots(
+        rows=1, cols=len(claves),
+        subplot_titles=[GRAFICOS_DUELO[clave][0] for clave in claves],
+        horizontal_spacing=0.1
     )
+    for columna, clave in enumerate(claves, start=1):
+        _, eje_y, formato_eje, trazas = GRAFICOS_DUELO[clave]
+        for traza in trazas(comparacion_df, equipo_a, equipo_b):
+            fig.add_trace(traza, row=1, col=columna)
+        fig.update_yaxes(title_text=eje_y, tickformat=formato_eje, row=1, col=columna)
     
+    fig.update_layout(template=PLANTILLA_NBA, barmode='group', legend_y=1.12, margin_t=110)
     return fig
 
 
-def crear_grafico_ast_to(comparacion_df, equipo_a, equipo_b):
+def crear_panel_eficiencia(comparacion_df, equipo_a, equipo_b):
     """
-    Crea un gráfico de barras mejorado comparando el ratio AST/TO.
+    Crea la figura de la pestaña de eficiencia: ratings y ritmo de juego.
     
     Args:
         comparacion_df (pd.DataFrame): DataFrame con datos de comparación
@@ -175,56 +244,67 @@ def crear_grafico_ast_to(comparacion_df, equipo_a, equipo_b):
     Returns:
         plotly.graph_objects.Figure: Gráfico de Plotly
     """
-    ast_to_a = comparacion_df.loc['AST/TO', equipo_a]
-    ast_to_b = comparacion_df.loc['AST/TO', equipo_b]
-    
-    # Mayor es mejor
-    mejor_ast_to = max(ast_to_a, ast_to_b)
-    
-    fig = go.Figure()
+    return crear_panel_duelo(['ratings', 'pace'], comparacion_df, equipo_a, equipo_b)
+
+
+def crear_panel_creacion(comparacion_df, equipo_a, equipo_b):
+    """
+    Crea la figura de la pestaña de creación de juego: AST/TO y 3P%.
     
-    color_a = '#00ff88' if ast_to_a >= ast_to_b else '#b4b4ff'
-    color_b = '#00ff88' if ast_to_b >= ast_to_a else '#b4b4ff'
+    Args:
+        comparacion_df (pd.DataFrame): DataFrame con datos de comparación
+        equipo_a (str): Nombre del equipo A
+        equipo_b (str): Nombre del equipo B
+        
+    Returns:
+        plotly.graph_objects.Figure: Gráfico de Plotly
+    """
+    return crear_panel_duelo(['ast_to', '3p'], comparacion_df, equipo_a, equipo_b)
+
+
+def crear_grafico_ratings(comparacion_df, equipo_a, equipo_b):
+    """
+    Crea un gráfico de barras mejorado comparando ratings ofensivos y defensivos.
     
-    fig.add_trace(go.Bar(
-        x=[equipo_a, equipo_b],
-        y=[ast_to_a, ast_to_b],
-        marker_color=[color_a, color_b],
-        marker_line_color='#00d9ff',
-        marker_line_width=2,
-        text=[f'{ast_to_a:.2f}', f'{ast_to_b:.2f}'],
-        textposition='outside',
-        textfont=dict(size=16, color='#00d9ff', family='monospace', weight='bold'),
-        hovertemplate='<b>%{x}</b><br>AST/TO: %{y:.2f}<br>Mayor es mejor<extra></extra>'
-    ))
+    Args:
+        comparacion_df (pd.DataFrame): DataFrame con datos de comparación
+        equipo_a (str): Nombre del equipo A
+        equipo_b (str): Nombre del equipo B
+        
+    Returns:
+        plotly.graph_objects.Figure: Gráfico de Plotly
+    """
+    return _crear_grafico_duelo('ratings', comparacion_df, equipo_a, equipo_b)
+
+
+def crear_grafico_pace(comparacion_df, equipo_a, equipo_b):
+    """
+    Crea un gráfico de barras mejorado comparando el ritmo de juego.
     
-    fig.update_layout(
-        title=dict(
-            text='<b>🎯 Ratio Asistencias/Pérdidas (AST/TO)</b>',
-            font=dict(size=18, color='#00d9ff', family='Arial Black'),
-            x=0.5,
-            xanchor='center'
-        ),
-        xaxis=dict(
-            title='',
-            tickfont=dict(size=13, color='#b4b4ff', family='monospace'),
-            gridcolor='rgba(180, 180, 255, 0.1)'
-        ),
-        yaxis=dict(
-            title=dict(text='Relación AST/TO', font=dict(size=12, color='#b4b4ff')),
-            tickfont=dict(size=11, color='#b4b4ff', family='monospace'),
-            gridcolor='rgba(180, 180, 255, 0.1)',
-            zeroline=False
-        ),
-        plot_bgcolor='#0f1422',
-        paper_bgcolor='#0a0e27',
-        font=dict(color='#e0e0e0'),
-        height=450,
-        showlegend=False,
-        margin=dict(l=20, r=20, t=80, b=50)
-    )
+    Args:
+        comparacion_df (pd.DataFrame): DataFrame con datos de comparación
+        equipo_a (str): Nombre del equipo A
+        equipo_b (str): Nombre del equipo B
+        
+    Returns:
+        plotly.graph_objects.Figure: Gráfico de Plotly
+    """
+    return _crear_grafico_duelo('pace', comparacion_df, equipo_a, equipo_b)
+
+
+def crear_grafico_ast_to(comparacion_df, equipo_a, equipo_b):
+    """
+    Crea un gráfico de barras mejorado comparando el ratio AST/TO.
     
-    return fig
+    Args:
+        comparacion_df (pd.DataFrame): DataFrame con datos de comparación
+        equipo_a (str): Nombre del equipo A
+        equipo_b (str): Nombre del equipo B
+        
+    Returns:
+        plotly.graph_objects.Figure: Gráfico de Plotly
+    """
+    return _crear_grafico_duelo('ast_to', comparacion_df, equipo_a, equipo_b)
 
 
 def crear_grafico_3p(comparacion_df, equipo_a, equipo_b):
@@ -239,54 +319,65 @@ def crear_grafico_3p(comparacion_df, equipo_a, equipo_b):
     Returns:
         plotly.graph_objects.Figure: Gráfico de Plotly
     """
-    p3_a = comparacion_df.loc['3P%', equipo_a]
-    p3_b = comparacion_df.loc['3P%', equipo_b]
+    return _crear_grafico_duelo('3p', comparacion_df, equipo_a, equipo_b)
+
+
+def crear_grafico_tendencias(tendencias, equipos):
+    """
+    Crea un panel 2x2 con la evolución de métricas clave a lo largo de varias temporadas.
     
-    # Mayor es mejor
-    mejor_p3 = max(p3_a, p3_b)
+    Args:
+        tendencias (dict): Mapa {métrica: DataFrame con índice=temporadas y columnas=equipos}
+        equipos (list): Nombres de los equipos a graficar (columnas de cada DataFrame)
+        
+    Returns:
+        plotly.graph_objects.Figure: Gráfico de Plotly
+    """
+    colores = ['#00ff88', '#ff4444', '#00d9ff', '#ff8c00', '#b4b4ff']
+    paneles = [
+        ('⚡ Ratings (OFF — / DEF ···)', ['Rating Ofensivo', 'Rating Defensivo']),
+        ('🏃 Pace', ['Ritmo de Juego']),
+        ('🎯 AST/TO', ['AST/TO']),
+        ('🏀 3P%', ['3P%'])
+    ]
     
-    fig = go.Figure()
+    fig = make_subplots(
+        rows=2, cols=2,
+        subplot_titles=[titulo for titulo, _ in paneles],
+        vertical_spacing=0.15,
+        horizontal_spacing=0.08
+    )
     
-    color_a = '#00ff88' if p3_a >= p3_b else '#b4b4ff'
-    color_b = '#00ff88' if p3_b >= p3_a else '#b4b4ff'
+    for posicion, (titulo, metricas) in enumerate(paneles):
+        fila, columna = divmod(posicion, 2)
+        for i_metrica, metrica in enumerate(metricas):
+            if metrica not in tendencias:
+                continue
+            df_metrica = tendencias[metrica]
+            formato = formato_metrica(metrica, compacto=True)
+            for i_equipo, equipo in enumerate(equipos):
+                if equipo not in df_metrica.columns:
+                    continue
+                fig.add_trace(go.Scatter(
+                    name=equipo,
+                    legendgroup=equipo,
+                    showlegend=posicion == 0 and i_metrica == 0,
+                    x=df_metrica.index.tolist(),
+                    y=df_metrica[equipo].round(DECIMALES_GRAFICOS).tolist(),
+                    line=dict(color=colores[i_equipo % len(colores)], width=3, dash='dot' if i_metrica else 'solid'),
+                    hovertemplate=f'<b>{equipo}</b><br>%{{x}}<br>{metrica}: %{{y:{formato}}}<extra></extra>'
+                ), row=fila + 1, col=columna + 1)
     
-    fig.add_trace(go.Bar(
-        x=[equipo_a, equipo_b],
-        y=[p3_a, p3_b],
-        marker_color=[color_a, color_b],
-        marker_line_color='#00d9ff',
-        marker_line_width=2,
-        text=[f'{p3_a:.1%}', f'{p3_b:.1%}'],
-        textposition='outside',
-        textfont=dict(size=16, color='#00d9ff', family='monospace', weight='bold'),
-        hovertemplate='<b>%{x}</b><br>3P%: %{y:.1%}<br>Mayor es mejor<extra></extra>'
-    ))
+    fig.update_xaxes(tickfont_size=11)
+    fig.update_yaxes(tickformat='.0%', row=2, col=2)
     
     fig.update_layout(
-        title=dict(
-            text='<b>🏀 Porcentaje de Tiros de 3 Puntos</b>',
-            font=dict(size=18, color='#00d9ff', family='Arial Black'),
-            x=0.5,
-            xanchor='center'
-        ),
-        xaxis=dict(
-            title='',
-            tickfont=dict(size=13, color='#b4b4ff', family='monospace'),
-            gridcolor='rgba(180, 180, 255, 0.1)'
-        ),
-        yaxis=dict(
-            title=dict(text='Porcentaje de Efectividad', font=dict(size=12, color='#b4b4ff')),
-            tickfont=dict(size=11, color='#b4b4ff', family='monospace'),
-            tickformat='.0%',
-            gridcolor='rgba(180, 180, 255, 0.1)',
-            zeroline=False
-        ),
-        plot_bgcolor='#0f1422',
-        paper_bgcolor='#0a0e27',
-        font=dict(color='#e0e0e0'),
-        height=450,
-        showlegend=False,
-        margin=dict(l=20, r=20, t=80, b=50)
+        template=PLANTILLA_NBA,
+        title_text='<b>📈 Tendencia por Temporada</b>',
+        height=700,
+        showlegend=True,
+        legend_y=1.06,
+        margin_t=120
     )
     
     return fig
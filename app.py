@@ -2,30 +2,61 @@
 Aplicación principal de Streamlit para Análisis de Datos NBA
 """
 
+import contextvars
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturoPendiente
+
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
 from config import (
     APP_TITLE,
     APP_PAGE_TITLE,
     DEFAULT_TEAM_A,
     DEFAULT_TEAM_B,
-    NUM_TEMPORADAS_RECIENTES
-)
-from utils import (
-    obtener_temporada_actual,
-    validar_temporada_disponible,
-    generar_lista_temporadas,
-    obtener_datos_nba
+    NUM_TEMPORADAS_RECIENTES,
+    NUM_TEMPORADAS_TENDENCIA,
+    MAX_TEMPORADAS_TENDENCIA,
+    NUM_EQUIPOS_SIMILARES,
+    PRECOMPUTAR_COMPARACIONES,
+    PESTANAS_DIFERIDAS,
+    GRAFICOS_COMBINADOS,
+    CARGA_PROGRESIVA,
+    INTERVALO_ESQUELETO,
+    MAX_WORKERS_CARGA
 )
-from utils.data_processing import procesar_datos_nba, preparar_comparacion
-from analysis.predictions import predecir_probabilidad, calcular_net_rating
-from analysis.visualizations import (
-    crear_grafico_ratings,
-    crear_grafico_pace,
-    crear_grafico_ast_to,
-    crear_grafico_3p
+from core import pipeline
+from core.cache import listar_caches
+from core.comparaciones import comparar_equipos, ComparacionesMaterializadas
+from core.predicciones import predecir_probabilidad
+from core.procesamiento import preparar_comparacion, preparar_comparacion_multiple
+from core.telemetria import medir_rerun, tramo
+from core.temporadas import obtener_temporada_actual, generar_lista_temporadas, temporada_anterior
+from utils import validar_temporada_disponible, obtener_datos_nba, invalidar_validacion, invalidar_datos_nba
+from utils.season_loader import cargar_temporadas
+from analysis.rankings import calcular_rankings, calcular_indices_orden
+from analysis.season_cube import CuboCompartido
+from analysis.similitud import IndiceSimilitud
+from ui import (
+    render_comparison_table,
+    render_simple_header,
+    render_bento_grid,
+    render_leaderboard,
+    render_similar_teams,
+    render_multi_comparison_table,
+    render_page_header,
+    render_sidebar_config,
+    render_sidebar_fuente,
+    render_vs_divider,
+    render_skeleton,
+    render_panel_tiempos,
+    render_panel_caches,
+    apply_custom_styles
 )
-from ui import render_comparison_table, render_simple_header, render_bento_grid, apply_custom_styles
+
+# Inicio de la ejecución del script (para medir el primer pintado)
+INICIO_SCRIPT = time.perf_counter()
 
 # Configuración de la página
 st.set_page_config(
@@ -38,73 +69,317 @@ st.set_page_config(
 # Aplicar estilos personalizados
 apply_custom_styles()
 
+# Vistas disponibles en el sidebar
+VISTA_DUELO = "⚔️ Duelo"
+VISTA_CLASIFICACION = "🏆 Clasificación"
+VISTA_MULTI = "👥 Multi-equipo"
+
+# Gráficos de cada pestaña del duelo (una figura combinada o una por columna).
+# Se guardan por nombre: analysis.visualizations (Plotly) se importa al abrir la primera pestaña
+if GRAFICOS_COMBINADOS:
+    GRAFICOS_PESTANA = {
+        'eficiencia': ('crear_panel_eficiencia',),
+        'creacion': ('crear_panel_creacion',),
+    }
+else:
+    GRAFICOS_PESTANA = {
+        'eficiencia': ('crear_grafico_ratings', 'crear_grafico_pace'),
+        'creacion': ('crear_grafico_ast_to', 'crear_grafico_3p'),
+    }
+
+
+
+
+
+
+
+
+@st.cache_resource(show_spinner=False)
+def obtener_ejecutor_carga():
+    """Devuelve el pool de hilos compartido para las cargas en segundo plano."""
+    return ThreadPoolExecutor(max_workers=MAX_WORKERS_CARGA, thread_name_prefix='carga')
+
+
+def _ejecutar_con_contexto(contexto, funcion, *args):
+    """Ejecuta una función en un hilo de trabajo con el contexto de la sesión de Streamlit."""
+    add_script_run_ctx(threading.current_thread(), contexto)
+    try:
+        return funcion(*args)
+    finally:
+        add_script_run_ctx(threading.current_thread(), None)
+
+
+def esperar_carga(funcion, *args, esqueleto=None, mensaje=""):
+    """
+    Ejecuta una función bloqueante (red o cache) sin congelar la página.
+    
+    Con CARGA_PROGRESIVA la función corre en un hilo de trabajo y el hilo del
+    script actualiza el esqueleto con el tiempo transcurrido; sin ella se
+    llama directamente. El hilo hereda el contexto del script, así que sus
+    tramos de tiempo cuentan en el rerun en curso.
+    
+    Args:
+        funcion (callable): Función a ejecutar (p. ej. ``obtener_datos_nba``)
+        *args: Argumentos de la función
+        esqueleto: Placeholder con el esqueleto de carga
+        mensaje (str): Mensaje de estado mientras se espera
+        
+    Returns:
+        El resultado de ``funcion(*args)``
+    """
+    if not CARGA_PROGRESIVA or esqueleto is None:
+        return funcion(*args)
+    
+    futuro = obtener_ejecutor_carga().submit(
+        contextvars.copy_context().run, _ejecutar_con_contexto, get_script_run_ctx(), funcion, *args
+    )
+    inicio = time.perf_counter()
+    while True:
+        try:
+            return futuro.result(timeout=INTERVALO_ESQUELETO)
+        except FuturoPendiente:
+            render_skeleton(esqueleto, f"{mensaje} {time.perf_counter() - inicio:.1f} s")
+
+
+@st.cache_resource(show_spinner=False)
+def obtener_cubo_temporadas():
+    """Cubo de temporadas compartido entre sesiones; se resincroniza solo cuando cambian los snapshots."""
+    return CuboCompartido()
+
+
+@st.cache_resource(show_spinner=False)
+def obtener_indice_similitud():
+    """Índice de similitud compartido entre sesiones; se actualiza por temporada desde el cubo."""
+    return IndiceSimilitud()
+
 
+@st.cache_data(show_spinner=False)
+def procesar_temporada(df_nba_raw):
+    """Procesa los datos crudos y evalúa las métricas derivadas una vez por snapshot de temporada."""
+    return pipeline.procesar_temporada(df_nba_raw)
 
 
+@st.cache_data(show_spinner=False)
+def obtener_rankings_liga(df_nba):
+    """Rankings y percentiles de liga, calculados una vez por snapshot de temporada."""
+    return calcular_rankings(df_nba)
 
 
+@st.cache_resource(show_spinner=False, max_entries=NUM_TEMPORADAS_RECIENTES)
+def obtener_comparaciones(df_nba):
+    """Comparaciones de todos los pares de equipos, materializadas una vez por snapshot de temporada."""
+    return ComparacionesMaterializadas.construir(df_nba)
+
+
+@st.cache_data(show_spinner=False)
+def obtener_indices_orden(df_nba):
+    """Permutaciones de orden por métrica, calculadas una vez por snapshot de temporada."""
+    return calcular_indices_orden(df_nba)
+
+
+def render_graficos_pestana(pestana, comparacion_df, equipo_a, equipo_b, temporada):
+    """
+    Renderiza en columnas las figuras de una pestaña del duelo.
+    
+    Las figuras salen de la cache LRU de visualizaciones, por temporada y par
+    de equipos, así que volver a una pestaña o a un duelo ya visto no las reconstruye.
+    
+    Args:
+        pestana (str): Clave de GRAFICOS_PESTANA
+        comparacion_df (pd.DataFrame): DataFrame con datos de comparación
+        equipo_a (str): Nombre del equipo A
+        equipo_b (str): Nombre del equipo B
+        temporada (str): Temporada seleccionada
+    """
+    from analysis import visualizations
+    
+    with tramo('graficos'):
+        figuras = [
+            visualizations.obtener_grafico(
+                getattr(visualizations, nombre), comparacion_df, equipo_a, equipo_b, temporada
+            )
+            for nombre in GRAFICOS_PESTANA[pestana]
+        ]
+        for columna, figura in zip(st.columns(len(figuras)), figuras):
+            with columna:
+                st.plotly_chart(figura, width='stretch')
 
 
-def render_comparison_tabs(comparacion_df, equipo_a, equipo_b):
+@st.fragment
+def render_trend_tab(ids_equipos, equipo_a, equipo_b, temporada):
+    """
+    Renderiza la evolución de ambos equipos en las últimas temporadas.
+    
+    Las temporadas sin snapshot local se descargan en paralelo; las demás se
+    leen del cubo de temporadas, por lo que con datos en cache la pestaña es inmediata.
+    Es un fragmento: mover el selector de temporadas solo re-ejecuta esta pestaña.
+    
+    Args:
+        ids_equipos (dict): Mapa {nombre de equipo: TEAM_ID}
+        equipo_a (str): Nombre del equipo A
+        equipo_b (str): Nombre del equipo B
+        temporada (str): Temporada más reciente a mostrar
+    """
+    st.markdown("### Tendencia Multi-Temporada")
+    
+    num_temporadas = st.slider(
+        "Temporadas a mostrar",
+        min_value=2,
+        max_value=MAX_TEMPORADAS_TENDENCIA,
+        value=NUM_TEMPORADAS_TENDENCIA,
+        help="Número de temporadas hacia atrás desde la seleccionada"
+    )
+    temporadas = generar_lista_temporadas(temporada, num_temporadas)[::-1]
+    
+    with st.spinner("Cargando temporadas..."):
+        disponibles = cargar_temporadas(temporadas)
+    cubo = obtener_cubo_temporadas().actual()
+    
+    faltantes = [t for t, ok in disponibles.items() if not ok]
+    if faltantes:
+        st.warning(f"⚠️ No se pudieron obtener las temporadas: {', '.join(faltantes)}")
+    
+    equipos = [equipo for equipo in dict.fromkeys([equipo_a, equipo_b]) if equipo in ids_equipos]
+    tendencias = cubo.tendencias(
+        [ids_equipos[equipo] for equipo in equipos],
+        ['Rating Ofensivo', 'Rating Defensivo', 'Ritmo de Juego', 'AST/TO', '3P%'],
+        temporadas=temporadas,
+        etiquetas=equipos
+    )
+    
+    from analysis.visualizations import crear_grafico_tendencias
+    
+    with tramo('graficos'):
+        fig_tendencias = crear_grafico_tendencias(tendencias, equipos)
+        st.plotly_chart(fig_tendencias, width='stretch')
+
+
+def render_similar_tab(ids_equipos, equipo_a, equipo_b, temporada):
+    """
+    Renderiza los equipos históricos más parecidos a cada equipo seleccionado.
+    
+    Args:
+        ids_equipos (dict): Mapa {nombre de equipo: TEAM_ID}
+        equipo_a (str): Nombre del equipo A
+        equipo_b (str): Nombre del equipo B
+        temporada (str): Temporada de los equipos de referencia
+    """
+    st.markdown("### Equipos Similares")
+    
+    cubo = obtener_cubo_temporadas().actual()
+    indice = obtener_indice_similitud()
+    indice.actualizar_desde_cubo(cubo)
+    st.caption(f"{len(indice)} equipo-temporadas de {len(cubo.temporadas)} temporadas almacenadas")
+    
+    col1, col2 = st.columns(2)
+    for columna, equipo in zip([col1, col2], [equipo_a, equipo_b]):
+        with columna:
+            similares = indice.buscar(temporada, ids_equipos.get(equipo, -1), k=NUM_EQUIPOS_SIMILARES)
+            render_similar_teams(equipo, similares, cubo.nombres)
+    
+    with st.expander("ℹ️ Cómo se calcula la similitud"):
+        st.markdown("""
+        - Cada equipo-temporada se describe con **Pace, Rating Ofensivo, Rating Defensivo, AST/TO y 3P%**
+        - Las métricas se estandarizan dentro de su temporada (z-score), para comparar perfiles entre épocas distintas
+        - La distancia es euclídea entre perfiles: cuanto menor, más se parecen
+        """)
+
+
+@st.fragment
+def render_multi_comparison(df_nba, temporada):
+    """
+    Renderiza la comparación de un grupo arbitrario de equipos (por ejemplo, una división).
+    Es un fragmento: cambiar la selección de equipos solo re-ejecuta esta sección.
+    
+    Args:
+        df_nba (pd.DataFrame): DataFrame procesado de la temporada
+        temporada (str): Temporada seleccionada
+    """
+    render_page_header("👥 MULTI-EQUIPO", temporada)
+    
+    equipos_disponibles = sorted(df_nba['Equipo'].unique().tolist())
+    por_defecto = [e for e in (DEFAULT_TEAM_A, DEFAULT_TEAM_B) if e in equipos_disponibles]
+    
+    equipos = st.multiselect(
+        "EQUIPOS",
+        equipos_disponibles,
+        default=por_defecto or equipos_disponibles[:2],
+        help="Selecciona dos o más equipos a comparar"
+    )
+    
+    if len(equipos) < 2:
+        st.info("ℹ️ Selecciona al menos dos equipos para comparar.")
+        return
+    
+    comparacion_df = preparar_comparacion_multiple(df_nba, equipos)
+    render_multi_comparison_table(comparacion_df, comparar_equipos(comparacion_df))
+
+
+def render_comparison_tabs(comparacion_df, equipo_a, equipo_b, ids_equipos, temporada, rangos=None):
     """
     Renderiza las pestañas de comparación con diseño mejorado.
     
+    Con PESTANAS_DIFERIDAS solo se construye y envía la pestaña abierta; las
+    figuras se cachean por temporada y par de equipos.
+    
     Args:
         comparacion_df (pd.DataFrame): DataFrame con datos de comparación
         equipo_a (str): Nombre del equipo A
         equipo_b (str): Nombre del equipo B
+        ids_equipos (dict): Mapa {nombre de equipo: TEAM_ID} de la temporada
+        temporada (str): Temporada seleccionada
+        rangos (pd.DataFrame): Rankings de liga precalculados
     """
-    tab1, tab2, tab3 = st.tabs([
+    # En modo diferido, cambiar de pestaña re-ejecuta el duelo y solo se
+    # construye la pestaña abierta (.open es None si no se sigue su estado)
+    tab1, tab2, tab3, tab4, tab5 = st.tabs([
         "📊 COMPARATIVA",
         "⚡ EFICIENCIA",
-        "🎯 CREACIÓN"
-    ])
+        "🎯 CREACIÓN",
+        "📈 TENDENCIA",
+        "🧬 SIMILARES"
+    ], key="pestana_duelo", on_change="rerun" if PESTANAS_DIFERIDAS else "ignore")
     
     # Pestaña 1: Tabla Completa
-    with tab1:
-        st.markdown(f"### Comparación Detallada")
-        render_comparison_table(comparacion_df, equipo_a, equipo_b)
+    if tab1.open is not False:
+        with tab1:
+            st.markdown(f"### Comparación Detallada")
+            render_comparison_table(comparacion_df, equipo_a, equipo_b, rangos)
     
     # Pestaña 2: Patrones de Juego
-    with tab2:
-        st.markdown("### Eficiencia y Ritmo")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            fig_ratings = crear_grafico_ratings(comparacion_df, equipo_a, equipo_b)
-            st.plotly_chart(fig_ratings, use_container_width=True)
-        
-        with col2:
-            fig_pace = crear_grafico_pace(comparacion_df, equipo_a, equipo_b)
-            st.plotly_chart(fig_pace, use_container_width=True)
-        
-        with st.expander("ℹ️ Explicación de Métricas"):
-            st.markdown("""
-            - **Rating Ofensivo**: Puntos anotados por 100 posesiones (mayor es mejor)
-            - **Rating Defensivo**: Puntos permitidos por 100 posesiones (menor es mejor)
-            - **Pace**: Ritmo de juego medido en posesiones por 48 minutos
-            """)
+    if tab2.open is not False:
+        with tab2:
+            st.markdown("### Eficiencia y Ritmo")
+            render_graficos_pestana('eficiencia', comparacion_df, equipo_a, equipo_b, temporada)
+            
+            with st.expander("ℹ️ Explicación de Métricas"):
+                st.markdown("""
+                - **Rating Ofensivo**: Puntos anotados por 100 posesiones (mayor es mejor)
+                - **Rating Defensivo**: Puntos permitidos por 100 posesiones (menor es mejor)
+                - **Pace**: Ritmo de juego medido en posesiones por 48 minutos
+                """)
     
     # Pestaña 3: Creación de Juego
-    with tab3:
-        st.markdown("### Creación de Juego")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            fig_ast_to = crear_grafico_ast_to(comparacion_df, equipo_a, equipo_b)
-            st.plotly_chart(fig_ast_to, use_container_width=True)
-        
-        with col2:
-            fig_p3 = crear_grafico_3p(comparacion_df, equipo_a, equipo_b)
-            st.plotly_chart(fig_p3, use_container_width=True)
-        
-        with st.expander("ℹ️ Explicación de Métricas"):
-            st.markdown("""
-            - **AST/TO**: Relación entre asistencias y pérdidas. Valores más altos indican mejor manejo del balón
-            - **3P%**: Porcentaje de efectividad en tiros de 3 puntos. Crítico en el baloncesto moderno
-            """)
+    if tab3.open is not False:
+        with tab3:
+            st.markdown("### Creación de Juego")
+            render_graficos_pestana('creacion', comparacion_df, equipo_a, equipo_b, temporada)
+            
+            with st.expander("ℹ️ Explicación de Métricas"):
+                st.markdown("""
+                - **AST/TO**: Relación entre asistencias y pérdidas. Valores más altos indican mejor manejo del balón
+                - **3P%**: Porcentaje de efectividad en tiros de 3 puntos. Crítico en el baloncesto moderno
+                """)
+    
+    # Pestaña 4: Tendencia entre temporadas
+    if tab4.open is not False:
+        with tab4:
+            render_trend_tab(ids_equipos, equipo_a, equipo_b, temporada)
+    
+    # Pestaña 5: Equipos similares de otras temporadas
+    if tab5.open is not False:
+        with tab5:
+            render_similar_tab(ids_equipos, equipo_a, equipo_b, temporada)
 
 
 def render_prediction_section(datos_a, datos_b, equipo_a, equipo_b):
@@ -120,9 +395,9 @@ def render_prediction_section(datos_a, datos_b, equipo_a, equipo_b):
     st.markdown("---")
     st.markdown("## 🔮 Predicción de Resultado")
     
-    # Calcular ratings netos
-    net_rating_a = calcular_net_rating(datos_a['Rating Ofensivo'], datos_a['Rating Defensivo'])
-    net_rating_b = calcular_net_rating(datos_b['Rating Ofensivo'], datos_b['Rating Defensivo'])
+    # Ratings netos (métrica derivada calculada en procesar_datos_nba)
+    net_rating_a = datos_a['Rating Neto']
+    net_rating_b = datos_b['Rating Neto']
     
     # Calcular probabilidades
     prob_a_decimal = predecir_probabilidad(net_rating_a, net_rating_b)
@@ -205,134 +480,237 @@ def render_prediction_section(datos_a, datos_b, equipo_a, equipo_b):
         """)
 
 
+def render_team_selector(equipos_disponibles):
+    """
+    Renderiza la selección de equipos estilo betting.
+    
+    Args:
+        equipos_disponibles (list): Nombres de los equipos de la temporada
+        
+    Returns:
+        tuple: (equipo_a, equipo_b)
+    """
+    st.markdown("### 🏀 EQUIPOS")
+    col_a, col_vs, col_b = st.columns([5, 1, 5])
+    
+    with col_a:
+        equipo_a = st.selectbox(
+            "EQUIPO A",
+            equipos_disponibles,
+            index=equipos_disponibles.index(DEFAULT_TEAM_A) if DEFAULT_TEAM_A in equipos_disponibles else 0,
+            key="equipo_a",
+            help="Primer equipo"
+        )
+    
+    with col_vs:
+        render_vs_divider()
+    
+    with col_b:
+        default_index_b = equipos_disponibles.index(DEFAULT_TEAM_B) if DEFAULT_TEAM_B in equipos_disponibles else 1
+        equipo_b = st.selectbox(
+            "EQUIPO B",
+            equipos_disponibles,
+            index=default_index_b,
+            key="equipo_b",
+            help="Segundo equipo"
+        )
+    
+    return equipo_a, equipo_b
+
+
+def render_model_info(equipo_a, equipo_b, net_rating_a, net_rating_b):
+    """
+    Renderiza el expander con la explicación del modelo de predicción.
+    
+    Args:
+        equipo_a (str): Nombre del equipo A
+        equipo_b (str): Nombre del equipo B
+        net_rating_a (float): Rating neto del equipo A
+        net_rating_b (float): Rating neto del equipo B
+    """
+    st.markdown("---")
+    with st.expander("ℹ️ Información del Modelo de Predicción", expanded=False):
+        st.markdown(f"""
+        **Metodología:**
+        - Modelo basado en **Rating Neto** (Rating Ofensivo - Rating Defensivo)
+        - Función logística que considera la diferencia entre ratings
+        - **{equipo_a}**: Rating Neto {net_rating_a:+.2f}
+        - **{equipo_b}**: Rating Neto {net_rating_b:+.2f}
+        
+        **Limitaciones:**
+        - No considera factores como lesiones, descanso, casa/visitante
+        - Los resultados reales pueden variar significativamente
+        - Úsalo como referencia estadística
+        """)
+
+
+@st.fragment
+def render_duel(df_nba, ids_equipos, temporada, rangos):
+    """
+    Renderiza el duelo entre dos equipos: selección, header, Bento Grid, pestañas y modelo.
+    
+    Es un fragmento: al cambiar de equipo solo se re-ejecuta esta función, sin
+    repetir la validación de temporada, el sidebar ni la obtención de datos.
+    
+    Args:
+        df_nba (pd.DataFrame): DataFrame procesado de la temporada
+        ids_equipos (dict): Mapa {nombre de equipo: TEAM_ID}
+        temporada (str): Temporada seleccionada
+        rangos (pd.DataFrame): Rankings de liga precalculados
+    """
+    # Al cambiar de equipo el fragmento es el rerun completo; dentro del script no abre otro
+    with medir_rerun('fragmento') as rerun:
+        equipos_disponibles = sorted(df_nba['Equipo'].unique().tolist())
+        equipo_a, equipo_b = render_team_selector(equipos_disponibles)
+    
+        # Filtrar datos de los equipos seleccionados
+        datos_a = df_nba[df_nba['Equipo'] == equipo_a].iloc[0]
+        datos_b = df_nba[df_nba['Equipo'] == equipo_b].iloc[0]
+    
+        # Renderizar header
+        render_simple_header(equipo_a, equipo_b, temporada)
+    
+        # En modo precálculo, el duelo es una consulta al almacén de todos los pares
+        comparaciones = obtener_comparaciones(df_nba) if PRECOMPUTAR_COMPARACIONES else None
+    
+        # Ratings netos (métrica derivada) y probabilidades para el Bento Grid
+        net_rating_a = datos_a['Rating Neto']
+        net_rating_b = datos_b['Rating Neto']
+        if comparaciones is not None:
+            prob_a = comparaciones.probabilidad(equipo_a, equipo_b)
+        else:
+            prob_a = predecir_probabilidad(net_rating_a, net_rating_b)
+        prob_b = 1 - prob_a
+    
+        # Renderizar Bento Grid con información clave
+        render_bento_grid(datos_a, datos_b, equipo_a, equipo_b, net_rating_a, net_rating_b, prob_a, prob_b, rangos)
+    
+        # Preparar comparación
+        if comparaciones is not None:
+            comparacion_df = comparaciones.comparacion(equipo_a, equipo_b)
+        else:
+            comparacion_df = preparar_comparacion(datos_a, datos_b, equipo_a, equipo_b)
+    
+        # Renderizar tabs de comparación
+        render_comparison_tabs(comparacion_df, equipo_a, equipo_b, ids_equipos, temporada, rangos)
+    
+        # Renderizar información del modelo (la predicción ya está en el Bento Grid)
+        render_model_info(equipo_a, equipo_b, net_rating_a, net_rating_b)
+        
+        # Un fragmento no puede escribir en el sidebar: sus tiempos van al pie del duelo
+        render_panel_tiempos(rerun, contenedor=st.container())
+
+
+def actualizar_temporada(temporada, temporada_actual):
+    """
+    Invalida solo las caches que dependen de la temporada seleccionada.
+
+    Se descartan sus datos crudos y sus figuras, y la validación de la
+    temporada actual (por si ya está disponible en la API). Las demás
+    temporadas siguen en cache; el procesamiento y las comparaciones se
+    cachean por contenido, así que los datos nuevos generan entradas nuevas.
+
+    Args:
+        temporada (str): Temporada seleccionada
+        temporada_actual (str): Temporada en curso según el calendario
+    """
+    from analysis.visualizations import invalidar_graficos
+
+    invalidar_datos_nba(temporada)
+    invalidar_graficos(temporada)
+    invalidar_validacion(temporada_actual)
+
+
 def main():
     """Función principal de la aplicación."""
-    # El header se renderizará después de seleccionar los equipos
+    # Primer pintado: sidebar y esqueleto se envían antes de cualquier acceso a red;
+    # el badge y el selector de temporada se rellenan cuando se valida la temporada
+    cabecera_sidebar = st.sidebar.empty()
+    selector_temporada = st.sidebar.empty()
+    
+    vista = st.sidebar.radio(
+        "📄 VISTA",
+        [VISTA_DUELO, VISTA_CLASIFICACION, VISTA_MULTI],
+        help="Duelo entre dos equipos, clasificación de toda la liga o comparación de varios equipos"
+    )
+    
+    st.sidebar.markdown("---")
+    
+    # Información de datos estilo compacto
+    render_sidebar_fuente()
+    
+    # Botón para forzar actualización estilo neon
+    st.sidebar.markdown("---")
+    # Se resuelve tras elegir temporada: solo se invalida lo que depende de ella
+    actualizar = st.sidebar.button("🔄 ACTUALIZAR", width='stretch')
+    tiempos_carga = st.sidebar.empty()
+    
+    esqueleto = st.empty()
+    if CARGA_PROGRESIVA:
+        render_skeleton(esqueleto, "Comprobando temporada...")
+    tiempo_primer_pintado = time.perf_counter() - INICIO_SCRIPT
     
-    # Obtener temporada seleccionada (temporal, antes de obtener datos)
+    # Temporada inicial: la actual si ya está disponible en la API, si no la anterior
     temporada_actual = obtener_temporada_actual()
     temporada_inicial = temporada_actual
-    if not validar_temporada_disponible(temporada_actual):
-        año_inicio = int(temporada_actual.split('-')[0])
-        año_anterior = año_inicio - 1
-        temporada_inicial = f"{año_anterior}-{str(año_inicio)[-2:]}"
+    if not esperar_carga(validar_temporada_disponible, temporada_actual,
+                         esqueleto=esqueleto, mensaje="Comprobando temporada..."):
+        temporada_inicial = temporada_anterior(temporada_actual)
     
-    # Renderizar sidebar (sin datos aún para obtener selección de temporada)
-    # Primero necesitamos obtener una temporada inicial para el sidebar
     temporadas_disponibles = generar_lista_temporadas(temporada_inicial, NUM_TEMPORADAS_RECIENTES)
     try:
         indice_default = temporadas_disponibles.index(temporada_inicial)
     except ValueError:
         indice_default = 0
     
-    # Sidebar estilo betting
-    st.sidebar.markdown("### ⚙️ CONFIG")
-    
-    # Badge de temporada estilo neon
-    st.sidebar.markdown(f"""
-    <div style='text-align: center; padding: 0.75rem; background: #0f1422; border: 1px solid #00ff88; 
-    border-radius: 8px; color: #00ff88; margin-bottom: 1rem;'>
-        <div style='font-size: 0.7rem; color: #b4b4ff; text-transform: uppercase; letter-spacing: 1px; margin-bottom: 0.25rem;'>Temporada</div>
-        <div style='font-size: 1.25rem; font-weight: 700; font-family: monospace;'>{temporada_inicial}</div>
-    </div>
-    """, unsafe_allow_html=True)
+    # Sidebar estilo betting con badge de temporada estilo neon
+    render_sidebar_config(temporada_inicial, cabecera_sidebar)
     
-    temporada_seleccionada = st.sidebar.selectbox(
+    temporada_seleccionada = selector_temporada.selectbox(
         "📅 TEMPORADA",
         temporadas_disponibles,
         index=indice_default,
         help="Selecciona la temporada a analizar"
     )
     
-    st.sidebar.markdown("---")
-    
-    # Información de datos estilo compacto
-    st.sidebar.markdown("""
-    <div style='background: #0f1422; padding: 0.75rem; border-radius: 8px; border: 1px solid #1a2332;'>
-        <div style='font-weight: 600; margin-bottom: 0.25rem; color: #00d9ff; font-size: 0.75rem; text-transform: uppercase; letter-spacing: 0.5px;'>Fuente</div>
-        <div style='font-size: 0.7rem; color: #b4b4ff;'>
-            API Oficial NBA<br/>stats.nba.com
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Botón para forzar actualización estilo neon
-    st.sidebar.markdown("---")
-    if st.sidebar.button("🔄 ACTUALIZAR", use_container_width=True):
-        obtener_datos_nba.clear()
-        validar_temporada_disponible.clear()
+    if actualizar:
+        actualizar_temporada(temporada_seleccionada, temporada_actual)
         st.rerun()
     
     # Obtener datos con la temporada seleccionada
-    df_nba_raw = obtener_datos_nba(temporada=temporada_seleccionada)
-    
-    if df_nba_raw.empty:
-        st.error("❌ No se pudieron obtener los datos. Por favor, verifica tu conexión e intenta nuevamente.")
-        st.stop()
-    
-    # Procesar datos
-    df_nba = procesar_datos_nba(df_nba_raw)
-    
-    # Selección de equipos estilo betting
-    st.sidebar.markdown("### 🏀 EQUIPOS")
-    equipos_disponibles = sorted(df_nba['Equipo'].unique().tolist())
-    
-    equipo_a = st.sidebar.selectbox(
-        "EQUIPO A",
-        equipos_disponibles,
-        index=equipos_disponibles.index(DEFAULT_TEAM_A) if DEFAULT_TEAM_A in equipos_disponibles else 0,
-        help="Primer equipo"
-    )
-    
-    st.sidebar.markdown("<div style='text-align: center; font-size: 1rem; margin: 0.5rem 0; color: #00d9ff; font-weight: 700; letter-spacing: 2px;'>VS</div>", unsafe_allow_html=True)
-    
-    default_index_b = equipos_disponibles.index(DEFAULT_TEAM_B) if DEFAULT_TEAM_B in equipos_disponibles else 1
-    equipo_b = st.sidebar.selectbox(
-        "EQUIPO B",
-        equipos_disponibles,
-        index=default_index_b,
-        help="Segundo equipo"
+    df_nba_raw = esperar_carga(obtener_datos_nba, temporada_seleccionada,
+                               esqueleto=esqueleto, mensaje=f"Cargando temporada {temporada_seleccionada}...")
+    tiempo_datos = time.perf_counter() - INICIO_SCRIPT
+    tiempos_carga.caption(
+        f"⏱️ Primer pintado: {tiempo_primer_pintado * 1000:.0f} ms · Datos: {tiempo_datos * 1000:.0f} ms"
     )
     
-    # Filtrar datos de los equipos seleccionados
-    datos_a = df_nba[df_nba['Equipo'] == equipo_a].iloc[0]
-    datos_b = df_nba[df_nba['Equipo'] == equipo_b].iloc[0]
-    
-    # Renderizar header
-    render_simple_header(equipo_a, equipo_b, temporada_seleccionada)
-    
-    # Calcular ratings netos y probabilidades para el Bento Grid
-    net_rating_a = calcular_net_rating(datos_a['Rating Ofensivo'], datos_a['Rating Defensivo'])
-    net_rating_b = calcular_net_rating(datos_b['Rating Ofensivo'], datos_b['Rating Defensivo'])
-    prob_a = predecir_probabilidad(net_rating_a, net_rating_b)
-    prob_b = 1 - prob_a
-    
-    # Renderizar Bento Grid con información clave
-    render_bento_grid(datos_a, datos_b, equipo_a, equipo_b, net_rating_a, net_rating_b, prob_a, prob_b)
-    
-    # Preparar comparación
-    comparacion_df = preparar_comparacion(datos_a, datos_b, equipo_a, equipo_b)
-    
-    # Renderizar tabs de comparación
-    render_comparison_tabs(comparacion_df, equipo_a, equipo_b)
-    
-    # Renderizar sección de predicción (simplificada, ya está en Bento Grid)
-    st.markdown("---")
-    with st.expander("ℹ️ Información del Modelo de Predicción", expanded=False):
-        st.markdown(f"""
-        **Metodología:**
-        - Modelo basado en **Rating Neto** (Rating Ofensivo - Rating Defensivo)
-        - Función logística que considera la diferencia entre ratings
-        - **{equipo_a}**: Rating Neto {net_rating_a:+.2f}
-        - **{equipo_b}**: Rating Neto {net_rating_b:+.2f}
+    # Los datos reemplazan al esqueleto en el mismo lugar
+    with esqueleto.container():
+        if df_nba_raw.empty:
+            st.error("❌ No se pudieron obtener los datos. Por favor, verifica tu conexión e intenta nuevamente.")
+            st.stop()
         
-        **Limitaciones:**
-        - No considera factores como lesiones, descanso, casa/visitante
-        - Los resultados reales pueden variar significativamente
-        - Úsalo como referencia estadística
-        """)
-
+        # Procesar datos y precalcular rankings de liga
+        df_nba = procesar_temporada(df_nba_raw)
+        rangos, _ = obtener_rankings_liga(df_nba)
+        
+        if vista == VISTA_CLASIFICACION:
+            st.fragment(render_leaderboard)(df_nba, obtener_indices_orden(df_nba), temporada_seleccionada, rangos)
+            return
+        
+        if vista == VISTA_MULTI:
+            render_multi_comparison(df_nba, temporada_seleccionada)
+            return
+        
+        # Duelo: se re-ejecuta como fragmento al cambiar de equipo
+        ids_equipos = dict(zip(df_nba_raw['TEAM_NAME'], df_nba_raw['TEAM_ID']))
+        render_duel(df_nba, ids_equipos, temporada_seleccionada, rangos)
 
 if __name__ == "__main__":
-    main()
+    with medir_rerun('script') as rerun:
+        main()
+        if rerun is not None:
+            render_panel_tiempos(rerun)
+            render_panel_caches(listar_caches())
 
@@ -8,6 +8,7 @@ from datetime import datetime
 import requests # <-- Nueva importación clave para acceder directamente a la API
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
+from utils.metricas import evaluar_metricas
 try:
     from nba_api.stats.endpoints import leaguedashteamstats
     NBA_API_AVAILABLE = True
@@ -193,9 +194,8 @@ def obtener_datos_nba(temporada='2023-24'):
     columnas_a_usar = [col for col in columnas_seleccionadas.keys() if col in df_nba.columns]
     df_nba = df_nba[columnas_a_usar].rename(columns=columnas_seleccionadas)
     
-    # Validar que las columnas necesarias existen antes de calcular AST/TO
-    if 'Asistencias' in df_nba.columns and 'Pérdidas' in df_nba.columns:
-        df_nba['AST/TO'] = df_nba['Asistencias'] / df_nba['Pérdidas'].replace(0, 1)  # Evitar división por cero
+    # Calcular métricas derivadas registradas (AST/TO, Rating Neto, ...)
+    df_nba = evaluar_metricas(df_nba)
     
     return df_nba
 
@@ -353,9 +353,9 @@ def main():
     st.markdown("---")
     st.header("🔮 Posibilidad de Victoria (Modelo Básico)")
     
-    # 1. Calcular Rating Neto para cada equipo
-    net_rating_a = datos_a['Rating Ofensivo'] - datos_a['Rating Defensivo']
-    net_rating_b = datos_b['Rating Ofensivo'] - datos_b['Rating Defensivo']
+    # 1. Rating Neto de cada equipo (métrica derivada registrada)
+    net_rating_a = datos_a['Rating Neto']
+    net_rating_b = datos_b['Rating Neto']
 
     # 2. Obtener la probabilidad
     prob_a_decimal = predecir_probabilidad(net_rating_a, net_rating_b)
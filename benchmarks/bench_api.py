@@ -0,0 +1,159 @@
+"""
+Prueba de carga de la API JSON: latencia p50/p99 y peticiones por segundo.
+
+Arranca ``servidor_api.py`` en un proceso aparte sobre snapshots sintéticos
+(sin red) en un directorio temporal, o ataca un servidor ya en marcha con
+--url. Los clientes son conexiones keep-alive concurrentes que mezclan:
+
+- duelo: GET de un duelo aleatorio (la mayoría del tráfico)
+- equipos: GET de las estadísticas de la temporada
+- probabilidades: GET de la matriz de probabilidades
+- lote: POST de un lote de duelos aleatorios
+
+Uso:
+    python benchmarks/bench_api.py [--peticiones 5000] [--concurrencia 32] [--url http://127.0.0.1:8600]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from urllib.parse import quote, urlsplit
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from bench_rerun import _liga_sintetica  # noqa: E402
+from core.snapshots import guardar_snapshot  # noqa: E402
+
+TEMPORADA = '2023-24'
+MEZCLA = (('duelo', 0.7), ('equipos', 0.1), ('probabilidades', 0.1), ('lote', 0.1))
+TAMANO_LOTE = 10
+
+
+async def _peticion(reader, writer, metodo, ruta, cuerpo=b''):
+    """Envía una petición por una conexión keep-alive y devuelve (estado, cuerpo)."""
+    writer.write(
+        f"{metodo} {ruta} HTTP/1.1\r\nHost: bench\r\nContent-Length: {len(cuerpo)}\r\n\r\n".encode('latin-1') + cuerpo
+    )
+    await writer.drain()
+    cabecera = (await reader.readuntil(b'\r\n\r\n')).decode('latin-1')
+    estado = int(cabecera.split(' ', 2)[1])
+    longitud = next(
+        int(linea.split(':', 1)[1]) for linea in cabecera.split('\r\n') if linea.lower().startswith('content-length')
+    )
+    return estado, await reader.readexactly(longitud)
+
+
+def _generar_peticion(rng, equipos):
+    tipo = rng.choices([t for t, _ in MEZCLA], weights=[p for _, p in MEZCLA])[0]
+    base = f"/temporadas/{TEMPORADA}"
+    if tipo == 'duelo':
+        a, b = rng.sample(equipos, 2)
+        return tipo, 'GET', f"{base}/duelo?a={quote(a)}&b={quote(b)}", b''
+    if tipo == 'lote':
+        duelos = [rng.sample(equipos, 2) for _ in range(TAMANO_LOTE)]
+        return tipo, 'POST', f"{base}/duelos", json.dumps({'duelos': duelos}).encode('utf-8')
+    return tipo, 'GET', f"{base}/{tipo}", b''
+
+
+async def cargar(host, puerto, peticiones, concurrencia, semilla=0):
+    """
+    Lanza ``peticiones`` repartidas entre ``concurrencia`` conexiones.
+
+    Returns:
+        tuple: ({tipo: [latencias en s]}, errores, duración total en s)
+    """
+    reader, writer = await asyncio.open_connection(host, puerto)
+    _, cuerpo = await _peticion(reader, writer, 'GET', f"/temporadas/{TEMPORADA}/equipos")  # Calienta la temporada
+    writer.close()
+    equipos = [fila['Equipo'] for fila in json.loads(cuerpo)['equipos']]
+
+    latencias = defaultdict(list)
+    errores = 0
+    restantes = peticiones
+
+    async def cliente(indice):
+        nonlocal restantes, errores
+        rng = random.Random(semilla + indice)
+        reader, writer = await asyncio.open_connection(host, puerto)
+        try:
+            while restantes > 0:
+                restantes -= 1
+                tipo, metodo, ruta, cuerpo = _generar_peticion(rng, equipos)
+                inicio = time.perf_counter()
+                estado, _ = await _peticion(reader, writer, metodo, ruta, cuerpo)
+                latencias[tipo].append(time.perf_counter() - inicio)
+                errores += estado != 200
+        finally:
+            writer.close()
+
+    inicio = time.perf_counter()
+    await asyncio.gather(*(cliente(i) for i in range(concurrencia)))
+    return latencias, errores, time.perf_counter() - inicio
+
+
+def _percentil(valores, p):
+    return statistics.quantiles(valores, n=100, method='inclusive')[p - 1] if len(valores) > 1 else valores[0]
+
+
+def _arrancar_servidor(directorio):
+    """Arranca servidor_api.py con snapshots sintéticos y devuelve (proceso, puerto)."""
+    guardar_snapshot(TEMPORADA, _liga_sintetica(TEMPORADA), os.path.join(directorio, 'datos', 'snapshots'))
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        puerto = sock.getsockname()[1]
+    proceso = subprocess.Popen(
+        [sys.executable, os.path.join(RAIZ, 'servidor_api.py'), '--puerto', str(puerto), '--precargar', TEMPORADA],
+        cwd=directorio, stdout=subprocess.PIPE, text=True, env={**os.environ, 'PYTHONPATH': RAIZ}
+    )
+    linea = proceso.stdout.readline()
+    if 'escuchando' not in linea:
+        proceso.kill()
+        raise RuntimeError(f"El servidor no arrancó: {linea!r}")
+    return proceso, puerto
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--peticiones', type=int, default=5000)
+    parser.add_argument('--concurrencia', type=int, default=32)
+    parser.add_argument('--url', default=None, help='Servidor ya en marcha (con la temporada 2023-24 disponible)')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directorio:
+        proceso = None
+        if args.url:
+            partes = urlsplit(args.url)
+            host, puerto = partes.hostname, partes.port
+        else:
+            proceso, puerto = _arrancar_servidor(directorio)
+            host = '127.0.0.1'
+        try:
+            latencias, errores, duracion = asyncio.run(cargar(host, puerto, args.peticiones, args.concurrencia))
+        finally:
+            if proceso is not None:
+                proceso.terminate()
+                proceso.wait()
+
+    print(f"{'Endpoint':<16}{'Peticiones':>11}{'p50':>10}{'p99':>10}")
+    for tipo, _ in MEZCLA:
+        valores = latencias[tipo]
+        if valores:
+            print(f"{tipo:<16}{len(valores):>11,d}{_percentil(valores, 50) * 1000:>8.2f}ms"
+                  f"{_percentil(valores, 99) * 1000:>8.2f}ms")
+    todas = [valor for valores in latencias.values() for valor in valores]
+    print(f"{'total':<16}{len(todas):>11,d}{_percentil(todas, 50) * 1000:>8.2f}ms{_percentil(todas, 99) * 1000:>8.2f}ms")
+    print(f"\n{len(todas) / duracion:,.0f} peticiones/s con {args.concurrencia} conexiones · errores: {errores}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,337 @@
+"""
+Prueba de carga de la app: muchas sesiones concurrentes de ``streamlit.testing`` contra el simulador.
+
+Arranca ``simulador.servidor`` en este mismo proceso (puerto libre, latencia y
+fallos configurables, payloads sintéticos deterministas si no hay fixture) y
+apunta la app a él con ``NBA_STATS_URL``. Cada sesión es un ``AppTest``
+independiente que, tras la carga inicial, repite acciones aleatorias:
+
+- temporada: cambia el selector de temporada del sidebar (script completo)
+- equipo: cambia el equipo A o B del duelo (fragmento del duelo)
+- pestana: abre otra pestaña del duelo
+
+Las sesiones comparten proceso y caches, como en ``streamlit run``. Informa
+p50/p95/p99 del tiempo de rerun por acción, la tasa de aciertos de cada
+función con ``st.cache_data``/``st.cache_resource`` y de cada cache del núcleo
+(``core.cache``: temporadas, validación, figuras), las peticiones que llegan
+al simulador y el pico de memoria residente.
+
+La secuencia de acciones de cada sesión y los fallos del simulador salen de
+--semilla, y cada ejecución parte de caches vacías en un directorio temporal,
+así que dos ejecuciones con los mismos argumentos son comparables. Con
+--salida se guardan los resultados en JSON y con --comparar se muestran los
+cambios frente a una ejecución anterior.
+
+Uso:
+    python benchmarks/bench_carga.py [--sesiones 50] [--concurrencia 50] [--acciones 6]
+                                     [--latencia 0.05] [--tasa-error 0] [--semilla 0]
+                                     [--salida carga.json] [--comparar carga_anterior.json]
+"""
+
+import argparse
+import functools
+import json
+import os
+import random
+import resource
+import socket
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import streamlit as st
+from streamlit import config as st_config, logger as st_logger
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+ACCIONES = (('equipo', 0.6), ('pestana', 0.3), ('temporada', 0.1))
+ETIQUETA_TEMPORADA = "📅 TEMPORADA"
+
+LLAMADAS_CACHE = Counter()
+FALLOS_CACHE = Counter()
+_LOCK_CACHE = threading.Lock()
+
+
+def _cache_medida(decorador_original):
+    """
+    Envuelve ``st.cache_data``/``st.cache_resource`` para contar llamadas y ejecuciones reales.
+
+    Una llamada que no ejecuta la función es un acierto; la clave (código
+    fuente y nombre) es la de la función original, así que la cache de
+    Streamlit se comporta igual que sin medir.
+    """
+    @functools.wraps(decorador_original)
+    def decorador(func=None, **kwargs):
+        if func is None:
+            return lambda f: decorador(f, **kwargs)
+        nombre = func.__qualname__
+
+        @functools.wraps(func)
+        def cuerpo(*args, **kw):
+            with _LOCK_CACHE:
+                FALLOS_CACHE[nombre] += 1
+            return func(*args, **kw)
+
+        cacheada = decorador_original(cuerpo, **kwargs)
+
+        @functools.wraps(func)
+        def llamada(*args, **kw):
+            with _LOCK_CACHE:
+                LLAMADAS_CACHE[nombre] += 1
+            return cacheada(*args, **kw)
+
+        llamada.clear = cacheada.clear
+        return llamada
+
+    return decorador
+
+
+def _runtime_compartido():
+    """
+    Permite varias ejecuciones de ``AppTest`` a la vez en el mismo proceso.
+
+    Cada ``AppTest.run`` instala un Runtime simulado global y lo borra al
+    terminar, así que la primera sesión que acaba deja sin Runtime a las que
+    siguen ejecutándose. Mientras no haya uno instalado se usa el último visto.
+    Además cada ejecución recompila ``app.py``; aquí se comparte una única cache
+    de bytecode, como en ``streamlit run``.
+    """
+    from streamlit.runtime.runtime import Runtime
+    from streamlit.testing.v1 import app_test, local_script_runner
+
+    ultimo = {}
+
+    def instance(cls):
+        if cls._instance is not None:
+            ultimo['runtime'] = cls._instance
+            return cls._instance
+        if 'runtime' not in ultimo:
+            raise RuntimeError("Runtime hasn't been created!")
+        return ultimo['runtime']
+
+    Runtime.instance = classmethod(instance)
+    Runtime.exists = classmethod(lambda cls: cls._instance is not None or 'runtime' in ultimo)
+
+    # ast.parse concurrente falla en Python 3.11 ("AST constructor recursion depth mismatch")
+    cache_script = app_test.ScriptCache()
+    app_test.ScriptCache = local_script_runner.ScriptCache = lambda: cache_script
+
+
+def _puerto_libre():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def _percentil(valores, p):
+    return statistics.quantiles(valores, n=100, method='inclusive')[p - 1] if len(valores) > 1 else valores[0]
+
+
+def _pico_rss_mb():
+    # ru_maxrss está en KB en Linux y en bytes en macOS
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return pico / (1024 * 1024 if sys.platform == 'darwin' else 1024)
+
+
+def _ejecutar(at):
+    """Re-ejecuta la sesión y devuelve la duración en segundos (falla si la app lanzó una excepción)."""
+    inicio = time.perf_counter()
+    at.run()
+    duracion = time.perf_counter() - inicio
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+    return duracion
+
+
+def simular_sesion(indice, acciones, semilla, pausa):
+    """
+    Abre una sesión y ejecuta ``acciones`` acciones aleatorias.
+
+    Args:
+        indice (int): Número de sesión (se suma a la semilla)
+        acciones (int): Acciones tras la carga inicial
+        semilla (int): Semilla base de la secuencia de acciones
+        pausa (float): Segundos máximos de espera entre acciones (tiempo de lectura)
+
+    Returns:
+        list: (acción, segundos) de cada rerun, empezando por la carga inicial
+    """
+    from streamlit.testing.v1 import AppTest
+
+    rng = random.Random(semilla * 1000 + indice)
+    at = AppTest.from_file(os.path.join(RAIZ, 'app.py'), default_timeout=300)
+    tiempos = [('inicial', _ejecutar(at))]
+
+    for _ in range(acciones):
+        time.sleep(rng.uniform(0, pausa))
+        accion = rng.choices([a for a, _ in ACCIONES], weights=[p for _, p in ACCIONES])[0]
+        if accion == 'temporada':
+            selector = next(s for s in at.selectbox if s.label == ETIQUETA_TEMPORADA)
+            selector.set_value(rng.choice([t for t in selector.options if t != selector.value]))
+        elif accion == 'equipo':
+            clave = rng.choice(['equipo_a', 'equipo_b'])
+            otro = at.selectbox(key='equipo_b' if clave == 'equipo_a' else 'equipo_a').value
+            selector = at.selectbox(key=clave)
+            selector.set_value(rng.choice([e for e in selector.options if e not in (selector.value, otro)]))
+        else:
+            actual = at.session_state['pestana_duelo'] if 'pestana_duelo' in at.session_state else None
+            at.session_state['pestana_duelo'] = rng.choice([t.label for t in at.tabs if t.label != actual])
+        tiempos.append((accion, _ejecutar(at)))
+    return tiempos
+
+
+def cargar(sesiones, concurrencia, acciones, semilla, pausa):
+    """
+    Lanza ``sesiones`` sesiones con hasta ``concurrencia`` a la vez.
+
+    Returns:
+        tuple: ({acción: [segundos]}, sesiones fallidas, duración total en s)
+    """
+    tiempos = defaultdict(list)
+    fallidas = []
+    inicio = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrencia, thread_name_prefix='sesion') as ejecutor:
+        futuros = {ejecutor.submit(simular_sesion, i, acciones, semilla, pausa): i for i in range(sesiones)}
+        for futuro, indice in futuros.items():
+            try:
+                for accion, segundos in futuro.result():
+                    tiempos[accion].append(segundos)
+            except Exception as e:
+                fallidas.append(f"sesión {indice}: {e}")
+    return tiempos, fallidas, time.perf_counter() - inicio
+
+
+def resumir(tiempos, contadores_simulador, duracion, args):
+    """Agrupa los resultados de una ejecución en un dict serializable."""
+    acciones = {}
+    for accion in ['inicial'] + [a for a, _ in ACCIONES] + ['total']:
+        valores = [v for vs in tiempos.values() for v in vs] if accion == 'total' else tiempos.get(accion, [])
+        if valores:
+            acciones[accion] = {
+                'reruns': len(valores),
+                **{f"p{p}": round(_percentil(valores, p) * 1000, 1) for p in (50, 95, 99)}
+            }
+    caches = {
+        nombre: {
+            'llamadas': LLAMADAS_CACHE[nombre],
+            'aciertos': LLAMADAS_CACHE[nombre] - FALLOS_CACHE[nombre],
+            'tasa_aciertos': round(1 - FALLOS_CACHE[nombre] / LLAMADAS_CACHE[nombre], 3)
+        }
+        for nombre in sorted(LLAMADAS_CACHE)
+    }
+    from core.cache import listar_caches
+    for cache in listar_caches():
+        resumen = cache.resumen()
+        if resumen['tasa_aciertos'] is not None:
+            caches[f"core.{resumen['nombre']}"] = {
+                'llamadas': resumen['aciertos'] + resumen['fallos'],
+                'aciertos': resumen['aciertos'],
+                'tasa_aciertos': round(resumen['tasa_aciertos'], 3)
+            }
+    return {
+        'argumentos': {k: v for k, v in vars(args).items() if k not in ('salida', 'comparar')},
+        'duracion_s': round(duracion, 1),
+        'acciones': acciones,
+        'caches': caches,
+        'simulador': dict(contadores_simulador),
+        'pico_rss_mb': round(_pico_rss_mb(), 1)
+    }
+
+
+def imprimir(resultado, anterior=None):
+    """Muestra el resumen y, si hay una ejecución anterior, el cambio de cada percentil."""
+    anterior = anterior or {}
+
+    def cambio(actual, previo):
+        return f" ({actual / previo - 1:+.0%})" if previo else ''
+
+    print(f"{'Acción':<12}{'Reruns':>8}{'p50':>18}{'p95':>18}{'p99':>18}")
+    for accion, datos in resultado['acciones'].items():
+        previo = anterior.get('acciones', {}).get(accion, {})
+        columnas = ''.join(
+            f"{datos[p]:>9.1f}ms{cambio(datos[p], previo.get(p)):<7}" for p in ('p50', 'p95', 'p99')
+        )
+        print(f"{accion:<12}{datos['reruns']:>8}{columnas}")
+
+    print(f"\n{'Cache':<32}{'Llamadas':>10}{'Aciertos':>10}{'Tasa':>8}")
+    for nombre, datos in resultado['caches'].items():
+        print(f"{nombre:<32}{datos['llamadas']:>10}{datos['aciertos']:>10}{datos['tasa_aciertos']:>8.0%}")
+
+    previo_rss = anterior.get('pico_rss_mb')
+    print(f"\nPeticiones al simulador: {resultado['simulador']}")
+    print(f"Pico de memoria (RSS):   {resultado['pico_rss_mb']:.0f} MB{cambio(resultado['pico_rss_mb'], previo_rss)}")
+    print(f"Duración total:          {resultado['duracion_s']:.1f} s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sesiones', type=int, default=50)
+    parser.add_argument('--concurrencia', type=int, default=50, help='Sesiones activas a la vez')
+    parser.add_argument('--acciones', type=int, default=6, help='Acciones por sesión tras la carga inicial')
+    parser.add_argument('--pausa', type=float, default=0.0, help='Espera máxima entre acciones (s)')
+    parser.add_argument('--latencia', type=float, default=0.05, help='Latencia del simulador (s)')
+    parser.add_argument('--jitter', type=float, default=0.0)
+    parser.add_argument('--tasa-error', type=float, default=0.0, help='Fracción de respuestas 500 del simulador')
+    parser.add_argument('--semilla', type=int, default=0)
+    parser.add_argument('--salida', default=None, help='Guarda los resultados en este JSON')
+    parser.add_argument('--comparar', default=None, help='JSON de una ejecución anterior')
+    args = parser.parse_args()
+    # Rutas relativas al directorio desde el que se lanza
+    args.salida = args.salida and str(Path(args.salida).resolve())
+    args.comparar = args.comparar and str(Path(args.comparar).resolve())
+
+    # La URL del simulador y la carpeta de datos tienen que estar fijadas antes de importar config
+    puerto = _puerto_libre()
+    os.environ['NBA_STATS_URL'] = f"http://127.0.0.1:{puerto}/stats"
+    directorio_datos = tempfile.TemporaryDirectory()
+    os.environ['NBA_DATOS_DIR'] = directorio_datos.name  # Snapshots y cubo vacíos en cada ejecución
+    st.cache_data = _cache_medida(st.cache_data)
+    st.cache_resource = _cache_medida(st.cache_resource)
+    # Sin los avisos de deprecación que cada sesión repetiría en cada rerun
+    st_config.get_option('logger.level')
+    st_logger.set_log_level('ERROR')
+    _runtime_compartido()
+
+    from config import FIXTURES_DIR
+    from simulador.servidor import ConfiguracionFallos, arrancar
+
+    configuracion = ConfiguracionFallos(
+        latencia=args.latencia, jitter=args.jitter, tasa_error=args.tasa_error, semilla=args.semilla
+    )
+    simulador = arrancar(puerto=puerto, configuracion=configuracion,
+                         directorio_fixtures=FIXTURES_DIR)
+    try:
+        tiempos, fallidas, duracion = cargar(
+            args.sesiones, args.concurrencia, args.acciones, args.semilla, args.pausa
+        )
+    finally:
+        simulador.shutdown()
+        directorio_datos.cleanup()
+
+    resultado = resumir(tiempos, simulador.contadores, duracion, args)
+    anterior = None
+    if args.comparar:
+        with open(args.comparar, encoding='utf-8') as archivo:
+            anterior = json.load(archivo)
+    imprimir(resultado, anterior)
+
+    if args.salida:
+        with open(args.salida, 'w', encoding='utf-8') as archivo:
+            json.dump(resultado, archivo, indent=2, ensure_ascii=False)
+        print(f"Resultados guardados en {args.salida}")
+
+    if fallidas:
+        print(f"\n❌ {len(fallidas)} sesión(es) fallidas:")
+        for fallo in fallidas[:10]:
+            print(f"  {fallo}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,130 @@
+"""
+Mide el coste de construir y serializar los gráficos del duelo.
+
+Para cada ``crear_grafico_*`` reporta, en mediana de varias repeticiones:
+
+- Construcción: crear la figura de Plotly.
+- Serialización: lo que hace ``st.plotly_chart`` con la figura
+  (``to_dict`` + ``plotly.io.to_json``), y el tamaño del JSON resultante.
+- Cache: obtener la figura de la cache LRU para una vista repetida.
+
+Al final compara los bytes enviados por pestaña (un rerun de la pestaña
+abierta) con un gráfico por columna frente a una figura combinada.
+
+Uso:
+    python benchmarks/bench_figuras.py [--repeticiones 50]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+import plotly.io as pio
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from analysis import visualizations  # noqa: E402
+from core.procesamiento import procesar_datos_nba, preparar_comparacion  # noqa: E402
+
+GRAFICOS = ['crear_grafico_ratings', 'crear_grafico_pace', 'crear_grafico_ast_to', 'crear_grafico_3p']
+PANELES = ['crear_panel_eficiencia', 'crear_panel_creacion']
+PESTANAS = {
+    'eficiencia': (['crear_grafico_ratings', 'crear_grafico_pace'], 'crear_panel_eficiencia'),
+    'creacion': (['crear_grafico_ast_to', 'crear_grafico_3p'], 'crear_panel_creacion'),
+}
+
+
+def _comparacion_sintetica():
+    """Devuelve una comparación entre dos equipos con datos sintéticos."""
+    rng = np.random.default_rng(0)
+    df_raw = pd.DataFrame({
+        'TEAM_ID': [1, 2],
+        'TEAM_NAME': ['Equipo A', 'Equipo B'],
+        'GP': 82,
+        'W': [50, 40],
+        'L': [32, 42],
+        'W_PCT': [50 / 82, 40 / 82],
+        'PACE': rng.normal(99, 2, 2),
+        'E_OFF_RATING': rng.normal(114, 3, 2),
+        'E_DEF_RATING': rng.normal(114, 3, 2),
+        'AST': rng.normal(26, 2, 2),
+        'TOV': rng.normal(13, 1, 2),
+        'FG3_PCT': rng.normal(0.36, 0.02, 2),
+    })
+    df_nba = procesar_datos_nba(df_raw)
+    datos_a, datos_b = df_nba.iloc[0], df_nba.iloc[1]
+    return preparar_comparacion(datos_a, datos_b, 'Equipo A', 'Equipo B')
+
+
+def _mediana_ms(funcion, repeticiones):
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        tiempos.append(time.perf_counter() - inicio)
+    return statistics.median(tiempos) * 1000
+
+
+def _serializar(fig):
+    """Replica la serialización de ``st.plotly_chart``."""
+    return pio.to_json(fig.to_dict(), validate=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--repeticiones', type=int, default=50)
+    args = parser.parse_args()
+
+    comparacion_df = _comparacion_sintetica()
+    obtener_grafico = getattr(visualizations, 'obtener_grafico', None)
+
+    def medir_grafico(nombre):
+        crear_grafico = getattr(visualizations, nombre)
+        fig = crear_grafico(comparacion_df, 'Equipo A', 'Equipo B')
+        construir = _mediana_ms(lambda: crear_grafico(comparacion_df, 'Equipo A', 'Equipo B'), args.repeticiones)
+        serializar = _mediana_ms(lambda: _serializar(fig), args.repeticiones)
+        if obtener_grafico is not None:
+            obtener_grafico(crear_grafico, comparacion_df, 'Equipo A', 'Equipo B', '2023-24')
+            cache = _mediana_ms(
+                lambda: obtener_grafico(crear_grafico, comparacion_df, 'Equipo A', 'Equipo B', '2023-24'),
+                args.repeticiones
+            )
+        else:
+            cache = float('nan')
+        return construir, serializar, cache, len(_serializar(fig).encode('utf-8'))
+
+    def imprimir(nombre, construir, serializar, cache, tamano):
+        print(f"{nombre:<24}{construir:>9.2f}ms{serializar:>10.2f}ms{cache:>7.2f}ms{tamano:>8,d} B")
+
+    print(f"{'Gráfico':<24}{'Construir':>11}{'Serializar':>12}{'Cache':>9}{'JSON':>10}")
+    filas = [medir_grafico(nombre) for nombre in GRAFICOS]
+    for nombre, fila in zip(GRAFICOS, filas):
+        imprimir(nombre, *fila)
+    imprimir('Total', *(sum(columna) for columna in zip(*filas)))
+    for nombre in PANELES:
+        if hasattr(visualizations, nombre):
+            imprimir(nombre, *medir_grafico(nombre))
+
+    if not hasattr(visualizations, PANELES[0]):
+        return
+
+    print()
+    print(f"{'Payload por pestaña':<24}{'Por columna':>16}{'Combinado':>16}")
+    for pestana, (graficos, panel) in PESTANAS.items():
+        separados = [
+            len(_serializar(getattr(visualizations, g)(comparacion_df, 'Equipo A', 'Equipo B')).encode('utf-8'))
+            for g in graficos
+        ]
+        combinado = len(_serializar(
+            getattr(visualizations, panel)(comparacion_df, 'Equipo A', 'Equipo B')
+        ).encode('utf-8'))
+        print(f"{pestana:<24}{sum(separados):>8,d} B ({len(separados)} fig){combinado:>8,d} B (1 fig)")
+
+
+if __name__ == '__main__':
+    main()
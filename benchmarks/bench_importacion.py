@@ -0,0 +1,109 @@
+"""
+Perfil de importación en frío de la app, con presupuesto de tiempo.
+
+Lanza ``python -X importtime -c "import app"`` en procesos nuevos (sin
+módulos ya cargados), toma la ejecución mediana y reporta:
+
+- Tiempo total de ``import app``.
+- Desglose por paquete de primer nivel (suma del tiempo propio de sus módulos).
+- Los módulos del proyecto más lentos (tiempo acumulado).
+
+Termina con código 1 si la mediana supera el presupuesto, para usarlo como
+comprobación antes de publicar.
+
+Uso:
+    python benchmarks/bench_importacion.py [--repeticiones 5] [--presupuesto 1000]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from collections import defaultdict
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from config import PRESUPUESTO_IMPORTACION_MS  # noqa: E402
+
+PAQUETES_PROYECTO = {'app', 'config', 'utils', 'analysis', 'ui'}
+
+
+def perfilar(modulo):
+    """
+    Importa ``modulo`` en un proceso nuevo con ``-X importtime``.
+
+    Returns:
+        list: Tuplas (módulo, tiempo propio en µs, tiempo acumulado en µs), en orden de importación
+    """
+    resultado = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {modulo}'],
+        cwd=RAIZ, capture_output=True, text=True
+    )
+    if resultado.returncode != 0:
+        raise RuntimeError(resultado.stderr.strip().splitlines()[-1])
+
+    registros = []
+    for linea in resultado.stderr.splitlines():
+        if not linea.startswith('import time:') or 'self [us]' in linea:
+            continue
+        propio, acumulado, nombre = linea[len('import time:'):].split('|')
+        registros.append((nombre.strip(), int(propio), int(acumulado)))
+    return registros
+
+
+def total_ms(registros, modulo):
+    """Devuelve el tiempo acumulado de ``modulo`` en milisegundos."""
+    return next(acumulado for nombre, _, acumulado in registros if nombre == modulo) / 1000
+
+
+def desglose_paquetes(registros):
+    """Suma el tiempo propio (ms) de cada paquete de primer nivel."""
+    paquetes = defaultdict(float)
+    for nombre, propio, _ in registros:
+        paquetes[nombre.split('.')[0]] += propio / 1000
+    return sorted(paquetes.items(), key=lambda item: item[1], reverse=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--modulo', default='app')
+    parser.add_argument('--repeticiones', type=int, default=5)
+    parser.add_argument('--presupuesto', type=float, default=PRESUPUESTO_IMPORTACION_MS,
+                        help='Presupuesto en ms (por defecto PRESUPUESTO_IMPORTACION_MS de config.py)')
+    parser.add_argument('--top', type=int, default=10)
+    args = parser.parse_args()
+
+    perfilar(args.modulo)  # Compila los .pyc para que no cuenten en la medición
+    ejecuciones = sorted(
+        (perfilar(args.modulo) for _ in range(args.repeticiones)),
+        key=lambda registros: total_ms(registros, args.modulo)
+    )
+    mediana = ejecuciones[len(ejecuciones) // 2]
+    total = total_ms(mediana, args.modulo)
+
+    print(f"{'Paquete':<28}{'Tiempo propio':>14}")
+    for paquete, tiempo in desglose_paquetes(mediana)[:args.top]:
+        print(f"{paquete:<28}{tiempo:>11.1f} ms")
+
+    print()
+    print(f"{'Módulo del proyecto':<28}{'Acumulado':>14}")
+    proyecto = [
+        (nombre, acumulado / 1000) for nombre, _, acumulado in mediana
+        if nombre.split('.')[0] in PAQUETES_PROYECTO
+    ]
+    for nombre, tiempo in sorted(proyecto, key=lambda item: item[1], reverse=True)[:args.top]:
+        print(f"{nombre:<28}{tiempo:>11.1f} ms")
+
+    totales = [total_ms(registros, args.modulo) for registros in ejecuciones]
+    print()
+    print(f"import {args.modulo} (p50 de {args.repeticiones}): {total:.1f} ms "
+          f"(min {min(totales):.1f}, max {max(totales):.1f}) · presupuesto {args.presupuesto:.0f} ms")
+    if total > args.presupuesto:
+        print(f"❌ Presupuesto de importación superado en {total - args.presupuesto:.1f} ms")
+        sys.exit(1)
+    print("✅ Dentro del presupuesto")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,144 @@
+"""
+Mide el coste de un rerun al cambiar de equipo: script completo vs fragmento del duelo.
+
+Ejecuta la app con ``streamlit.testing`` y datos sintéticos (sin red), cambia
+de equipo varias veces y compara:
+
+- Script completo: lo que costaba cada cambio de equipo antes de usar
+  fragmentos (validación de temporada, sidebar, datos cacheados y duelo).
+- Fragmento del duelo: el cuerpo de ``render_duel``, que es lo único que se
+  re-ejecuta ahora al cambiar de equipo.
+
+Uso:
+    python benchmarks/bench_rerun.py [--repeticiones 20]
+"""
+
+import argparse
+import functools
+import os
+import statistics
+import sys
+import tempfile
+import time
+from collections import defaultdict
+
+import numpy as np
+import pandas as pd
+import requests
+import streamlit as st
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+TIEMPOS_FRAGMENTOS = defaultdict(list)
+
+
+def _liga_sintetica(temporada, num_equipos=30):
+    """Genera estadísticas crudas plausibles para una temporada."""
+    rng = np.random.default_rng(int(temporada[:4]))
+    victorias = rng.integers(10, 70, num_equipos)
+    return pd.DataFrame({
+        'TEAM_ID': 1610612737 + np.arange(num_equipos),
+        'TEAM_NAME': [f"Equipo {i:02d}" for i in range(num_equipos)],
+        'GP': 82,
+        'W': victorias,
+        'L': 82 - victorias,
+        'W_PCT': victorias / 82,
+        'PACE': rng.normal(99, 2, num_equipos),
+        'E_OFF_RATING': rng.normal(114, 3, num_equipos),
+        'E_DEF_RATING': rng.normal(114, 3, num_equipos),
+        'AST': rng.normal(26, 2, num_equipos),
+        'TOV': rng.normal(13, 1, num_equipos),
+        'FG3_PCT': rng.normal(0.36, 0.02, num_equipos),
+    })
+
+
+class _RespuestaSintetica:
+    status_code = 200
+
+    def __init__(self, datos):
+        self._datos = datos
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._datos
+
+
+def _get_sintetico(self, url, headers=None, params=None, **kwargs):
+    df = _liga_sintetica(params['Season'])
+    return _RespuestaSintetica({
+        'resultSets': [{'headers': list(df.columns), 'rowSet': df.values.tolist()}]
+    })
+
+
+def _fragmento_medido(func=None, **kwargs):
+    """Sustituto de ``st.fragment`` que registra el tiempo de cada ejecución."""
+    if func is None:
+        return lambda f: _fragmento_medido(f, **kwargs)
+
+    @functools.wraps(func)
+    def medida(*args, **kw):
+        inicio = time.perf_counter()
+        try:
+            return func(*args, **kw)
+        finally:
+            TIEMPOS_FRAGMENTOS[func.__name__].append(time.perf_counter() - inicio)
+
+    return _FRAGMENTO_ORIGINAL(medida, **kwargs)
+
+
+_FRAGMENTO_ORIGINAL = st.fragment
+
+
+def medir(repeticiones):
+    """
+    Cambia de equipo ``repeticiones`` veces y mide ambos tiempos.
+
+    Returns:
+        tuple: (tiempos del script completo, tiempos del fragmento del duelo) en segundos
+    """
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(os.path.join(RAIZ, 'app.py'), default_timeout=120)
+    at.run()  # Calienta caches de datos, rankings y cubo
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+
+    selector = at.selectbox(key='equipo_b')
+    opciones = list(selector.options)
+    TIEMPOS_FRAGMENTOS.clear()
+
+    completos = []
+    for i in range(repeticiones):
+        inicio = time.perf_counter()
+        at.selectbox(key='equipo_b').set_value(opciones[(i + 2) % len(opciones)]).run()
+        completos.append(time.perf_counter() - inicio)
+
+    return completos, list(TIEMPOS_FRAGMENTOS['render_duel'])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--repeticiones', type=int, default=20)
+    args = parser.parse_args()
+
+    requests.Session.get = _get_sintetico
+    st.fragment = _fragmento_medido
+
+    with tempfile.TemporaryDirectory() as directorio:
+        os.chdir(directorio)  # Los snapshots sintéticos no tocan datos/
+        completos, fragmento = medir(args.repeticiones)
+
+    mediana_completo = statistics.median(completos) * 1000
+    mediana_fragmento = statistics.median(fragmento) * 1000
+    print(f"Cambios de equipo:           {args.repeticiones}")
+    print(f"Rerun script completo (p50): {mediana_completo:8.1f} ms")
+    print(f"Rerun fragmento duelo (p50): {mediana_fragmento:8.1f} ms")
+    print(f"Trabajo evitado por rerun:   {mediana_completo - mediana_fragmento:8.1f} ms "
+          f"({1 - mediana_fragmento / mediana_completo:.0%})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,215 @@
+"""
+Suite de benchmarks de las rutas calientes (datos, modelo, gráficos e interfaz) con baseline.
+
+Mide, con ligas sintéticas de distinto tamaño (de 30 equipos a miles de
+equipo-temporada):
+
+- parseo: respuesta JSON de la API → DataFrame (``payload_a_dataframe``)
+- procesar: ``procesar_datos_nba`` (renombrado + métricas derivadas)
+- comparacion: ``preparar_comparacion`` de un duelo
+- prediccion: ``predecir_probabilidad`` escalar y en lote (todos los pares)
+- graficos: construcción y serialización de cada ``crear_grafico_*``/``crear_panel_*``
+- tabla: ``render_comparison_table`` (Streamlit en modo bare, sin servidor)
+
+Cada resultado es la mediana del tiempo por llamada (``timeit`` con
+auto-calibración). Con --guardar los resultados pasan a ser la baseline
+(``benchmarks/baseline.json``); sin él se comparan contra ella y se marcan
+las regresiones que superen el umbral (código de salida 1). Para no dar
+falsas alarmas en casos de microsegundos, una regresión debe superar además
+un mínimo absoluto (--minimo-us) y repetirse al volver a medir el caso.
+
+Uso:
+    python benchmarks/bench_suite.py [--escalas 30 300 3000] [--umbral 0.25] [--minimo-us 5]
+                                     [--confirmaciones 2] [--filtro graficos] [--guardar]
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import timeit
+
+import numpy as np
+import pandas as pd
+import plotly.io as pio
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from streamlit import config as st_config, logger as st_logger  # noqa: E402
+
+# render_comparison_table fuera de `streamlit run` avisa en cada llamada (ScriptRunContext,
+# deprecaciones). El primer get_option fija el nivel de la configuración; después se baja.
+st_config.get_option('logger.level')
+st_logger.set_log_level('ERROR')
+
+from analysis import visualizations  # noqa: E402
+from core.predicciones import predecir_probabilidad  # noqa: E402
+from core.fetch import payload_a_dataframe  # noqa: E402
+from ui.components import render_comparison_table  # noqa: E402
+from core.procesamiento import preparar_comparacion, procesar_datos_nba  # noqa: E402
+
+RUTA_BASELINE = os.path.join(RAIZ, 'benchmarks', 'baseline.json')
+GRAFICOS = [
+    'crear_grafico_ratings', 'crear_grafico_pace', 'crear_grafico_ast_to', 'crear_grafico_3p',
+    'crear_panel_eficiencia', 'crear_panel_creacion'
+]
+
+
+def payload_sintetico(num_equipos, semilla=0):
+    """
+    Genera una respuesta de ``leaguedashteamstats`` con ``num_equipos`` filas.
+
+    Con más de 30 filas representa varias temporadas apiladas (equipo-temporada).
+    """
+    rng = np.random.default_rng(semilla)
+    victorias = rng.integers(10, 70, num_equipos)
+    columnas = {
+        'TEAM_ID': (1610612737 + np.arange(num_equipos)).tolist(),
+        'TEAM_NAME': [f"Equipo {i:05d}" for i in range(num_equipos)],
+        'GP': [82] * num_equipos,
+        'W': victorias.tolist(),
+        'L': (82 - victorias).tolist(),
+        'W_PCT': (victorias / 82).round(3).tolist(),
+        'PACE': rng.normal(99, 2, num_equipos).round(2).tolist(),
+        'E_OFF_RATING': rng.normal(114, 3, num_equipos).round(1).tolist(),
+        'E_DEF_RATING': rng.normal(114, 3, num_equipos).round(1).tolist(),
+        'AST': rng.normal(26, 2, num_equipos).round(1).tolist(),
+        'TOV': rng.normal(13, 1, num_equipos).round(1).tolist(),
+        'FG3_PCT': rng.normal(0.36, 0.02, num_equipos).round(3).tolist(),
+    }
+    return {'resultSets': [{
+        'name': 'LeagueDashTeamStats',
+        'headers': list(columnas),
+        'rowSet': [list(fila) for fila in zip(*columnas.values())]
+    }]}
+
+
+def medir(funcion, repeticiones=5):
+    """
+    Devuelve la mediana en ms del tiempo por llamada de ``funcion``.
+
+    ``autorange`` elige cuántas llamadas agrupar para que cada medición dure al
+    menos 0.2 s, de modo que funciones de microsegundos también tienen resolución.
+    """
+    temporizador = timeit.Timer(funcion)
+    numero, _ = temporizador.autorange()
+    return statistics.median(t / numero for t in temporizador.repeat(repeticiones, numero)) * 1000
+
+
+def casos(escalas):
+    """
+    Genera los casos de la suite.
+
+    Yields:
+        tuple: (nombre, escala o None, función sin argumentos)
+    """
+    for escala in escalas:
+        payload = payload_sintetico(escala)
+        # Parseo sobre una copia decodificada nueva, como llega de response.json()
+        texto = json.dumps(payload)
+        yield 'parseo.json_a_dataframe', escala, lambda texto=texto: payload_a_dataframe(json.loads(texto))
+        df_raw = payload_a_dataframe(payload)
+        yield 'procesar.procesar_datos_nba', escala, lambda df_raw=df_raw: procesar_datos_nba(df_raw)
+        df_nba = procesar_datos_nba(df_raw)
+        neto = df_nba['Rating Neto'].to_numpy()
+        yield 'prediccion.lote_todos_los_pares', escala, (
+            lambda neto=neto: predecir_probabilidad(neto[:, None], neto[None, :])
+        )
+
+    df_nba = procesar_datos_nba(payload_a_dataframe(payload_sintetico(30)))
+    datos_a, datos_b = df_nba.iloc[0], df_nba.iloc[1]
+    equipo_a, equipo_b = df_nba['Equipo'].iloc[0], df_nba['Equipo'].iloc[1]
+    yield 'comparacion.preparar_comparacion', 30, lambda: preparar_comparacion(datos_a, datos_b, equipo_a, equipo_b)
+    yield 'prediccion.escalar', None, lambda: predecir_probabilidad(5.2, -1.3)
+
+    comparacion_df = preparar_comparacion(datos_a, datos_b, equipo_a, equipo_b)
+    for nombre in GRAFICOS:
+        crear = getattr(visualizations, nombre)
+        yield f"graficos.{nombre}.construir", None, lambda crear=crear: crear(comparacion_df, equipo_a, equipo_b)
+        figura = crear(comparacion_df, equipo_a, equipo_b)
+        # Lo que hace st.plotly_chart con la figura
+        yield f"graficos.{nombre}.serializar", None, (
+            lambda figura=figura: pio.to_json(figura.to_dict(), validate=False)
+        )
+
+    yield 'tabla.render_comparison_table', None, lambda: render_comparison_table(comparacion_df, equipo_a, equipo_b)
+
+
+def _clave(nombre, escala):
+    return nombre if escala is None else f"{nombre}[{escala}]"
+
+
+def _es_regresion(ms, referencia, umbral, minimo_us):
+    """Regresión: supera la baseline en más de ``umbral`` y en al menos ``minimo_us`` µs por llamada."""
+    return ms / referencia - 1 > umbral and (ms - referencia) * 1000 >= minimo_us
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--escalas', type=int, nargs='+', default=[30, 300, 3000])
+    parser.add_argument('--umbral', type=float, default=0.25, help='Regresión si supera la baseline en esta fracción')
+    parser.add_argument('--minimo-us', type=float, default=5.0,
+                        help='Ignora empeoramientos menores que estos microsegundos por llamada')
+    parser.add_argument('--confirmaciones', type=int, default=2,
+                        help='Veces que se vuelve a medir un caso antes de darlo por regresión')
+    parser.add_argument('--filtro', default='', help='Solo los casos cuyo nombre contenga este texto')
+    parser.add_argument('--guardar', action='store_true', help='Guarda los resultados como nueva baseline')
+    args = parser.parse_args()
+
+    baseline = {}
+    if os.path.exists(RUTA_BASELINE):
+        with open(RUTA_BASELINE, encoding='utf-8') as archivo:
+            baseline = json.load(archivo).get('resultados', {})
+
+    resultados = {}
+    regresiones = []
+    print(f"{'Caso':<52}{'Mediana':>12}{'Baseline':>12}{'Cambio':>9}")
+    for nombre, escala, funcion in casos(args.escalas):
+        if args.filtro not in nombre:
+            continue
+        clave = _clave(nombre, escala)
+        ms = medir(funcion)
+        referencia = baseline.get(clave)
+        if referencia:
+            # Se confirma con nuevas mediciones y se conserva la mejor: el ruido solo suma tiempo
+            for _ in range(args.confirmaciones):
+                if not _es_regresion(ms, referencia, args.umbral, args.minimo_us):
+                    break
+                ms = min(ms, medir(funcion))
+        resultados[clave] = round(ms, 5)
+        if referencia:
+            cambio = ms / referencia - 1
+            marca = '  ⚠️ REGRESIÓN' if _es_regresion(ms, referencia, args.umbral, args.minimo_us) else ''
+            if marca:
+                regresiones.append(clave)
+            print(f"{clave:<52}{ms:>10.4f}ms{referencia:>10.4f}ms{cambio:>+8.0%}{marca}")
+        else:
+            print(f"{clave:<52}{ms:>10.4f}ms{'—':>12}{'':>9}")
+
+    if args.guardar:
+        with open(RUTA_BASELINE, 'w', encoding='utf-8') as archivo:
+            json.dump({
+                'entorno': {
+                    'python': platform.python_version(),
+                    'pandas': pd.__version__,
+                    'numpy': np.__version__,
+                    'maquina': platform.machine()
+                },
+                'resultados': {**baseline, **resultados}
+            }, archivo, indent=2, ensure_ascii=False, sort_keys=True)
+            archivo.write('\n')
+        print(f"\nBaseline guardada en {os.path.relpath(RUTA_BASELINE, RAIZ)} ({len(resultados)} casos)")
+        return
+
+    if regresiones:
+        print(f"\n❌ {len(regresiones)} regresión(es) de más del {args.umbral:.0%} "
+              f"(y {args.minimo_us:g} µs) confirmadas: {', '.join(regresiones)}")
+        sys.exit(1)
+    print(f"\n✅ Sin regresiones de más del {args.umbral:.0%} frente a la baseline")
+
+
+if __name__ == '__main__':
+    main()
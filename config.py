@@ -2,12 +2,19 @@
 Configuración y constantes de la aplicación de Análisis NBA
 """
 
+import os
+
+# Raíz del proyecto: las rutas de datos no dependen del directorio desde el que se arranca
+RAIZ_PROYECTO = os.path.dirname(os.path.abspath(__file__))
+
 # Configuración de la aplicación
 APP_TITLE = "ANALISIS DE DATOS V ALPHA 1.0"
 APP_PAGE_TITLE = "Análisis NBA"
 
 # Configuración de la API de NBA
-NBA_API_BASE_URL = 'https://stats.nba.com/stats/leaguedashteamstats'
+# NBA_STATS_URL permite apuntar a un servidor local (p. ej. simulador/servidor.py) en lugar de stats.nba.com
+NBA_STATS_URL = os.environ.get('NBA_STATS_URL', 'https://stats.nba.com/stats').rstrip('/')
+NBA_API_BASE_URL = f'{NBA_STATS_URL}/leaguedashteamstats'
 NBA_LEAGUE_ID = '00'
 NBA_DEFAULT_SEASON_TYPE = 'Regular Season'
 
@@ -39,6 +46,7 @@ RETRY_STATUS_FORCELIST = [429, 500, 502, 503, 504]
 # Configuración de cache (en segundos)
 CACHE_DATA_TTL = 3600  # 1 hora para datos de equipos
 CACHE_SEASON_VALIDATION_TTL = 86400  # 24 horas para validación de temporadas
+CACHE_FAILURE_TTL = 60  # 1 minuto sin reintentar una temporada cuya descarga falló
 
 # Mapeo de columnas a mostrar
 COLUMNAS_SELECCIONADAS = {
@@ -65,3 +73,53 @@ DEFAULT_TEAM_B = 'Denver Nuggets'
 # Número de temporadas recientes a mostrar
 NUM_TEMPORADAS_RECIENTES = 4
 
+
+# Almacenamiento local de snapshots por temporada
+# (NBA_DATOS_DIR permite usar otra carpeta, p. ej. una vacía en las pruebas de carga)
+DATOS_DIR = os.environ.get('NBA_DATOS_DIR', os.path.join(RAIZ_PROYECTO, 'datos'))
+SNAPSHOT_DIR = os.path.join(DATOS_DIR, 'snapshots')
+CUBO_DIR = os.path.join(DATOS_DIR, 'cubo')
+# Salida de la exportación por lotes (exportar.py), particionada por temporada
+EXPORT_DIR = os.path.join(DATOS_DIR, 'exportacion')
+
+# Vista de tendencias entre temporadas
+NUM_TEMPORADAS_TENDENCIA = 5
+MAX_TEMPORADAS_TENDENCIA = 10
+MAX_WORKERS_CARGA = 4
+
+# Búsqueda de equipos similares entre temporadas
+NUM_EQUIPOS_SIMILARES = 5
+
+# Precalcular la comparación de todos los pares de equipos al cargar una temporada
+PRECOMPUTAR_COMPARACIONES = False
+
+# Construir solo la pestaña visible del duelo (las demás se construyen al abrirlas)
+PESTANAS_DIFERIDAS = True
+MAX_FIGURAS_CACHE = 128
+
+# Una sola figura (subplots) por pestaña del duelo en lugar de un gráfico por columna
+GRAFICOS_COMBINADOS = True
+# Decimales con los que se envían los datos de los gráficos (el texto mostrado usa el formato de la métrica)
+DECIMALES_GRAFICOS = 4
+
+# Primer pintado inmediato: esqueleto en pantalla mientras los datos se cargan en un hilo
+CARGA_PROGRESIVA = True
+INTERVALO_ESQUELETO = 0.25  # Segundos entre actualizaciones del estado de carga
+
+# Presupuesto de arranque en frío (ms) para ``import app``; lo comprueba benchmarks/bench_importacion.py
+PRESUPUESTO_IMPORTACION_MS = 1000
+
+# API JSON (servidor_api.py)
+API_HOST = '127.0.0.1'
+API_PUERTO = 8600
+
+# Servidor local que imita stats.nba.com (simulador/servidor.py)
+SIMULADOR_PUERTO = 8700
+FIXTURES_DIR = os.path.join(RAIZ_PROYECTO, 'datos', 'fixtures')
+
+# Tramos de tiempo por etapa (validación, HTTP, JSON, procesado, gráficos, HTML); ver core/telemetria.py
+METRICAS_ACTIVAS = os.environ.get('NBA_METRICAS', '0') == '1'
+# Una línea JSON por rerun (vacío = no se escribe)
+METRICAS_JSONL = os.environ.get('NBA_METRICAS_JSONL', '')
+# Texto de Prometheus, reescrito tras cada rerun (textfile collector de node_exporter; vacío = no se escribe)
+METRICAS_PROMETHEUS = os.environ.get('NBA_METRICAS_PROMETHEUS', '')
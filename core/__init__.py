@@ -0,0 +1,52 @@
+"""
+Núcleo de datos sin dependencias de interfaz: descarga, procesamiento, métricas y predicción
+
+Lo usan por igual la app de Streamlit (como adaptador fino), los CLIs, los
+servidores y los workers de multiprocessing. Igual que ``utils``, los nombres
+exportados se resuelven en el primer acceso (PEP 562): ``import core`` no
+importa pandas ni requests.
+"""
+
+import importlib
+
+# Nombre exportado -> submódulo que lo define
+_EXPORTACIONES = {
+    'EventoEstado': '.eventos',
+    'RegistroEventos': '.eventos',
+    'SinCache': '.cache',
+    'CacheMemoria': '.cache',
+    'CacheDisco': '.cache',
+    'listar_caches': '.cache',
+    'obtener_temporada_actual': '.temporadas',
+    'generar_lista_temporadas': '.temporadas',
+    'temporada_anterior': '.temporadas',
+    'temporada_valida': '.temporadas',
+    'procesar_datos_nba': '.procesamiento',
+    'predecir_probabilidad': '.predicciones',
+    'ComparacionesMaterializadas': '.comparaciones',
+    'guardar_snapshot': '.snapshots',
+    'cargar_snapshot': '.snapshots',
+    'snapshot_vigente': '.snapshots',
+    'descargar_temporada': '.fetch',
+    'validar_temporada': '.fetch',
+    'obtener_temporada': '.pipeline',
+    'procesar_temporada': '.pipeline',
+    'cargar_temporada': '.pipeline',
+    'predecir_duelo': '.pipeline',
+    'matriz_probabilidades': '.pipeline'
+}
+
+__all__ = list(_EXPORTACIONES)
+
+
+def __getattr__(nombre):
+    modulo = _EXPORTACIONES.get(nombre)
+    if modulo is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
+    valor = getattr(importlib.import_module(modulo, __name__), nombre)
+    globals()[nombre] = valor  # Los siguientes accesos no pasan por __getattr__
+    return valor
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
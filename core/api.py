@@ -0,0 +1,359 @@
+"""
+API JSON asíncrona (solo biblioteca estándar) sobre el pipeline del núcleo
+
+Sirve estadísticas de equipos, comparaciones y probabilidades de victoria
+desde memoria: cada temporada se carga una vez (snapshot local o descarga
+con cache) en un hilo aparte, se materializan todos sus duelos y las
+respuestas más pedidas se serializan una sola vez. Así la API nunca consulta
+stats.nba.com por petición.
+
+Rutas:
+    GET  /salud
+    GET  /temporadas/<temporada>/equipos
+    GET  /temporadas/<temporada>/duelo?a=<equipo>&b=<equipo>
+    POST /temporadas/<temporada>/duelos      {"duelos": [["A", "B"], ...]}
+    GET  /temporadas/<temporada>/probabilidades
+    GET  /metricas                            (texto de Prometheus de core.telemetria)
+"""
+
+import asyncio
+import json
+import re
+import time
+from dataclasses import dataclass, field
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from config import CACHE_DATA_TTL
+from .comparaciones import ComparacionesMaterializadas
+from .eventos import RegistroEventos
+from .pipeline import obtener_temporada_local, procesar_temporada
+from .telemetria import REGISTRO
+from .temporadas import obtener_temporada_actual, temporada_valida
+
+RUTA_TEMPORADA = re.compile(r'^/temporadas/([^/]+)/(equipos|duelo|duelos|probabilidades)$')
+MAX_DUELOS_LOTE = 1000
+MAX_CUERPO = 1 << 20  # 1 MiB
+ESPERA_TRAS_FALLO = 60  # Segundos sin reintentar una temporada cuya carga falló (evita el rate limit)
+
+TEXTOS_ESTADO = {
+    200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+    411: 'Length Required', 413: 'Payload Too Large', 500: 'Internal Server Error', 503: 'Service Unavailable'
+}
+TIPO_JSON = 'application/json; charset=utf-8'
+TIPO_PROMETHEUS = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+class ErrorAPI(Exception):
+    """Error con código HTTP que se devuelve al cliente como ``{"error": mensaje}``."""
+
+    def __init__(self, estado, mensaje):
+        super().__init__(mensaje)
+        self.estado = estado
+        self.mensaje = mensaje
+
+
+def _json(datos):
+    return json.dumps(datos, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+@dataclass
+class EstadoTemporada:
+    """
+    Datos de una temporada listos para servir.
+
+    Attributes:
+        comparaciones (ComparacionesMaterializadas): Todos los duelos de la temporada
+        equipos_json (bytes): Respuesta de ``/equipos`` ya serializada
+        probabilidades_json (bytes): Respuesta de ``/probabilidades`` ya serializada
+        expira (float): Instante (``time.monotonic()``) en que debe recargarse, None si nunca
+        duelos (dict): Memo {(equipo_a, equipo_b): dict del duelo}; como mucho N·(N-1) entradas
+    """
+    comparaciones: ComparacionesMaterializadas
+    equipos_json: bytes
+    probabilidades_json: bytes
+    expira: float = None
+    duelos: dict = field(default_factory=dict)
+
+    @classmethod
+    def construir(cls, temporada, df_nba):
+        comparaciones = ComparacionesMaterializadas.construir(df_nba)
+        # Las temporadas pasadas no cambian; la actual se recarga cada CACHE_DATA_TTL
+        expira = None if temporada < obtener_temporada_actual() else time.monotonic() + CACHE_DATA_TTL
+        return cls(
+            comparaciones=comparaciones,
+            equipos_json=_json({
+                'temporada': temporada,
+                'equipos': json.loads(df_nba.to_json(orient='records', force_ascii=False))
+            }),
+            probabilidades_json=_json({
+                'temporada': temporada,
+                'equipos': comparaciones.equipos,
+                'probabilidades': comparaciones.probabilidades.round(6).tolist()
+            }),
+            expira=expira
+        )
+
+    @property
+    def vigente(self):
+        return self.expira is None or time.monotonic() < self.expira
+
+    def duelo(self, equipo_a, equipo_b):
+        """
+        Devuelve la comparación y las probabilidades de un duelo (memoizado por par).
+
+        Indexa directamente los arreglos materializados, sin construir DataFrames.
+
+        Args:
+            equipo_a (str): Nombre del equipo A
+            equipo_b (str): Nombre del equipo B
+
+        Returns:
+            dict: Probabilidades de ambos equipos y, por métrica, valores y mejor equipo
+
+        Raises:
+            ErrorAPI: 404 si algún equipo no existe en la temporada
+        """
+        clave = (equipo_a, equipo_b)
+        resultado = self.duelos.get(clave)
+        if resultado is not None:
+            return resultado
+
+        comparaciones = self.comparaciones
+        indices = []
+        for equipo in clave:
+            if equipo not in comparaciones.equipos:
+                raise ErrorAPI(404, f"Equipo desconocido: {equipo!r}")
+            indices.append(comparaciones.equipos.index(equipo))
+        i, j = indices
+        valores_a = comparaciones.valores[i].tolist()
+        valores_b = comparaciones.valores[j].tolist()
+        mejor_a = comparaciones.es_mejor[i, j].tolist()
+        mejor_b = comparaciones.es_mejor[j, i].tolist()
+        probabilidad_a = float(comparaciones.probabilidades[i, j])
+        resultado = {
+            'equipo_a': equipo_a,
+            'equipo_b': equipo_b,
+            'probabilidad_a': round(probabilidad_a, 6),
+            'probabilidad_b': round(1 - probabilidad_a, 6),
+            'metricas': [
+                {
+                    'metrica': metrica,
+                    'a': valores_a[k],
+                    'b': valores_b[k],
+                    'mejor': equipo_a if mejor_a[k] else equipo_b if mejor_b[k] else None
+                }
+                for k, metrica in enumerate(comparaciones.metricas)
+            ]
+        }
+        self.duelos[clave] = resultado
+        return resultado
+
+
+class ServicioAPI:
+    """
+    Lógica de la API, independiente del transporte HTTP.
+
+    Las temporadas se cargan bajo demanda; peticiones simultáneas a una temporada
+    aún no cargada esperan a una única carga (un lock por temporada).
+    """
+
+    def __init__(self):
+        self._temporadas = {}
+        self._locks = {}
+        self._fallos = {}  # temporada -> (instante del fallo, ErrorAPI)
+        self.peticiones = 0
+
+    def _cargar(self, temporada):
+        """Carga y materializa una temporada (bloqueante: se ejecuta en un hilo)."""
+        eventos = RegistroEventos(nivel_minimo='error')
+        df_nba = procesar_temporada(obtener_temporada_local(temporada, eventos=eventos))
+        if df_nba.empty:
+            detalle = eventos.eventos[0].mensaje if eventos.eventos else 'sin datos'
+            raise ErrorAPI(503, f"No se pudo obtener la temporada {temporada}: {detalle}")
+        return EstadoTemporada.construir(temporada, df_nba)
+
+    async def temporada(self, temporada):
+        """
+        Devuelve el estado de una temporada, cargándolo si hace falta.
+
+        Args:
+            temporada (str): Temporada en formato "YYYY-YY"
+
+        Returns:
+            EstadoTemporada: Datos listos para servir
+        """
+        if not temporada_valida(temporada):
+            raise ErrorAPI(400, f"Temporada inválida: {temporada!r} (formato YYYY-YY, con YY el año siguiente)")
+        estado = self._temporadas.get(temporada)
+        if estado is not None and estado.vigente:
+            return estado
+        lock = self._locks.setdefault(temporada, asyncio.Lock())
+        async with lock:
+            estado = self._temporadas.get(temporada)
+            if estado is None or not estado.vigente:
+                fallo = self._fallos.get(temporada)
+                if fallo is not None and time.monotonic() - fallo[0] < ESPERA_TRAS_FALLO:
+                    raise fallo[1]
+                try:
+                    estado = await asyncio.to_thread(self._cargar, temporada)
+                except ErrorAPI as e:
+                    self._fallos[temporada] = (time.monotonic(), e)
+                    raise
+                self._fallos.pop(temporada, None)
+                self._temporadas[temporada] = estado
+        return estado
+
+    async def atender(self, metodo, ruta, consulta, cuerpo):
+        """
+        Resuelve una petición.
+
+        Args:
+            metodo (str): Método HTTP
+            ruta (str): Ruta sin query string
+            consulta (dict): Parámetros de la query string (``parse_qs``)
+            cuerpo (bytes): Cuerpo de la petición
+
+        Returns:
+            bytes: Respuesta JSON serializada
+
+        Raises:
+            ErrorAPI: Con el código HTTP a devolver
+        """
+        self.peticiones += 1
+        if ruta == '/salud':
+            return _json({'estado': 'ok', 'temporadas_cargadas': sorted(self._temporadas)})
+        if ruta == '/metricas':
+            return REGISTRO.texto_prometheus().encode('utf-8')
+
+        coincidencia = RUTA_TEMPORADA.match(ruta)
+        if coincidencia is None:
+            raise ErrorAPI(404, f"Ruta desconocida: {ruta}")
+        temporada, recurso = unquote(coincidencia.group(1)), coincidencia.group(2)
+        esperado = 'POST' if recurso == 'duelos' else 'GET'
+        if metodo != esperado:
+            raise ErrorAPI(405, f"{ruta} solo admite {esperado}")
+
+        estado = await self.temporada(temporada)
+        if recurso == 'equipos':
+            return estado.equipos_json
+        if recurso == 'probabilidades':
+            return estado.probabilidades_json
+        if recurso == 'duelo':
+            if 'a' not in consulta or 'b' not in consulta:
+                raise ErrorAPI(400, "Faltan los parámetros 'a' y 'b'")
+            return _json(estado.duelo(consulta['a'][0], consulta['b'][0]))
+
+        try:
+            duelos = json.loads(cuerpo or b'{}')['duelos']
+        except (ValueError, KeyError, TypeError):
+            raise ErrorAPI(400, 'El cuerpo debe ser {"duelos": [["A", "B"], ...]}')
+        if not isinstance(duelos, list) or not all(
+            isinstance(par, list) and len(par) == 2 and all(isinstance(equipo, str) for equipo in par)
+            for par in duelos
+        ):
+            raise ErrorAPI(400, 'Cada duelo debe ser un par ["A", "B"]')
+        if len(duelos) > MAX_DUELOS_LOTE:
+            raise ErrorAPI(413, f"Máximo {MAX_DUELOS_LOTE} duelos por lote")
+        return _json({
+            'temporada': temporada,
+            'duelos': [estado.duelo(a, b) for a, b in duelos]
+        })
+
+
+async def _leer_peticion(reader):
+    """Lee una petición HTTP/1.1; devuelve None si el cliente cerró la conexión."""
+    try:
+        cabecera = await reader.readuntil(b'\r\n\r\n')
+    except (asyncio.IncompleteReadError, ConnectionError):
+        return None
+    lineas = cabecera.decode('latin-1').split('\r\n')
+    try:
+        metodo, objetivo, version = lineas[0].split(' ', 2)
+    except ValueError:
+        raise ErrorAPI(400, 'Línea de petición inválida')
+    cabeceras = {}
+    for linea in lineas[1:]:
+        if ':' in linea:
+            nombre, valor = linea.split(':', 1)
+            cabeceras[nombre.strip().lower()] = valor.strip()
+    # Sin soporte de cuerpos chunked: leerlos como vacíos desincronizaría la conexión keep-alive
+    # (el error cierra la conexión, así que los bytes pendientes se descartan)
+    if 'transfer-encoding' in cabeceras:
+        raise ErrorAPI(411, 'Transfer-Encoding no soportado; envía el cuerpo con Content-Length')
+    try:
+        longitud = int(cabeceras.get('content-length', 0))
+    except ValueError:
+        raise ErrorAPI(400, 'Content-Length inválido')
+    if longitud < 0:
+        raise ErrorAPI(400, 'Content-Length inválido')
+    if longitud > MAX_CUERPO:
+        raise ErrorAPI(413, 'Cuerpo demasiado grande')
+    cuerpo = await reader.readexactly(longitud) if longitud else b''
+    mantener = cabeceras.get('connection', '').lower() != 'close' and version == 'HTTP/1.1'
+    return metodo, objetivo, cuerpo, mantener
+
+
+def _respuesta(estado, cuerpo, mantener, tipo=TIPO_JSON):
+    return (
+        f"HTTP/1.1 {estado} {TEXTOS_ESTADO.get(estado, '')}\r\n"
+        f"Content-Type: {tipo}\r\n"
+        f"Content-Length: {len(cuerpo)}\r\n"
+        f"Connection: {'keep-alive' if mantener else 'close'}\r\n\r\n"
+    ).encode('latin-1') + cuerpo
+
+
+def crear_manejador(servicio):
+    """
+    Crea el callback de ``asyncio.start_server`` para un servicio.
+
+    Cada conexión admite varias peticiones seguidas (keep-alive); las
+    peticiones de distintas conexiones se atienden de forma concurrente.
+    """
+    async def manejar(reader, writer):
+        try:
+            while True:
+                mantener = False
+                tipo = TIPO_JSON
+                try:
+                    peticion = await _leer_peticion(reader)
+                    if peticion is None:
+                        break
+                    metodo, objetivo, cuerpo, mantener = peticion
+                    partes = urlsplit(objetivo)
+                    respuesta = await servicio.atender(metodo, partes.path, parse_qs(partes.query), cuerpo)
+                    estado = 200
+                    if partes.path == '/metricas':
+                        tipo = TIPO_PROMETHEUS
+                except ErrorAPI as e:
+                    estado, respuesta = e.estado, _json({'error': e.mensaje})
+                except Exception as e:  # Un fallo inesperado no debe tumbar el servidor
+                    estado, respuesta = 500, _json({'error': f"{type(e).__name__}: {e}"})
+                writer.write(_respuesta(estado, respuesta, mantener, tipo))
+                await writer.drain()
+                if not mantener:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    return manejar
+
+
+async def servir(host, puerto, servicio=None, temporadas_precarga=()):
+    """
+    Precarga las temporadas indicadas y abre el socket de la API.
+
+    Args:
+        host (str): Interfaz de escucha
+        puerto (int): Puerto de escucha (0 = cualquiera libre)
+        servicio (ServicioAPI): Servicio a exponer (por defecto uno nuevo)
+        temporadas_precarga (tuple): Temporadas a cargar antes de aceptar conexiones
+
+    Returns:
+        asyncio.Server: Servidor ya escuchando (``serve_forever()`` lo mantiene activo)
+    """
+    servicio = servicio or ServicioAPI()
+    for temporada in temporadas_precarga:
+        await servicio.temporada(temporada)
+    return await asyncio.start_server(crear_manejador(servicio), host, puerto)
@@ -0,0 +1,441 @@
+"""
+Caches enchufables del núcleo: en memoria (LRU + TTL), en disco o ninguna
+
+Todas comparten la misma interfaz (``obtener``, ``guardar``, ``invalidar``,
+``limpiar`` y ``obtener_o_calcular``), de modo que un CLI, un servidor o un
+worker eligen dónde guardar las temporadas sin tocar el código del pipeline.
+
+Cada cache cuenta sus aciertos, fallos, refrescos y expulsiones y el tamaño en
+bytes de cada entrada. Las caches con ``nombre`` se registran en ``CACHES`` y
+sus estadísticas se publican en ``core.telemetria.REGISTRO`` (Prometheus y
+panel de depuración de la app).
+"""
+
+import hashlib
+import os
+import pickle
+import re
+import sys
+import threading
+import time
+from collections import Counter, OrderedDict
+
+from .telemetria import REGISTRO
+
+# Marca de "no está en cache" (None es un valor cacheable válido)
+FALTA = object()
+
+# Caches con nombre del proceso: nombre -> cache
+CACHES = {}
+
+# Motivos por los que una entrada sale de la cache
+MOTIVOS_EXPULSION = ('lru', 'ttl', 'invalidacion')
+
+# Huellas hexadecimales (sha1, md5...) que no aportan nada al leer una clave
+_HUELLA = re.compile(r'^[0-9a-f]{32,}$')
+
+
+def tamano_bytes(valor):
+    """
+    Estima la memoria que ocupa un valor cacheado.
+
+    Los DataFrame y Series se miden con ``memory_usage(deep=True)``; el resto,
+    por el tamaño de su pickle (o ``sys.getsizeof`` si no es picklable).
+
+    Args:
+        valor: Valor a medir
+
+    Returns:
+        int: Bytes aproximados
+    """
+    if hasattr(valor, 'memory_usage'):
+        uso = valor.memory_usage(deep=True)
+        return int(uso.sum() if hasattr(uso, 'sum') else uso)
+    if isinstance(valor, (bytes, bytearray, str)):
+        return len(valor)
+    try:
+        return len(pickle.dumps(valor, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return sys.getsizeof(valor)
+
+
+def describir_clave(clave):
+    """
+    Texto corto de una clave para el panel de depuración.
+
+    De una clave tupla omite las partes que son tuplas (huellas de datos) o
+    huellas hexadecimales; una clave que es solo una huella (las entradas de
+    CacheDisco) se abrevia a sus primeros 12 caracteres.
+    """
+    if not isinstance(clave, tuple):
+        texto = str(clave)
+        return f"{texto[:12]}…" if _HUELLA.match(texto) else texto
+    return ' · '.join(
+        str(parte) for parte in clave
+        if isinstance(parte, (str, int, float)) and not (isinstance(parte, str) and _HUELLA.match(parte))
+    )
+
+
+def listar_caches():
+    """Devuelve las caches con nombre del proceso, ordenadas por capa y nombre."""
+    return sorted(CACHES.values(), key=lambda cache: (cache.capa, cache.nombre))
+
+
+class SinCache:
+    """
+    Cache que no guarda nada: cada llamada recalcula.
+
+    Args:
+        nombre (str): Nombre con el que se registra en CACHES (None = sin registrar)
+    """
+
+    capa = 'ninguna'
+
+    def __init__(self, nombre=None):
+        self.nombre = nombre
+        self.estadisticas = Counter()
+        self._lock = threading.Lock()  # Protege las estadísticas (y las entradas en CacheMemoria)
+        if nombre is not None:
+            CACHES[nombre] = self
+
+    def _contar(self, *eventos):
+        with self._lock:
+            self.estadisticas.update(eventos)
+
+    def obtener(self, clave):
+        self._contar('fallos')
+        return FALTA
+
+    def guardar(self, clave, valor):
+        pass
+
+    def invalidar(self, clave):
+        """
+        Elimina una entrada.
+
+        Returns:
+            bool: True si la entrada existía
+        """
+        return False
+
+    def invalidar_si(self, predicado):
+        """
+        Elimina las entradas cuya clave cumple ``predicado(clave)``.
+
+        Returns:
+            int: Entradas eliminadas
+        """
+        return 0
+
+    def limpiar(self):
+        pass
+
+    def obtener_o_calcular(self, clave, calcular, cachear=None):
+        """
+        Devuelve el valor cacheado de ``clave`` o lo calcula y lo guarda.
+
+        Args:
+            clave (hashable): Clave del valor (p. ej. ``('temporada', '2023-24')``)
+            calcular (callable): Función sin argumentos que produce el valor
+            cachear (callable): ``cachear(valor)`` decide si se guarda (None = siempre)
+
+        Returns:
+            tuple: (valor, True si salió de la cache)
+        """
+        valor = self.obtener(clave)
+        if valor is not FALTA:
+            return valor, True
+        valor = calcular()
+        if cachear is None or cachear(valor):
+            self.guardar(clave, valor)
+        return valor, False
+
+    def entradas(self):
+        """
+        Describe las entradas vigentes.
+
+        Returns:
+            list: dicts con 'clave', 'bytes' y 'edad' (segundos desde que se guardó)
+        """
+        return []
+
+    def resumen(self):
+        """
+        Estadísticas acumuladas de la cache.
+
+        Returns:
+            dict: nombre, capa, entradas, bytes, aciertos, fallos, refrescos,
+            expulsiones por motivo y tasa de aciertos (None sin consultas)
+        """
+        entradas = self.entradas()
+        with self._lock:
+            e = self.estadisticas.copy()
+        consultas = e['aciertos'] + e['fallos']
+        return {
+            'nombre': self.nombre,
+            'capa': self.capa,
+            'entradas': len(entradas),
+            'bytes': sum(entrada['bytes'] for entrada in entradas),
+            'aciertos': e['aciertos'],
+            'fallos': e['fallos'],
+            'refrescos': e['refrescos'],
+            'expulsiones': {motivo: e[f"expulsiones_{motivo}"] for motivo in MOTIVOS_EXPULSION},
+            'tasa_aciertos': e['aciertos'] / consultas if consultas else None
+        }
+
+    def __getstate__(self):
+        estado = self.__dict__.copy()
+        del estado['_lock']
+        return estado
+
+    def __setstate__(self, estado):
+        self.__dict__.update(estado)
+        self._lock = threading.Lock()
+
+
+class CacheMemoria(SinCache):
+    """
+    Cache en memoria del proceso, con vigencia (TTL) y límite de entradas (LRU).
+
+    Es segura entre hilos y picklable: al copiarse a otro proceso viaja con su
+    contenido y un lock nuevo. Un fallo sobre una entrada caducada cuenta
+    también como refresco, igual que guardar sobre una entrada vigente. En
+    ``obtener_o_calcular``, las llamadas concurrentes con la misma clave
+    esperan a un único cálculo, como ``st.cache_data``.
+
+    Args:
+        ttl (float): Segundos de vigencia de cada entrada (None = sin caducidad)
+        max_entradas (int): Máximo de entradas antes de desalojar la menos usada (None = sin límite)
+        nombre (str): Nombre con el que se registra en CACHES (None = sin registrar)
+        capa (str): Capa a la que pertenece en las métricas ('memoria', 'figuras'...)
+    """
+
+    capa = 'memoria'
+
+    def __init__(self, ttl=None, max_entradas=None, nombre=None, capa=None):
+        super().__init__(nombre)
+        self.ttl = ttl
+        self.max_entradas = max_entradas
+        if capa is not None:
+            self.capa = capa
+        self._entradas = OrderedDict()  # clave -> (instante de guardado, valor, bytes)
+        self._calculando = {}  # clave -> lock del cálculo en curso
+
+    def obtener(self, clave):
+        with self._lock:
+            entrada = self._entradas.get(clave)
+            if entrada is None:
+                self.estadisticas['fallos'] += 1
+                return FALTA
+            guardado, valor, _ = entrada
+            if not self._vigente(guardado):
+                del self._entradas[clave]
+                self.estadisticas.update(('fallos', 'refrescos', 'expulsiones_ttl'))
+                return FALTA
+            self._entradas.move_to_end(clave)
+            self.estadisticas['aciertos'] += 1
+            return valor
+
+    def guardar(self, clave, valor):
+        tamano = tamano_bytes(valor)  # Fuera del lock: puede costar un pickle
+        with self._lock:
+            if clave in self._entradas:
+                self.estadisticas['refrescos'] += 1
+            self._entradas[clave] = (time.time(), valor, tamano)
+            self._entradas.move_to_end(clave)
+            if self.max_entradas is not None:
+                while len(self._entradas) > self.max_entradas:
+                    self._entradas.popitem(last=False)
+                    self.estadisticas['expulsiones_lru'] += 1
+
+    def obtener_o_calcular(self, clave, calcular, cachear=None):
+        valor = self.obtener(clave)
+        if valor is not FALTA:
+            return valor, True
+        with self._lock:
+            cerrojo = self._calculando.setdefault(clave, threading.Lock())
+        try:
+            with cerrojo:
+                # Otro hilo pudo calcularlo mientras se esperaba (sigue contando como fallo)
+                with self._lock:
+                    entrada = self._entradas.get(clave)
+                if entrada is not None and self._vigente(entrada[0]):
+                    return entrada[1], True
+                valor = calcular()
+                if cachear is None or cachear(valor):
+                    self.guardar(clave, valor)
+                return valor, False
+        finally:
+            with self._lock:
+                self._calculando.pop(clave, None)
+
+    def _vigente(self, guardado):
+        return self.ttl is None or time.time() - guardado <= self.ttl
+
+    def invalidar(self, clave):
+        with self._lock:
+            if self._entradas.pop(clave, None) is None:
+                return False
+            self.estadisticas['expulsiones_invalidacion'] += 1
+            return True
+
+    def invalidar_si(self, predicado):
+        with self._lock:
+            claves = [clave for clave in self._entradas if predicado(clave)]
+            for clave in claves:
+                del self._entradas[clave]
+            self.estadisticas['expulsiones_invalidacion'] += len(claves)
+            return len(claves)
+
+    def limpiar(self):
+        with self._lock:
+            self.estadisticas['expulsiones_invalidacion'] += len(self._entradas)
+            self._entradas.clear()
+
+    def entradas(self):
+        ahora = time.time()
+        with self._lock:
+            return [
+                {'clave': clave, 'bytes': tamano, 'edad': ahora - guardado}
+                for clave, (guardado, _, tamano) in self._entradas.items()
+                if self.ttl is None or ahora - guardado <= self.ttl
+            ]
+
+    def __len__(self):
+        return len(self._entradas)
+
+    def __getstate__(self):
+        estado = super().__getstate__()
+        del estado['_calculando']
+        return estado
+
+    def __setstate__(self, estado):
+        super().__setstate__(estado)
+        self._calculando = {}
+
+
+class CacheDisco(SinCache):
+    """
+    Cache en disco (un archivo pickle por clave), compartida entre procesos.
+
+    La escritura se hace sobre un archivo temporal que luego se renombra, igual
+    que los snapshots, para que un lector concurrente nunca vea una entrada a
+    medias. Cada archivo guarda ``(clave, valor)`` para poder invalidar por
+    clave; el tamaño de una entrada es el del archivo.
+
+    Args:
+        directorio (str): Carpeta donde se guardan las entradas
+        ttl (float): Segundos de vigencia de cada entrada (None = sin caducidad)
+        nombre (str): Nombre con el que se registra en CACHES (None = sin registrar)
+    """
+
+    capa = 'disco'
+
+    def __init__(self, directorio, ttl=None, nombre=None):
+        super().__init__(nombre)
+        self.directorio = directorio
+        self.ttl = ttl
+
+    def _ruta(self, clave):
+        huella = hashlib.sha1(repr(clave).encode('utf-8')).hexdigest()
+        return os.path.join(self.directorio, f"{huella}.pkl")
+
+    def _archivos(self):
+        if not os.path.isdir(self.directorio):
+            return []
+        return [os.path.join(self.directorio, nombre) for nombre in os.listdir(self.directorio)
+                if nombre.endswith('.pkl')]
+
+    def _eliminar(self, ruta, motivo):
+        try:
+            os.remove(ruta)
+        except OSError:
+            return False
+        self._contar(f"expulsiones_{motivo}")
+        return True
+
+    def obtener(self, clave):
+        ruta = self._ruta(clave)
+        try:
+            if self.ttl is not None and time.time() - os.path.getmtime(ruta) > self.ttl:
+                self._contar('fallos', 'refrescos')
+                self._eliminar(ruta, 'ttl')
+                return FALTA
+            with open(ruta, 'rb') as archivo:
+                clave_guardada, valor = pickle.load(archivo)
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError):
+            self._contar('fallos')
+            return FALTA
+        if clave_guardada != clave:  # Colisión de huella
+            self._contar('fallos')
+            return FALTA
+        self._contar('aciertos')
+        return valor
+
+    def guardar(self, clave, valor):
+        os.makedirs(self.directorio, exist_ok=True)
+        ruta = self._ruta(clave)
+        if os.path.exists(ruta):
+            self._contar('refrescos')
+        ruta_tmp = f"{ruta}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(ruta_tmp, 'wb') as archivo:
+            pickle.dump((clave, valor), archivo, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(ruta_tmp, ruta)
+
+    def invalidar(self, clave):
+        return self._eliminar(self._ruta(clave), 'invalidacion')
+
+    def invalidar_si(self, predicado):
+        eliminadas = 0
+        for ruta in self._archivos():
+            try:
+                with open(ruta, 'rb') as archivo:
+                    clave, _ = pickle.load(archivo)
+            except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError):
+                continue
+            if predicado(clave):
+                eliminadas += self._eliminar(ruta, 'invalidacion')
+        return eliminadas
+
+    def limpiar(self):
+        for ruta in self._archivos():
+            self._eliminar(ruta, 'invalidacion')
+
+    def entradas(self):
+        ahora = time.time()
+        entradas = []
+        for ruta in self._archivos():
+            try:
+                estado = os.stat(ruta)
+            except OSError:
+                continue
+            if self.ttl is None or ahora - estado.st_mtime <= self.ttl:
+                entradas.append({
+                    'clave': os.path.basename(ruta)[:-len('.pkl')],
+                    'bytes': estado.st_size,
+                    'edad': ahora - estado.st_mtime
+                })
+        return entradas
+
+
+def _publicar_caches(registro):
+    """Colector de ``REGISTRO``: copia las estadísticas de las caches con nombre."""
+    for cache in list(CACHES.values()):
+        resumen = cache.resumen()
+        etiquetas = {'cache': cache.nombre, 'capa': cache.capa}
+        registro.fijar('nba_cache_aciertos_total', resumen['aciertos'], **etiquetas)
+        registro.fijar('nba_cache_fallos_total', resumen['fallos'], **etiquetas)
+        registro.fijar('nba_cache_refrescos_total', resumen['refrescos'], **etiquetas)
+        for motivo, cuenta in resumen['expulsiones'].items():
+            registro.fijar('nba_cache_expulsiones_total', cuenta, motivo=motivo, **etiquetas)
+        registro.fijar('nba_cache_entradas', resumen['entradas'], **etiquetas)
+        registro.fijar('nba_cache_bytes', resumen['bytes'], **etiquetas)
+
+
+REGISTRO.describir('nba_cache_aciertos_total', 'counter', 'Consultas servidas desde la cache')
+REGISTRO.describir('nba_cache_fallos_total', 'counter', 'Consultas que no encontraron una entrada vigente')
+REGISTRO.describir('nba_cache_refrescos_total', 'counter', 'Entradas caducadas o reemplazadas que se recalcularon')
+REGISTRO.describir('nba_cache_expulsiones_total', 'counter', 'Entradas eliminadas (lru, ttl o invalidacion)')
+REGISTRO.describir('nba_cache_entradas', 'gauge', 'Entradas vigentes')
+REGISTRO.describir('nba_cache_bytes', 'gauge', 'Bytes aproximados de las entradas vigentes')
+REGISTRO.registrar_colector(_publicar_caches)
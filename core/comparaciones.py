@@ -0,0 +1,209 @@
+"""
+Comparación vectorizada entre equipos
+"""
+
+import numpy as np
+import pandas as pd
+
+from .metricas import metricas_menor_es_mejor
+
+
+def signos_direccion(metricas):
+    """
+    Devuelve +1 para métricas donde mayor es mejor y -1 donde menor es mejor.
+    
+    Args:
+        metricas (list): Nombres de las métricas
+        
+    Returns:
+        np.ndarray: Vector de signos alineado con ``metricas``
+    """
+    return np.where(np.isin(list(metricas), metricas_menor_es_mejor()), -1.0, 1.0)
+
+
+def comparar_equipos(comparacion_df):
+    """
+    Determina el mejor y el peor equipo en cada métrica de una matriz métricas × equipos.
+    
+    Todas las métricas se resuelven a la vez con argmax/argmin sobre la matriz
+    ajustada por dirección (las métricas donde menor es mejor cambian de signo).
+    
+    Args:
+        comparacion_df (pd.DataFrame): DataFrame con índice=métricas y columnas=equipos
+        
+    Returns:
+        dict: Con las claves
+            - 'mejor' / 'peor' (pd.Series): equipo mejor y peor por métrica
+            - 'es_mejor' / 'es_peor' (pd.DataFrame): máscaras booleanas métricas × equipos
+              (los empates marcan a todos los equipos empatados; si empatan todos, ninguno)
+    """
+    matriz = comparacion_df.to_numpy(dtype=np.float64)
+    ajustada = matriz * signos_direccion(comparacion_df.index)[:, None]
+    
+    # Los NaN nunca ganan ni pierden
+    para_max = np.where(np.isnan(ajustada), -np.inf, ajustada)
+    para_min = np.where(np.isnan(ajustada), np.inf, ajustada)
+    maximos = para_max.max(axis=1, keepdims=True)
+    minimos = para_min.min(axis=1, keepdims=True)
+    
+    # Si todos los equipos empatan en una métrica no hay mejor ni peor
+    hay_diferencia = maximos > minimos
+    
+    equipos = np.asarray(comparacion_df.columns, dtype=object)
+    return {
+        'mejor': pd.Series(equipos[para_max.argmax(axis=1)], index=comparacion_df.index, name='Mejor'),
+        'peor': pd.Series(equipos[para_min.argmin(axis=1)], index=comparacion_df.index, name='Peor'),
+        'es_mejor': pd.DataFrame((para_max == maximos) & hay_diferencia, index=comparacion_df.index, columns=comparacion_df.columns),
+        'es_peor': pd.DataFrame((para_min == minimos) & hay_diferencia, index=comparacion_df.index, columns=comparacion_df.columns)
+    }
+
+
+class ComparacionesMaterializadas:
+    """
+    Datos de comparación precalculados para todos los pares ordenados de equipos de una temporada.
+    
+    Con 30 equipos son 870 pares; en lugar de guardar 870 DataFrames se guarda
+    la matriz equipos × métricas, el tensor booleano equipos × equipos × métricas
+    de "A es mejor que B" y la matriz de probabilidades de victoria. Elegir un
+    duelo se reduce a indexar esos arreglos.
+    """
+    
+    def __init__(self, equipos, metricas, valores, es_mejor, probabilidades):
+        """
+        Args:
+            equipos (list): Nombres de los equipos (orden de los ejes)
+            metricas (list): Nombres de las métricas
+            valores (np.ndarray): Matriz equipos × métricas
+            es_mejor (np.ndarray): Tensor booleano (A, B, métrica): A es mejor que B
+            probabilidades (np.ndarray): Matriz (A, B) con la probabilidad de victoria de A
+        """
+        self.equipos = list(equipos)
+        self.metricas = list(metricas)
+        self.valores = valores
+        self.es_mejor = es_mejor
+        self.probabilidades = probabilidades
+        self._indice = {equipo: i for i, equipo in enumerate(self.equipos)}
+    
+    @classmethod
+    def construir(cls, df_nba):
+        """
+        Materializa todos los pares de una temporada con operaciones de arreglos.
+        
+        Args:
+            df_nba (pd.DataFrame): DataFrame procesado de la temporada (con 'Rating Neto')
+            
+        Returns:
+            ComparacionesMaterializadas: Almacén con todos los pares
+        """
+        from config import COLUMNAS_EXCLUIDAS_COMPARACION
+        from .predicciones import predecir_probabilidad
+        
+        metricas = [
+            col for col in df_nba.select_dtypes(include='number').columns
+            if col not in COLUMNAS_EXCLUIDAS_COMPARACION
+        ]
+        valores = df_nba[metricas].to_numpy(dtype=np.float64)
+        ajustados = valores * signos_direccion(metricas)
+        
+        # (A, 1, M) > (1, B, M) -> (A, B, M)
+        es_mejor = ajustados[:, None, :] > ajustados[None, :, :]
+        neto = df_nba['Rating Neto'].to_numpy(dtype=np.float64)
+        probabilidades = predecir_probabilidad(neto[:, None], neto[None, :])
+        
+        return cls(df_nba['Equipo'].tolist(), metricas, valores, es_mejor, probabilidades)
+    
+    def __len__(self):
+        n = len(self.equipos)
+        return n * (n - 1)
+    
+    def comparacion(self, equipo_a, equipo_b):
+        """
+        Devuelve el DataFrame de comparación de un duelo (mismo formato que ``preparar_comparacion``).
+        
+        Args:
+            equipo_a (str): Nombre del equipo A
+            equipo_b (str): Nombre del equipo B
+            
+        Returns:
+            pd.DataFrame: DataFrame con índice=métricas y columnas=equipos
+        """
+        return pd.DataFrame({
+            equipo_a: self.valores[self._indice[equipo_a]],
+            equipo_b: self.valores[self._indice[equipo_b]]
+        }, index=self.metricas)
+    
+    def mejor_a(self, equipo_a, equipo_b):
+        """Devuelve la serie booleana por métrica de "A es mejor que B"."""
+        return pd.Series(
+            self.es_mejor[self._indice[equipo_a], self._indice[equipo_b]],
+            index=self.metricas
+        )
+    
+    def probabilidad(self, equipo_a, equipo_b):
+        """Devuelve la probabilidad de victoria de A frente a B."""
+        return float(self.probabilidades[self._indice[equipo_a], self._indice[equipo_b]])
+    
+    def tabla_pares(self):
+        """
+        Devuelve todos los pares ordenados en formato largo, una fila por duelo.
+        
+        Se construye indexando los arreglos con los índices de todos los pares a
+        la vez (sin bucles por duelo).
+        
+        Returns:
+            pd.DataFrame: Columnas 'Equipo A', 'Equipo B', 'Prob. Victoria A' y, por
+            métrica, '<métrica> A', '<métrica> B' y '<métrica> A mejor'
+        """
+        indices_a, indices_b = np.nonzero(~np.eye(len(self.equipos), dtype=bool))
+        equipos = np.asarray(self.equipos, dtype=object)
+        columnas = {
+            'Equipo A': equipos[indices_a],
+            'Equipo B': equipos[indices_b],
+            'Prob. Victoria A': self.probabilidades[indices_a, indices_b]
+        }
+        valores_a = self.valores[indices_a]
+        valores_b = self.valores[indices_b]
+        es_mejor = self.es_mejor[indices_a, indices_b]
+        for j, metrica in enumerate(self.metricas):
+            columnas[f"{metrica} A"] = valores_a[:, j]
+            columnas[f"{metrica} B"] = valores_b[:, j]
+            columnas[f"{metrica} A mejor"] = es_mejor[:, j]
+        return pd.DataFrame(columnas)
+    
+    def guardar(self, ruta):
+        """
+        Persiste el almacén en un archivo ``.npz`` comprimido (el tensor booleano se empaqueta a bits).
+        
+        Args:
+            ruta (str): Ruta del archivo destino
+        """
+        np.savez_compressed(
+            ruta,
+            equipos=np.asarray(self.equipos, dtype=str),
+            metricas=np.asarray(self.metricas, dtype=str),
+            valores=self.valores,
+            es_mejor=np.packbits(self.es_mejor, axis=-1),
+            probabilidades=self.probabilidades
+        )
+    
+    @classmethod
+    def cargar(cls, ruta):
+        """
+        Carga un almacén persistido con ``guardar``.
+        
+        Args:
+            ruta (str): Ruta del archivo ``.npz``
+            
+        Returns:
+            ComparacionesMaterializadas: Almacén cargado
+        """
+        with np.load(ruta) as datos:
+            metricas = datos['metricas'].tolist()
+            es_mejor = np.unpackbits(datos['es_mejor'], axis=-1, count=len(metricas)).astype(bool)
+            return cls(
+                datos['equipos'].tolist(),
+                metricas,
+                datos['valores'],
+                es_mejor,
+                datos['probabilidades']
+            )
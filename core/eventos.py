@@ -0,0 +1,58 @@
+"""
+Eventos de estado estructurados emitidos por el núcleo (descargas, cache, validaciones)
+"""
+
+import time
+from dataclasses import dataclass, field
+
+# Niveles en orden creciente de importancia; 'debug' no se muestra en la interfaz
+NIVELES = ('debug', 'info', 'success', 'warning', 'error')
+
+
+@dataclass(frozen=True)
+class EventoEstado:
+    """
+    Evento de estado del núcleo.
+
+    Attributes:
+        nivel (str): Uno de NIVELES
+        etapa (str): Paso que lo emite ('descarga', 'alternativa', 'snapshot', 'cache', 'validacion')
+        mensaje (str): Texto legible para mostrar al usuario
+        temporada (str): Temporada afectada, si aplica
+        duracion (float): Segundos que tardó la etapa, si aplica
+        instante (float): Marca de tiempo (``time.time()``) de emisión
+    """
+    nivel: str
+    etapa: str
+    mensaje: str
+    temporada: str = None
+    duracion: float = None
+    instante: float = field(default_factory=time.time)
+
+
+def sin_receptor(evento):
+    """Receptor de eventos por defecto: no hace nada."""
+
+
+class RegistroEventos:
+    """
+    Receptor que acumula los eventos en una lista.
+
+    Útil en procesos por lotes y en workers: la lista es picklable y puede
+    devolverse al proceso principal junto con el resultado.
+    """
+
+    def __init__(self, nivel_minimo='debug'):
+        self.nivel_minimo = nivel_minimo
+        self.eventos = []
+
+    def __call__(self, evento):
+        if NIVELES.index(evento.nivel) >= NIVELES.index(self.nivel_minimo):
+            self.eventos.append(evento)
+
+    def __len__(self):
+        return len(self.eventos)
+
+    def __bool__(self):
+        # Un registro vacío sigue siendo un receptor válido (``eventos or sin_receptor`` no debe descartarlo)
+        return True
@@ -0,0 +1,128 @@
+"""
+Exportación por lotes: equipos y todos los duelos de una temporada, particionados por temporada
+
+Cada temporada se escribe en ``<destino>/temporada=YYYY-YY/`` con un manifiesto
+``_COMPLETADO.json``. La partición se escribe en un directorio temporal que se
+renombra al terminar, así que una ejecución interrumpida nunca deja una
+temporada a medias y al reanudar basta con saltar las que tienen manifiesto
+del mismo formato (exportar en otro formato reemplaza la partición).
+Al sobrescribir, la partición anterior se renombra a ``.old-<pid>`` antes del
+cambio y se borra después: si el proceso se corta entre ambos renombrados,
+sigue en disco junto a la nueva.
+"""
+
+import importlib.util
+import json
+import os
+import shutil
+import time
+
+from .comparaciones import ComparacionesMaterializadas
+from .eventos import RegistroEventos
+from .pipeline import obtener_temporada_local, procesar_temporada
+
+FORMATOS = ('parquet', 'csv')
+MANIFIESTO = '_COMPLETADO.json'
+
+
+def parquet_disponible():
+    """Indica si hay un motor de Parquet instalado (pyarrow o fastparquet)."""
+    return any(importlib.util.find_spec(motor) is not None for motor in ('pyarrow', 'fastparquet'))
+
+
+def ruta_particion(destino, temporada):
+    """Devuelve el directorio de la partición de una temporada."""
+    return os.path.join(destino, f"temporada={temporada}")
+
+
+def temporada_completada(destino, temporada, formato=None):
+    """
+    Indica si la temporada ya se exportó por completo (tiene manifiesto).
+    
+    Args:
+        destino (str): Directorio raíz de la exportación
+        temporada (str): Temporada en formato "YYYY-YY"
+        formato (str): Si se indica, la partición solo cuenta como completada
+            si se exportó en ese formato
+        
+    Returns:
+        bool: True si hay manifiesto legible (y del formato pedido)
+    """
+    try:
+        with open(os.path.join(ruta_particion(destino, temporada), MANIFIESTO), encoding='utf-8') as archivo:
+            manifiesto = json.load(archivo)
+    except (OSError, ValueError):
+        return False
+    return formato is None or manifiesto.get('formato') == formato
+
+
+def tablas_temporada(df_nba):
+    """
+    Calcula las tablas a exportar de una temporada procesada.
+    
+    Args:
+        df_nba (pd.DataFrame): DataFrame procesado de la temporada
+        
+    Returns:
+        tuple: (tabla de equipos, tabla de duelos con todos los pares ordenados)
+    """
+    return df_nba, ComparacionesMaterializadas.construir(df_nba).tabla_pares()
+
+
+def _escribir(df, ruta_sin_extension, formato):
+    if formato == 'parquet':
+        df.to_parquet(f"{ruta_sin_extension}.parquet", index=False)
+    else:
+        df.to_csv(f"{ruta_sin_extension}.csv", index=False)
+
+
+def exportar_temporada(temporada, destino, formato='parquet'):
+    """
+    Descarga (o lee del snapshot vigente), procesa y exporta una temporada.
+    
+    Pensada para ejecutarse en un proceso de trabajo: solo recibe y devuelve
+    valores picklables.
+    
+    Args:
+        temporada (str): Temporada en formato "YYYY-YY"
+        destino (str): Directorio raíz de la exportación
+        formato (str): 'parquet' o 'csv'
+        
+    Returns:
+        dict: Resumen con 'temporada', 'ok', 'equipos', 'duelos', 'segundos' y
+        'eventos' (eventos de nivel warning o superior)
+    """
+    inicio = time.perf_counter()
+    eventos = RegistroEventos(nivel_minimo='warning')
+    resumen = {'temporada': temporada, 'ok': False, 'equipos': 0, 'duelos': 0}
+    
+    df_nba_raw = obtener_temporada_local(temporada, eventos=eventos)
+    
+    if df_nba_raw.empty:
+        resumen.update(segundos=time.perf_counter() - inicio, eventos=eventos.eventos)
+        return resumen
+    
+    equipos, duelos = tablas_temporada(procesar_temporada(df_nba_raw))
+    
+    particion = ruta_particion(destino, temporada)
+    temporal = f"{particion}.tmp-{os.getpid()}"
+    shutil.rmtree(temporal, ignore_errors=True)
+    os.makedirs(temporal)
+    _escribir(equipos, os.path.join(temporal, 'equipos'), formato)
+    _escribir(duelos, os.path.join(temporal, 'duelos'), formato)
+    
+    resumen.update(ok=True, equipos=len(equipos), duelos=len(duelos))
+    with open(os.path.join(temporal, MANIFIESTO), 'w', encoding='utf-8') as archivo:
+        json.dump({**resumen, 'formato': formato, 'generado': time.time()}, archivo, ensure_ascii=False)
+    
+    # Reemplazo de la partición completa (una exportación forzada sobrescribe la anterior):
+    # la anterior se aparta con un rename y solo se borra cuando la nueva ya está en su sitio
+    anterior = f"{particion}.old-{os.getpid()}"
+    if os.path.exists(particion):
+        shutil.rmtree(anterior, ignore_errors=True)
+        os.replace(particion, anterior)
+    os.replace(temporal, particion)
+    shutil.rmtree(anterior, ignore_errors=True)
+    
+    resumen.update(segundos=time.perf_counter() - inicio, eventos=eventos.eventos)
+    return resumen
@@ -0,0 +1,229 @@
+"""
+Descarga de estadísticas de equipos desde la API de NBA, sin dependencias de interfaz
+"""
+
+import importlib.util
+import time
+
+import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from config import (
+    NBA_STATS_URL,
+    NBA_API_BASE_URL,
+    NBA_LEAGUE_ID,
+    NBA_DEFAULT_SEASON_TYPE,
+    NBA_HEADERS,
+    REQUEST_CONNECT_TIMEOUT,
+    REQUEST_READ_TIMEOUT,
+    NBA_API_TIMEOUT,
+    VALIDATION_TIMEOUT,
+    RETRY_TOTAL,
+    RETRY_BACKOFF_FACTOR,
+    RETRY_STATUS_FORCELIST
+)
+from .eventos import EventoEstado, sin_receptor
+from .snapshots import guardar_snapshot
+from .telemetria import medido, tramo
+
+# nba_api solo se importa en el primer uso: importar sus endpoints cuesta ~0.4 s
+NBA_API_AVAILABLE = importlib.util.find_spec('nba_api') is not None
+
+
+def cargar_endpoint_equipos():
+    """
+    Importa el endpoint ``leaguedashteamstats`` de nba_api en el primer uso.
+
+    nba_api se apunta a ``NBA_STATS_URL``, de modo que el método alternativo
+    también usa el servidor local cuando está configurado.
+
+    Returns:
+        module: Módulo ``nba_api.stats.endpoints.leaguedashteamstats``
+    """
+    from nba_api.stats.endpoints import leaguedashteamstats
+    from nba_api.stats.library.http import NBAStatsHTTP
+    NBAStatsHTTP.base_url = f"{NBA_STATS_URL}/{{endpoint}}"
+    return leaguedashteamstats
+
+
+def _crear_sesion():
+    """Crea una sesión HTTP con la estrategia de reintentos configurada."""
+    session = requests.Session()
+    retry_strategy = Retry(
+        total=RETRY_TOTAL,
+        backoff_factor=RETRY_BACKOFF_FACTOR,
+        status_forcelist=RETRY_STATUS_FORCELIST,
+        allowed_methods=["GET", "HEAD"]
+    )
+    adapter = HTTPAdapter(max_retries=retry_strategy)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def payload_a_dataframe(data, indice=0):
+    """
+    Convierte una respuesta JSON de stats.nba.com (``resultSets``) en un DataFrame.
+    
+    Args:
+        data (dict): Respuesta JSON ya decodificada
+        indice (int): Posición del result set a convertir
+        
+    Returns:
+        pd.DataFrame: Una fila por elemento de ``rowSet`` con las columnas de ``headers``
+    """
+    result_set = data['resultSets'][indice]
+    return pd.DataFrame(result_set['rowSet'], columns=result_set['headers'])
+
+
+def descargar_temporada(temporada='2023-24', eventos=None):
+    """
+    Descarga las estadísticas avanzadas de una temporada desde la API de NBA.
+    Intenta primero con requests directo, y si falla, usa la librería nba_api como alternativa.
+    Es seguro llamarla desde hilos y procesos de trabajo.
+    
+    Args:
+        temporada (str): Temporada a obtener en formato "YYYY-YY"
+        eventos (callable): Receptor ``eventos(EventoEstado)`` para reportar el progreso
+        
+    Returns:
+        pd.DataFrame: DataFrame con los datos de los equipos, vacío si ambos métodos fallan
+    """
+    eventos = sin_receptor if eventos is None else eventos
+    inicio = time.perf_counter()
+    eventos(EventoEstado('debug', 'descarga', f"Descargando temporada {temporada}", temporada))
+    
+    # Método 1: Intentar con requests directo
+    session = _crear_sesion()
+    params = {
+        'LeagueID': NBA_LEAGUE_ID,
+        'MeasureType': 'Advanced', 
+        'PerMode': 'PerGame',      
+        'Season': temporada,
+        'SeasonType': NBA_DEFAULT_SEASON_TYPE,
+        'PORound': '0'
+    }
+    
+    try:
+        # Intentar método 1: requests directo
+        with tramo('http'):
+            response = session.get(
+                NBA_API_BASE_URL,
+                headers=NBA_HEADERS,
+                params=params,
+                timeout=(REQUEST_CONNECT_TIMEOUT, REQUEST_READ_TIMEOUT),
+                verify=True
+            )
+            response.raise_for_status()
+        with tramo('json'):
+            df_nba = payload_a_dataframe(response.json())
+        session.close()
+        
+    except Exception as e:
+        session.close()
+        
+        # Método 2: Usar nba_api como alternativa
+        if NBA_API_AVAILABLE:
+            try:
+                eventos(EventoEstado('info', 'alternativa', "🔄 Intentando método alternativo con nba_api...", temporada))
+                leaguedashteamstats = cargar_endpoint_equipos()
+                
+                # Obtener estadísticas base (AST, TOV, FG3_PCT); el constructor hace la petición
+                with tramo('http'):
+                    stats_base = leaguedashteamstats.LeagueDashTeamStats(
+                        league_id_nullable=NBA_LEAGUE_ID,
+                        measure_type_detailed_defense='Base',
+                        per_mode_detailed='PerGame',
+                        season=temporada,
+                        season_type_all_star=NBA_DEFAULT_SEASON_TYPE,
+                        timeout=NBA_API_TIMEOUT
+                    )
+                with tramo('json'):
+                    df_base = stats_base.get_data_frames()[0]
+                
+                # Obtener estadísticas avanzadas (PACE, Ratings)
+                with tramo('http'):
+                    stats_advanced = leaguedashteamstats.LeagueDashTeamStats(
+                        league_id_nullable=NBA_LEAGUE_ID,
+                        measure_type_detailed_defense='Advanced',
+                        per_mode_detailed='PerGame',
+                        season=temporada,
+                        season_type_all_star=NBA_DEFAULT_SEASON_TYPE,
+                        timeout=NBA_API_TIMEOUT
+                    )
+                with tramo('json'):
+                    df_advanced = stats_advanced.get_data_frames()[0]
+                
+                # Combinar ambos DataFrames usando TEAM_ID como clave
+                df_nba = pd.merge(
+                    df_base[['TEAM_ID', 'TEAM_NAME', 'GP', 'W', 'L', 'W_PCT', 'AST', 'TOV', 'FG3_PCT']],
+                    df_advanced[['TEAM_ID', 'PACE', 'E_OFF_RATING', 'E_DEF_RATING']],
+                    on='TEAM_ID',
+                    how='inner'
+                )
+                
+                eventos(EventoEstado('success', 'alternativa', "✅ Datos obtenidos usando nba_api", temporada))
+            except Exception as e2:
+                eventos(EventoEstado(
+                    'error', 'alternativa',
+                    f"❌ Ambos métodos fallaron. Error en nba_api: {type(e2).__name__}: {e2}", temporada
+                ))
+                eventos(EventoEstado('error', 'descarga', f"Error inicial en requests: {type(e).__name__}", temporada))
+                return pd.DataFrame()
+        else:
+            eventos(EventoEstado('error', 'descarga', f"❌ Error al obtener datos. Causa: {type(e).__name__}: {e}", temporada))
+            eventos(EventoEstado('info', 'descarga', "💡 Tip: Instala nba_api ejecutando: pip install nba-api", temporada))
+            return pd.DataFrame()
+    
+    # Guardar snapshot local para análisis entre temporadas
+    try:
+        guardar_snapshot(temporada, df_nba)
+    except OSError as e:
+        eventos(EventoEstado('warning', 'snapshot', f"No se pudo guardar el snapshot: {e}", temporada))
+    
+    eventos(EventoEstado(
+        'debug', 'descarga', f"Temporada {temporada}: {len(df_nba)} equipos", temporada,
+        duracion=time.perf_counter() - inicio
+    ))
+    return df_nba
+
+
+@medido('validacion')
+def validar_temporada(temporada, eventos=None):
+    """
+    Verifica si una temporada está disponible en la API de NBA.
+    
+    Args:
+        temporada (str): Temporada a validar en formato "YYYY-YY"
+        eventos (callable): Receptor ``eventos(EventoEstado)``
+        
+    Returns:
+        bool: True si la temporada está disponible, False en caso contrario
+    """
+    if not NBA_API_AVAILABLE:
+        return True  # Si no tenemos nba_api, asumimos que es válida
+    
+    eventos = sin_receptor if eventos is None else eventos
+    inicio = time.perf_counter()
+    try:
+        stats = cargar_endpoint_equipos().LeagueDashTeamStats(
+            league_id_nullable='00',
+            measure_type_detailed_defense='Base',
+            per_mode_detailed='PerGame',
+            season=temporada,
+            season_type_all_star='Regular Season',
+            timeout=VALIDATION_TIMEOUT
+        )
+        df = stats.get_data_frames()[0]
+        disponible = len(df) > 0  # Si tiene datos, la temporada existe
+    except Exception as e:
+        eventos(EventoEstado('debug', 'validacion', f"Validación fallida: {type(e).__name__}", temporada))
+        disponible = False
+    
+    eventos(EventoEstado(
+        'debug', 'validacion', f"Temporada {temporada} {'disponible' if disponible else 'no disponible'}",
+        temporada, duracion=time.perf_counter() - inicio
+    ))
+    return disponible
@@ -0,0 +1,193 @@
+"""
+Registro declarativo de métricas: dirección, formato y métricas derivadas
+"""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Metrica:
+    """
+    Declaración de una métrica.
+
+    Attributes:
+        nombre (str): Nombre de la columna en el DataFrame procesado
+        entradas (tuple): Columnas de las que depende (vacío para métricas base)
+        funcion (callable): Cálculo vectorizado ``funcion(*series_de_entrada)``; None para métricas base
+        menor_es_mejor (bool): Dirección de la métrica
+        formato (str): Especificación de formato (válida en Python y en d3/Plotly), p. ej. '.2f' o '.1%'
+        formato_compacto (str): Formato para tarjetas compactas (por defecto igual a ``formato``)
+    """
+    nombre: str
+    entradas: tuple = ()
+    funcion: object = None
+    menor_es_mejor: bool = False
+    formato: str = '.2f'
+    formato_compacto: str = None
+
+    @property
+    def es_derivada(self):
+        return self.funcion is not None
+
+
+REGISTRO_METRICAS = {}
+
+
+def declarar_metrica_base(nombre, menor_es_mejor=False, formato='.2f', formato_compacto=None):
+    """
+    Declara dirección y formato de una métrica que viene directamente de la API.
+
+    Args:
+        nombre (str): Nombre de la columna procesada
+        menor_es_mejor (bool): Si True, un valor menor es mejor
+        formato (str): Especificación de formato
+        formato_compacto (str): Formato para tarjetas compactas
+    """
+    REGISTRO_METRICAS[nombre] = Metrica(nombre, (), None, menor_es_mejor, formato, formato_compacto)
+
+
+def registrar_metrica(nombre, entradas, menor_es_mejor=False, formato='.2f', formato_compacto=None):
+    """
+    Decorador que registra una métrica derivada.
+
+    Ejemplo::
+
+        @registrar_metrica('AST/TO', entradas=('Asistencias', 'Pérdidas'))
+        def _ast_to(asistencias, perdidas):
+            return asistencias / perdidas
+
+    Args:
+        nombre (str): Nombre de la columna resultante
+        entradas (tuple): Columnas (base o derivadas) que recibe la función, en orden
+        menor_es_mejor (bool): Si True, un valor menor es mejor
+        formato (str): Especificación de formato
+        formato_compacto (str): Formato para tarjetas compactas
+
+    Returns:
+        callable: Decorador que devuelve la función sin modificar
+    """
+    def decorador(funcion):
+        REGISTRO_METRICAS[nombre] = Metrica(
+            nombre, tuple(entradas), funcion, menor_es_mejor, formato, formato_compacto
+        )
+        return funcion
+    return decorador
+
+
+# Métricas base (columnas renombradas de la API)
+declarar_metrica_base('Juegos Jugados', formato='.0f')
+declarar_metrica_base('Victorias', formato='.0f')
+declarar_metrica_base('Derrotas', menor_es_mejor=True, formato='.0f')
+declarar_metrica_base('Porc. Victoria', formato='.1%')
+declarar_metrica_base('Ritmo de Juego', formato_compacto='.1f')
+declarar_metrica_base('Rating Ofensivo', formato_compacto='.1f')
+declarar_metrica_base('Rating Defensivo', menor_es_mejor=True, formato_compacto='.1f')
+declarar_metrica_base('Asistencias')
+declarar_metrica_base('Pérdidas', menor_es_mejor=True)
+declarar_metrica_base('3P%', formato='.1%')
+
+
+# Métricas derivadas
+@registrar_metrica('AST/TO', entradas=('Asistencias', 'Pérdidas'))
+def _ast_to(asistencias, perdidas):
+    return asistencias / perdidas.replace(0, 1)  # Evitar división por cero
+
+
+@registrar_metrica('Rating Neto', entradas=('Rating Ofensivo', 'Rating Defensivo'), formato='+.2f')
+def _rating_neto(rating_ofensivo, rating_defensivo):
+    return rating_ofensivo - rating_defensivo
+
+
+def orden_evaluacion(registro=None):
+    """
+    Ordena las métricas derivadas de modo que cada una se evalúe después de sus entradas.
+
+    Args:
+        registro (dict): Registro de métricas (por defecto REGISTRO_METRICAS)
+
+    Returns:
+        list: Métricas derivadas en orden topológico
+
+    Raises:
+        ValueError: Si hay una dependencia circular
+    """
+    registro = REGISTRO_METRICAS if registro is None else registro
+    orden = []
+    estado = {}  # nombre -> 'visitando' | 'listo'
+
+    def visitar(nombre, camino):
+        if estado.get(nombre) == 'listo':
+            return
+        if estado.get(nombre) == 'visitando':
+            raise ValueError(f"Dependencia circular entre métricas: {' -> '.join(camino + [nombre])}")
+        estado[nombre] = 'visitando'
+        for entrada in registro[nombre].entradas:
+            if entrada in registro and registro[entrada].es_derivada:
+                visitar(entrada, camino + [nombre])
+        estado[nombre] = 'listo'
+        orden.append(registro[nombre])
+
+    for nombre, metrica in registro.items():
+        if metrica.es_derivada:
+            visitar(nombre, [])
+    return orden
+
+
+def evaluar_metricas(df_nba, registro=None):
+    """
+    Calcula todas las métricas derivadas sobre el DataFrame completo, en orden de dependencias.
+
+    Las métricas cuyas entradas no existen en el DataFrame se omiten.
+
+    Args:
+        df_nba (pd.DataFrame): DataFrame con columnas ya renombradas
+        registro (dict): Registro de métricas (por defecto REGISTRO_METRICAS)
+
+    Returns:
+        pd.DataFrame: Copia del DataFrame con las columnas derivadas añadidas
+    """
+    df_nba = df_nba.copy()
+    for metrica in orden_evaluacion(registro):
+        if all(entrada in df_nba.columns for entrada in metrica.entradas):
+            df_nba[metrica.nombre] = metrica.funcion(*(df_nba[entrada] for entrada in metrica.entradas))
+    return df_nba
+
+
+def metricas_derivadas(registro=None):
+    """Devuelve los nombres de las métricas derivadas en orden de evaluación."""
+    return [metrica.nombre for metrica in orden_evaluacion(registro)]
+
+
+def metricas_menor_es_mejor():
+    """Devuelve los nombres de las métricas donde un valor menor es mejor."""
+    return [nombre for nombre, metrica in REGISTRO_METRICAS.items() if metrica.menor_es_mejor]
+
+
+def es_menor_mejor(nombre):
+    """Indica si en la métrica un valor menor es mejor (False para métricas no registradas)."""
+    metrica = REGISTRO_METRICAS.get(nombre)
+    return metrica is not None and metrica.menor_es_mejor
+
+
+def formato_metrica(nombre, compacto=False):
+    """
+    Devuelve la especificación de formato de una métrica.
+
+    Args:
+        nombre (str): Nombre de la métrica
+        compacto (bool): Si True, usa el formato para tarjetas compactas
+
+    Returns:
+        str: Especificación de formato ('.2f' para métricas no registradas)
+    """
+    metrica = REGISTRO_METRICAS.get(nombre)
+    if metrica is None:
+        return '.2f'
+    if compacto and metrica.formato_compacto:
+        return metrica.formato_compacto
+    return metrica.formato
+
+
+def formatear_valor(nombre, valor, compacto=False):
+    """Formatea un valor según el formato declarado de su métrica."""
+    return f"{valor:{formato_metrica(nombre, compacto)}}"
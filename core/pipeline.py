@@ -0,0 +1,156 @@
+"""
+Pipeline del núcleo: descarga → procesamiento → métricas derivadas → predicción
+
+Todas las funciones son de módulo y sus argumentos/resultados son picklables,
+de modo que pueden enviarse tal cual a un ``ProcessPoolExecutor``.
+"""
+
+import numpy as np
+import pandas as pd
+
+from config import CACHE_DATA_TTL, CACHE_FAILURE_TTL, MAX_TEMPORADAS_TENDENCIA
+from .cache import CacheMemoria, FALTA
+from .eventos import EventoEstado, sin_receptor
+from .fetch import descargar_temporada
+from .predicciones import predecir_probabilidad
+from .procesamiento import procesar_datos_nba
+from .snapshots import antiguedad_snapshot, cargar_snapshot, snapshot_vigente
+from .telemetria import medido
+
+# Cache por defecto del proceso para los datos crudos de cada temporada
+CACHE_TEMPORADAS = CacheMemoria(ttl=CACHE_DATA_TTL, max_entradas=MAX_TEMPORADAS_TENDENCIA, nombre='temporadas')
+
+# Cache negativa: temporadas cuya descarga falló hace menos de CACHE_FAILURE_TTL (compartida por todas las caches)
+CACHE_FALLOS = CacheMemoria(ttl=CACHE_FAILURE_TTL, nombre='fallos_descarga')
+
+
+def obtener_temporada(temporada, cache=None, eventos=None):
+    """
+    Devuelve los datos crudos de una temporada, descargándolos solo si no están en cache.
+    
+    Una descarga fallida (DataFrame vacío) no se cachea como dato: se anota en
+    CACHE_FALLOS y no se reintenta hasta pasados CACHE_FAILURE_TTL segundos,
+    para no repetir reintentos y alternativa en cada rerun. Las llamadas
+    concurrentes a la misma temporada comparten una sola descarga.
+    
+    Args:
+        temporada (str): Temporada en formato "YYYY-YY"
+        cache: Cache del núcleo (por defecto CACHE_TEMPORADAS)
+        eventos (callable): Receptor ``eventos(EventoEstado)``
+        
+    Returns:
+        pd.DataFrame: DataFrame crudo de la API, vacío si la descarga falla
+    """
+    cache = CACHE_TEMPORADAS if cache is None else cache
+    eventos = sin_receptor if eventos is None else eventos
+    clave = ('temporada', temporada)
+    
+    def descargar():
+        if CACHE_FALLOS.obtener(clave) is not FALTA:
+            eventos(EventoEstado(
+                'info', 'cache',
+                f"La descarga de {temporada} falló hace poco; se reintentará en menos de {CACHE_FAILURE_TTL} s",
+                temporada
+            ))
+            return pd.DataFrame()
+        df_descargado = descargar_temporada(temporada, eventos=eventos)
+        if df_descargado.empty:
+            CACHE_FALLOS.guardar(clave, True)
+        return df_descargado
+    
+    df_nba, en_cache = cache.obtener_o_calcular(clave, descargar, cachear=lambda df: not df.empty)
+    if en_cache:
+        eventos(EventoEstado('debug', 'cache', f"Temporada {temporada} servida desde cache", temporada))
+    return df_nba
+
+
+def obtener_temporada_local(temporada, cache=None, eventos=None):
+    """
+    Devuelve los datos crudos de una temporada priorizando el snapshot local.
+    
+    Usa el snapshot si está vigente; si no, descarga (con cache). Si la descarga
+    falla, un snapshot caducado sigue siendo mejor que nada.
+    
+    Args:
+        temporada (str): Temporada en formato "YYYY-YY"
+        cache: Cache del núcleo (por defecto CACHE_TEMPORADAS)
+        eventos (callable): Receptor ``eventos(EventoEstado)``
+        
+    Returns:
+        pd.DataFrame: DataFrame crudo, vacío si no hay datos
+    """
+    if snapshot_vigente(temporada):
+        return cargar_snapshot(temporada)
+    df_nba = obtener_temporada(temporada, cache=cache, eventos=eventos)
+    if df_nba.empty and antiguedad_snapshot(temporada) is not None:
+        eventos = sin_receptor if eventos is None else eventos
+        eventos(EventoEstado('warning', 'snapshot', f"Usando snapshot caducado de {temporada}", temporada))
+        return cargar_snapshot(temporada)
+    return df_nba
+
+
+@medido('procesar')
+def procesar_temporada(df_nba_raw):
+    """
+    Procesa los datos crudos de una temporada y evalúa las métricas derivadas.
+    
+    Args:
+        df_nba_raw (pd.DataFrame): DataFrame crudo de la API
+        
+    Returns:
+        pd.DataFrame: DataFrame procesado (columnas renombradas y métricas derivadas)
+    """
+    return procesar_datos_nba(df_nba_raw)
+
+
+def cargar_temporada(temporada, cache=None, eventos=None):
+    """
+    Descarga (o lee de cache) y procesa una temporada.
+    
+    Args:
+        temporada (str): Temporada en formato "YYYY-YY"
+        cache: Cache del núcleo (por defecto CACHE_TEMPORADAS)
+        eventos (callable): Receptor ``eventos(EventoEstado)``
+        
+    Returns:
+        pd.DataFrame: DataFrame procesado, vacío si la descarga falla
+    """
+    return procesar_temporada(obtener_temporada(temporada, cache=cache, eventos=eventos))
+
+
+def predecir_duelo(df_nba, equipo_a, equipo_b):
+    """
+    Calcula ratings netos y probabilidades de victoria de un duelo.
+    
+    Args:
+        df_nba (pd.DataFrame): DataFrame procesado de la temporada
+        equipo_a (str): Nombre del equipo A
+        equipo_b (str): Nombre del equipo B
+        
+    Returns:
+        dict: Con 'rating_neto_a', 'rating_neto_b', 'probabilidad_a' y 'probabilidad_b'
+    """
+    netos = df_nba.set_index('Equipo')['Rating Neto']
+    neto_a, neto_b = float(netos[equipo_a]), float(netos[equipo_b])
+    probabilidad_a = float(predecir_probabilidad(neto_a, neto_b))
+    return {
+        'rating_neto_a': neto_a,
+        'rating_neto_b': neto_b,
+        'probabilidad_a': probabilidad_a,
+        'probabilidad_b': 1 - probabilidad_a
+    }
+
+
+def matriz_probabilidades(df_nba):
+    """
+    Calcula la probabilidad de victoria de cada equipo contra cada otro en una sola operación.
+    
+    Args:
+        df_nba (pd.DataFrame): DataFrame procesado de la temporada
+        
+    Returns:
+        pd.DataFrame: Matriz equipos × equipos con P(fila gana a columna)
+    """
+    neto = df_nba['Rating Neto'].to_numpy(dtype=np.float64)
+    equipos = df_nba['Equipo'].tolist()
+    return pd.DataFrame(predecir_probabilidad(neto[:, None], neto[None, :]), index=equipos, columns=equipos)
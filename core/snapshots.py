@@ -0,0 +1,120 @@
+"""
+Almacenamiento local de snapshots de datos por temporada
+"""
+
+import os
+import time
+
+import pandas as pd
+from config import CACHE_DATA_TTL, SNAPSHOT_DIR
+
+from .temporadas import obtener_temporada_actual
+
+
+def _ruta_snapshot(temporada, directorio=SNAPSHOT_DIR):
+    """Devuelve la ruta del archivo de snapshot de una temporada."""
+    return os.path.join(directorio, f"{temporada}.csv")
+
+
+def guardar_snapshot(temporada, df_nba, directorio=SNAPSHOT_DIR):
+    """
+    Guarda en disco los datos crudos de una temporada.
+
+    La escritura se hace sobre un archivo temporal que luego se renombra,
+    para que un lector concurrente nunca vea un snapshot a medio escribir.
+
+    Args:
+        temporada (str): Temporada en formato "YYYY-YY"
+        df_nba (pd.DataFrame): DataFrame crudo obtenido de la API
+        directorio (str): Carpeta donde se guardan los snapshots
+    """
+    if df_nba.empty:
+        return
+
+    os.makedirs(directorio, exist_ok=True)
+    ruta = _ruta_snapshot(temporada, directorio)
+    ruta_tmp = f"{ruta}.tmp"
+    df_nba.to_csv(ruta_tmp, index=False)
+    os.replace(ruta_tmp, ruta)
+
+
+def cargar_snapshot(temporada, directorio=SNAPSHOT_DIR):
+    """
+    Carga el snapshot guardado de una temporada.
+
+    Args:
+        temporada (str): Temporada en formato "YYYY-YY"
+        directorio (str): Carpeta donde se guardan los snapshots
+
+    Returns:
+        pd.DataFrame: DataFrame crudo, o vacío si no existe snapshot
+    """
+    ruta = _ruta_snapshot(temporada, directorio)
+    if not os.path.exists(ruta):
+        return pd.DataFrame()
+    return pd.read_csv(ruta)
+
+
+def listar_snapshots(directorio=SNAPSHOT_DIR):
+    """
+    Lista las temporadas con snapshot y su huella de modificación.
+
+    La huella combina fecha de modificación y tamaño del archivo, suficiente
+    para detectar qué temporadas cambiaron sin leer su contenido.
+
+    Args:
+        directorio (str): Carpeta donde se guardan los snapshots
+
+    Returns:
+        dict: Mapa {temporada: huella} ordenado por temporada
+    """
+    if not os.path.isdir(directorio):
+        return {}
+
+    huellas = {}
+    for nombre in sorted(os.listdir(directorio)):
+        if not nombre.endswith('.csv'):
+            continue
+        estado = os.stat(os.path.join(directorio, nombre))
+        huellas[nombre[:-4]] = f"{estado.st_mtime_ns}-{estado.st_size}"
+    return huellas
+
+
+def antiguedad_snapshot(temporada, directorio=SNAPSHOT_DIR):
+    """
+    Calcula cuántos segundos tiene el snapshot de una temporada.
+
+    Args:
+        temporada (str): Temporada en formato "YYYY-YY"
+        directorio (str): Carpeta donde se guardan los snapshots
+
+    Returns:
+        float: Antigüedad en segundos, o None si no existe snapshot
+    """
+    ruta = _ruta_snapshot(temporada, directorio)
+    if not os.path.exists(ruta):
+        return None
+    return time.time() - os.path.getmtime(ruta)
+
+
+def snapshot_vigente(temporada, ttl=CACHE_DATA_TTL, directorio=SNAPSHOT_DIR):
+    """
+    Indica si el snapshot local de una temporada puede usarse sin volver a descargar.
+
+    Las temporadas pasadas ya no cambian, así que su snapshot nunca caduca;
+    la temporada en curso se considera vigente durante ``ttl`` segundos.
+
+    Args:
+        temporada (str): Temporada en formato "YYYY-YY"
+        ttl (int): Vigencia en segundos para la temporada en curso
+        directorio (str): Carpeta donde se guardan los snapshots
+
+    Returns:
+        bool: True si existe un snapshot utilizable
+    """
+    antiguedad = antiguedad_snapshot(temporada, directorio)
+    if antiguedad is None:
+        return False
+    if temporada < obtener_temporada_actual():
+        return True
+    return antiguedad < ttl
@@ -0,0 +1,342 @@
+"""
+Tramos de tiempo por etapa y métricas del proceso, exportables a Prometheus y JSON lines
+
+Las etapas instrumentadas son las que explican un rerun lento:
+
+- validacion: comprobar que la temporada existe en la API
+- http: peticiones a stats.nba.com (o al simulador)
+- json: decodificar la respuesta y convertirla en DataFrame
+- procesar: ``procesar_datos_nba`` (renombrado + métricas derivadas)
+- graficos: construir y enviar las figuras de Plotly
+- html: construir y enviar plantillas HTML y tablas con estilo
+
+Cada tramo se acumula en un histograma del proceso (``REGISTRO``) y, si hay un
+rerun en curso (``medir_rerun``), en la lista de tramos de ese rerun. Con
+METRICAS_ACTIVAS desactivado, ``tramo`` y ``medir_rerun`` devuelven un
+contexto vacío compartido y ``medido`` llama directamente a la función: el
+coste es una comprobación de bandera.
+"""
+
+import bisect
+import contextvars
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import nullcontext
+
+from config import METRICAS_ACTIVAS, METRICAS_JSONL, METRICAS_PROMETHEUS
+
+ETAPAS = ('validacion', 'http', 'json', 'procesar', 'graficos', 'html')
+
+# Límites superiores (segundos) de los buckets de los histogramas
+LIMITES_HISTOGRAMA = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_VACIO = nullcontext()
+_RERUN_ACTUAL = contextvars.ContextVar('rerun_actual', default=None)
+_activas = METRICAS_ACTIVAS
+
+
+def activar(activas=True):
+    """Activa o desactiva la instrumentación en todo el proceso."""
+    global _activas
+    _activas = activas
+
+
+def activas():
+    """Indica si la instrumentación está activa."""
+    return _activas
+
+
+class RegistroMetricas:
+    """
+    Contadores, valores instantáneos e histogramas del proceso, con etiquetas.
+
+    Es seguro usarlo desde varios hilos. Cada métrica se declara una vez con
+    ``describir`` (tipo y ayuda para Prometheus); las series se crean en el
+    primer uso de cada combinación de etiquetas. Los colectores
+    (``registrar_colector``) actualizan métricas que viven fuera del registro,
+    como las estadísticas de las caches, justo antes de cada instantánea.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._descripciones = {}
+        self._series = {}
+        self._colectores = []
+
+    def describir(self, nombre, tipo, ayuda):
+        """
+        Declara una métrica.
+
+        Args:
+            nombre (str): Nombre Prometheus, p. ej. "nba_etapa_segundos"
+            tipo (str): 'counter', 'gauge' o 'histogram'
+            ayuda (str): Descripción de una línea
+        """
+        self._descripciones[nombre] = (tipo, ayuda)
+
+    def registrar_colector(self, colector):
+        """
+        Añade una función ``colector(registro)`` que se llama antes de cada instantánea.
+
+        Args:
+            colector (callable): Recibe el registro y fija sus series con ``fijar``
+        """
+        self._colectores.append(colector)
+
+    def _serie(self, nombre, etiquetas, inicial):
+        clave = (nombre, tuple(sorted(etiquetas.items())))
+        serie = self._series.get(clave)
+        if serie is None:
+            serie = self._series[clave] = inicial()
+        return serie
+
+    def incrementar(self, nombre, valor=1, **etiquetas):
+        """Suma ``valor`` a un contador."""
+        with self._lock:
+            clave = (nombre, tuple(sorted(etiquetas.items())))
+            self._series[clave] = self._series.get(clave, 0) + valor
+
+    def fijar(self, nombre, valor, **etiquetas):
+        """Fija el valor instantáneo de una métrica de tipo gauge."""
+        with self._lock:
+            self._series[(nombre, tuple(sorted(etiquetas.items())))] = valor
+
+    def observar(self, nombre, valor, **etiquetas):
+        """Añade una observación (en segundos) a un histograma."""
+        with self._lock:
+            serie = self._serie(nombre, etiquetas, lambda: [[0] * (len(LIMITES_HISTOGRAMA) + 1), 0.0, 0])
+            serie[0][bisect.bisect_left(LIMITES_HISTOGRAMA, valor)] += 1
+            serie[1] += valor
+            serie[2] += 1
+
+    def limpiar(self):
+        """Borra todas las series (las descripciones se conservan)."""
+        with self._lock:
+            self._series.clear()
+
+    def instantanea(self):
+        """
+        Devuelve las series actuales.
+
+        Returns:
+            dict: {nombre: [(etiquetas, valor)]}; en los histogramas el valor
+            es {'suma', 'cuenta', 'buckets'}
+        """
+        for colector in self._colectores:
+            colector(self)
+        with self._lock:
+            series = list(self._series.items())
+        resultado = {}
+        for (nombre, etiquetas), valor in sorted(series):
+            if isinstance(valor, list):
+                valor = {'suma': valor[1], 'cuenta': valor[2], 'buckets': list(valor[0])}
+            resultado.setdefault(nombre, []).append((dict(etiquetas), valor))
+        return resultado
+
+    def texto_prometheus(self):
+        """
+        Serializa las métricas en el formato de texto de Prometheus (0.0.4).
+
+        Returns:
+            str: Texto listo para servir en ``/metrics`` o para el textfile collector
+        """
+        lineas = []
+        for nombre, series in self.instantanea().items():
+            tipo, ayuda = self._descripciones.get(nombre, ('untyped', ''))
+            lineas.append(f"# HELP {nombre} {ayuda}")
+            lineas.append(f"# TYPE {nombre} {tipo}")
+            for etiquetas, valor in series:
+                if tipo != 'histogram':
+                    lineas.append(f"{nombre}{_etiquetas(etiquetas)} {valor}")
+                    continue
+                acumulado = 0
+                for limite, cuenta in zip(LIMITES_HISTOGRAMA + ('+Inf',), valor['buckets']):
+                    acumulado += cuenta
+                    lineas.append(f"{nombre}_bucket{_etiquetas({**etiquetas, 'le': limite})} {acumulado}")
+                lineas.append(f"{nombre}_sum{_etiquetas(etiquetas)} {valor['suma']}")
+                lineas.append(f"{nombre}_count{_etiquetas(etiquetas)} {valor['cuenta']}")
+        return '\n'.join(lineas) + '\n'
+
+
+def _etiquetas(etiquetas):
+    if not etiquetas:
+        return ''
+    pares = ','.join(
+        f'{clave}="{str(valor).replace(chr(92), chr(92) * 2).replace(chr(34), chr(92) + chr(34))}"'
+        for clave, valor in etiquetas.items()
+    )
+    return f"{{{pares}}}"
+
+
+REGISTRO = RegistroMetricas()
+REGISTRO.describir('nba_etapa_segundos', 'histogram',
+                   'Duración de cada etapa (validacion, http, json, procesar, graficos, html)')
+REGISTRO.describir('nba_rerun_segundos', 'histogram', 'Duración de cada rerun de la app (script o fragmento)')
+REGISTRO.describir('nba_reruns_total', 'counter', 'Reruns medidos de la app')
+
+
+class _Tramo:
+    __slots__ = ('etapa', 'inicio')
+
+    def __init__(self, etapa):
+        self.etapa = etapa
+
+    def __enter__(self):
+        self.inicio = time.perf_counter()
+        return self
+
+    def __exit__(self, *excepcion):
+        registrar_tramo(self.etapa, time.perf_counter() - self.inicio)
+
+
+def tramo(etapa):
+    """
+    Contexto que mide una etapa: ``with tramo('http'): ...``
+
+    Args:
+        etapa (str): Una de ETAPAS
+
+    Returns:
+        Contexto de medición, o uno vacío compartido si la instrumentación está desactivada
+    """
+    if not _activas:
+        return _VACIO
+    return _Tramo(etapa)
+
+
+def medido(etapa):
+    """Decorador que mide cada llamada a la función como un tramo de ``etapa``."""
+    def decorador(func):
+        @functools.wraps(func)
+        def envoltura(*args, **kwargs):
+            if not _activas:
+                return func(*args, **kwargs)
+            with _Tramo(etapa):
+                return func(*args, **kwargs)
+        return envoltura
+    return decorador
+
+
+def registrar_tramo(etapa, duracion):
+    """Registra un tramo ya medido en el histograma del proceso y en el rerun en curso."""
+    REGISTRO.observar('nba_etapa_segundos', duracion, etapa=etapa)
+    rerun = _RERUN_ACTUAL.get()
+    if rerun is not None:
+        rerun.tramos.append((etapa, duracion))
+
+
+class Rerun:
+    """
+    Tramos de un rerun de la app.
+
+    Attributes:
+        tipo (str): 'script' (script completo) o 'fragmento'
+        tramos (list): (etapa, segundos) en orden de finalización
+        duracion (float): Segundos del rerun completo (al salir del contexto)
+    """
+
+    def __init__(self, tipo):
+        self.tipo = tipo
+        self.tramos = []
+        self.duracion = None
+
+    def __enter__(self):
+        self.instante = time.time()
+        self._inicio = time.perf_counter()
+        self._token = _RERUN_ACTUAL.set(self)
+        return self
+
+    def __exit__(self, *excepcion):
+        self.duracion = time.perf_counter() - self._inicio
+        _RERUN_ACTUAL.reset(self._token)
+        REGISTRO.incrementar('nba_reruns_total', tipo=self.tipo)
+        REGISTRO.observar('nba_rerun_segundos', self.duracion, tipo=self.tipo)
+        exportar(self)
+
+    def transcurrido(self):
+        """Segundos desde el inicio del rerun (o su duración si ya terminó)."""
+        return self.duracion if self.duracion is not None else time.perf_counter() - self._inicio
+
+    def por_etapa(self):
+        """
+        Suma los tramos por etapa.
+
+        Returns:
+            dict: {etapa: (segundos, número de tramos)} en el orden de ETAPAS
+        """
+        totales = {}
+        for etapa, duracion in self.tramos:
+            segundos, cuenta = totales.get(etapa, (0.0, 0))
+            totales[etapa] = (segundos + duracion, cuenta + 1)
+        orden = {etapa: i for i, etapa in enumerate(ETAPAS)}
+        return dict(sorted(totales.items(), key=lambda item: orden.get(item[0], len(orden))))
+
+    def como_dict(self):
+        """Representación JSON del rerun (una línea del archivo JSON lines)."""
+        return {
+            'instante': round(self.instante, 3),
+            'tipo': self.tipo,
+            'duracion_ms': round(self.transcurrido() * 1000, 2),
+            'etapas_ms': {etapa: round(s * 1000, 2) for etapa, (s, _) in self.por_etapa().items()},
+            'tramos': [[etapa, round(duracion * 1000, 2)] for etapa, duracion in self.tramos]
+        }
+
+
+def medir_rerun(tipo='script'):
+    """
+    Contexto que agrupa los tramos de un rerun y los exporta al terminar.
+
+    Dentro de otro rerun (el fragmento del duelo cuando se ejecuta como parte
+    del script completo) no abre uno nuevo. Los hilos de trabajo que deban
+    sumar sus tramos al rerun tienen que ejecutarse con
+    ``contextvars.copy_context().run``.
+
+    Args:
+        tipo (str): 'script' o 'fragmento'
+
+    Returns:
+        Rerun, o un contexto vacío (``as`` devuelve None) si la instrumentación
+        está desactivada o ya hay un rerun en curso
+    """
+    if not _activas or _RERUN_ACTUAL.get() is not None:
+        return _VACIO
+    return Rerun(tipo)
+
+
+def rerun_actual():
+    """Devuelve el Rerun en curso en este contexto, o None."""
+    return _RERUN_ACTUAL.get()
+
+
+_LOCK_EXPORTACION = threading.Lock()
+
+
+def exportar(rerun, ruta_jsonl=None, ruta_prometheus=None):
+    """
+    Añade el rerun al archivo JSON lines y reescribe el archivo de Prometheus.
+
+    Por defecto usa METRICAS_JSONL y METRICAS_PROMETHEUS; si no están
+    configurados, no escribe nada. El archivo de Prometheus se reemplaza de
+    forma atómica, como espera el textfile collector de node_exporter.
+
+    Args:
+        rerun (Rerun): Rerun terminado
+        ruta_jsonl (str): Archivo JSON lines (una línea por rerun)
+        ruta_prometheus (str): Archivo con el texto de Prometheus de todo el proceso
+    """
+    ruta_jsonl = ruta_jsonl or METRICAS_JSONL
+    ruta_prometheus = ruta_prometheus or METRICAS_PROMETHEUS
+    if not ruta_jsonl and not ruta_prometheus:
+        return
+    with _LOCK_EXPORTACION:
+        if ruta_jsonl:
+            with open(ruta_jsonl, 'a', encoding='utf-8') as archivo:
+                archivo.write(json.dumps(rerun.como_dict(), ensure_ascii=False) + '\n')
+        if ruta_prometheus:
+            temporal = f"{ruta_prometheus}.{os.getpid()}.tmp"
+            with open(temporal, 'w', encoding='utf-8') as archivo:
+                archivo.write(REGISTRO.texto_prometheus())
+            os.replace(temporal, ruta_prometheus)
@@ -0,0 +1,90 @@
+"""
+Utilidades puras para manejo de temporadas de la NBA
+"""
+
+import re
+from datetime import datetime
+
+PATRON_TEMPORADA = re.compile(r'([0-9]{4})-([0-9]{2})')
+
+
+def obtener_temporada_actual():
+    """
+    Determina automáticamente la temporada actual de la NBA.
+    La temporada NBA generalmente va de octubre (año X) a junio (año X+1).
+    Ejemplo: Octubre 2024 - Junio 2025 = temporada "2024-25"
+    
+    Returns:
+        str: Temporada actual en formato "YYYY-YY"
+    """
+    ahora = datetime.now()
+    mes_actual = ahora.month
+    año_actual = ahora.year
+    
+    # Si estamos entre octubre y diciembre, la temporada comenzó este año
+    # Si estamos entre enero y junio, la temporada comenzó el año pasado
+    if mes_actual >= 10:  # Octubre, Noviembre, Diciembre
+        año_inicio = año_actual
+    else:  # Enero - Septiembre
+        año_inicio = año_actual - 1
+    
+    año_fin = año_inicio + 1
+    # Formato: "2024-25"
+    temporada = f"{año_inicio}-{str(año_fin)[-2:]}"
+    
+    return temporada
+
+
+def temporada_anterior(temporada):
+    """
+    Devuelve la temporada previa a una dada.
+    
+    Args:
+        temporada (str): Temporada en formato "YYYY-YY"
+        
+    Returns:
+        str: Temporada anterior en formato "YYYY-YY" (p. ej. "2023-24" -> "2022-23")
+    """
+    año_inicio = int(temporada.split('-')[0])
+    return f"{año_inicio - 1}-{str(año_inicio)[-2:]}"
+
+
+def generar_lista_temporadas(temporada_base, num_temporadas=4):
+    """
+    Genera una lista de temporadas recientes basada en una temporada base.
+    
+    Args:
+        temporada_base (str): Temporada base en formato "YYYY-YY"
+        num_temporadas (int): Número de temporadas a generar
+        
+    Returns:
+        list: Lista de temporadas en formato ["YYYY-YY", ...]
+    """
+    año_inicio = int(temporada_base.split('-')[0])
+    temporadas = []
+    
+    for i in range(num_temporadas):
+        año = año_inicio - i
+        año_sig = año + 1
+        temporadas.append(f"{año}-{str(año_sig)[-2:]}")
+    
+    return temporadas
+
+
+def temporada_valida(temporada):
+    """
+    Indica si una cadena es una temporada bien formada.
+    
+    Además del formato "YYYY-YY", exige que el sufijo sea el año siguiente
+    (``"2024-25"`` es válida, ``"2024-13"`` no).
+    
+    Args:
+        temporada (str): Temporada a comprobar
+        
+    Returns:
+        bool: True si la temporada es válida
+    """
+    coincidencia = PATRON_TEMPORADA.fullmatch(temporada)
+    if coincidencia is None:
+        return False
+    return int(coincidencia.group(2)) == (int(coincidencia.group(1)) + 1) % 100
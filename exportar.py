@@ -0,0 +1,86 @@
+"""
+Exportación por lotes, sin navegador: equipos, duelos y probabilidades de las últimas temporadas.
+
+Para cada temporada escribe ``<destino>/temporada=YYYY-YY/equipos`` y
+``duelos`` (todos los pares ordenados de equipos con las métricas de ambos,
+quién es mejor en cada una y la probabilidad de victoria), en Parquet o CSV.
+Las temporadas se procesan en paralelo en procesos de trabajo; las que ya
+tienen manifiesto del mismo formato se saltan, así que una ejecución
+interrumpida se reanuda volviendo a lanzar el mismo comando. Si una temporada
+falla (sin datos o con una excepción en su worker) se informa y el resto sigue.
+
+Uso:
+    python exportar.py [--temporadas 4] [--desde 2024-25] [--destino datos/exportacion]
+                       [--formato parquet|csv] [--workers 4] [--forzar]
+"""
+
+import argparse
+import multiprocessing
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from config import EXPORT_DIR, MAX_WORKERS_CARGA, NUM_TEMPORADAS_RECIENTES
+from core.exportacion import FORMATOS, exportar_temporada, parquet_disponible, temporada_completada
+from core.temporadas import generar_lista_temporadas, obtener_temporada_actual
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--temporadas', type=int, default=NUM_TEMPORADAS_RECIENTES,
+                        help='Número de temporadas hacia atrás desde --desde')
+    parser.add_argument('--desde', default=None, help='Temporada más reciente (por defecto la actual)')
+    parser.add_argument('--destino', default=EXPORT_DIR)
+    parser.add_argument('--formato', choices=FORMATOS, default='parquet')
+    parser.add_argument('--workers', type=int, default=MAX_WORKERS_CARGA)
+    parser.add_argument('--forzar', action='store_true', help='Reexporta también las temporadas completadas')
+    args = parser.parse_args()
+
+    if args.formato == 'parquet' and not parquet_disponible():
+        parser.error("Parquet requiere pyarrow (pip install pyarrow); usa --formato csv")
+
+    temporadas = generar_lista_temporadas(args.desde or obtener_temporada_actual(), args.temporadas)
+    pendientes = [t for t in temporadas if args.forzar or not temporada_completada(args.destino, t, args.formato)]
+    for temporada in temporadas:
+        if temporada not in pendientes:
+            print(f"⏭️  {temporada}: ya exportada en {args.formato}")
+    if not pendientes:
+        print("Nada que exportar (usa --forzar para reexportar)")
+        return
+
+    inicio = time.perf_counter()
+    total_duelos = 0
+    fallidas = []
+    # 'spawn' evita heredar locks o sesiones HTTP del proceso principal
+    contexto = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=min(args.workers, len(pendientes)), mp_context=contexto) as executor:
+        futuros = {executor.submit(exportar_temporada, t, args.destino, args.formato): t for t in pendientes}
+        for hechas, futuro in enumerate(as_completed(futuros), start=1):
+            try:
+                resumen = futuro.result()
+            except Exception as error:  # Un worker que falla no aborta el resto de temporadas
+                fallidas.append(futuros[futuro])
+                print(f"[{hechas}/{len(pendientes)}] ❌ {futuros[futuro]}: {type(error).__name__}: {error}")
+                continue
+            for evento in resumen['eventos']:
+                print(f"   {evento.temporada}: {evento.mensaje}")
+            if not resumen['ok']:
+                fallidas.append(resumen['temporada'])
+                print(f"[{hechas}/{len(pendientes)}] ❌ {resumen['temporada']}: sin datos")
+                continue
+            total_duelos += resumen['duelos']
+            transcurrido = time.perf_counter() - inicio
+            print(f"[{hechas}/{len(pendientes)}] ✅ {resumen['temporada']}: {resumen['equipos']} equipos, "
+                  f"{resumen['duelos']:,d} duelos en {resumen['segundos']:.2f} s · "
+                  f"{total_duelos / transcurrido:,.0f} duelos/s acumulado")
+
+    total = time.perf_counter() - inicio
+    print(f"Exportadas {len(pendientes) - len(fallidas)}/{len(pendientes)} temporadas, "
+          f"{total_duelos:,d} duelos en {total:.1f} s en {args.destino}")
+    if fallidas:
+        print(f"Temporadas fallidas (se reintentarán en la próxima ejecución): {', '.join(fallidas)}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
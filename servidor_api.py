@@ -0,0 +1,47 @@
+"""
+Servidor de la API JSON de estadísticas, comparaciones y probabilidades de victoria.
+
+Sirve desde memoria los mismos números que muestra el dashboard (ver
+``core/api.py`` para las rutas). Las temporadas se cargan del snapshot local o
+de la API de NBA la primera vez que se piden, o al arrancar con --precargar.
+Con --metricas (o NBA_METRICAS=1) se miden las etapas de cada carga y
+``GET /metricas`` las sirve en formato Prometheus.
+
+Uso:
+    python servidor_api.py [--host 127.0.0.1] [--puerto 8600] [--precargar 2024-25 2023-24] [--metricas]
+"""
+
+import argparse
+import asyncio
+
+from config import API_HOST, API_PUERTO
+from core import telemetria
+from core.api import ServicioAPI, servir
+
+
+async def _ejecutar(args):
+    servicio = ServicioAPI()
+    servidor = await servir(args.host, args.puerto, servicio, temporadas_precarga=args.precargar)
+    direcciones = ', '.join(f"http://{s.getsockname()[0]}:{s.getsockname()[1]}" for s in servidor.sockets)
+    print(f"API escuchando en {direcciones} (temporadas precargadas: {', '.join(args.precargar) or 'ninguna'})")
+    async with servidor:
+        await servidor.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--host', default=API_HOST)
+    parser.add_argument('--puerto', type=int, default=API_PUERTO)
+    parser.add_argument('--precargar', nargs='*', default=[], metavar='TEMPORADA')
+    parser.add_argument('--metricas', action='store_true', help='Mide las etapas de carga (GET /metricas)')
+    args = parser.parse_args()
+    if args.metricas:
+        telemetria.activar()
+    try:
+        asyncio.run(_ejecutar(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,7 @@
+"""
+Servidor local que imita stats.nba.com para desarrollo y pruebas de rendimiento sin red
+
+- ``fixtures``: payloads ``resultSets`` grabados (o sintéticos deterministas)
+- ``servidor``: servidor HTTP que los reproduce con latencia y fallos configurables
+- ``grabar``: graba fixtures desde stats.nba.com o desde los snapshots locales
+"""
@@ -0,0 +1,150 @@
+"""
+Fixtures de stats.nba.com: payloads ``resultSets`` por endpoint y parámetros
+
+Un fixture es la respuesta JSON completa de un endpoint guardada en
+``<directorio>/<endpoint>/<clave>.json``. La clave sale de los parámetros que
+distinguen una respuesta (temporada, tipo de medida, tipo de temporada); si no
+hay fixture exacto se usa ``<endpoint>/<temporada>.json`` y, si tampoco
+existe, un payload sintético determinista (misma temporada, mismos números).
+"""
+
+import json
+import os
+import re
+
+import numpy as np
+
+# Parámetros que forman la clave del fixture, en orden
+PARAMETROS_CLAVE = ('Season', 'MeasureType', 'SeasonType')
+
+# Los 30 equipos con su TEAM_ID oficial
+EQUIPOS_NBA = (
+    (1610612737, 'Atlanta Hawks'), (1610612738, 'Boston Celtics'), (1610612739, 'Cleveland Cavaliers'),
+    (1610612740, 'New Orleans Pelicans'), (1610612741, 'Chicago Bulls'), (1610612742, 'Dallas Mavericks'),
+    (1610612743, 'Denver Nuggets'), (1610612744, 'Golden State Warriors'), (1610612745, 'Houston Rockets'),
+    (1610612746, 'LA Clippers'), (1610612747, 'Los Angeles Lakers'), (1610612748, 'Miami Heat'),
+    (1610612749, 'Milwaukee Bucks'), (1610612750, 'Minnesota Timberwolves'), (1610612751, 'Brooklyn Nets'),
+    (1610612752, 'New York Knicks'), (1610612753, 'Orlando Magic'), (1610612754, 'Indiana Pacers'),
+    (1610612755, 'Philadelphia 76ers'), (1610612756, 'Phoenix Suns'), (1610612757, 'Portland Trail Blazers'),
+    (1610612758, 'Sacramento Kings'), (1610612759, 'San Antonio Spurs'), (1610612760, 'Oklahoma City Thunder'),
+    (1610612761, 'Toronto Raptors'), (1610612762, 'Utah Jazz'), (1610612763, 'Memphis Grizzlies'),
+    (1610612764, 'Washington Wizards'), (1610612765, 'Detroit Pistons'), (1610612766, 'Charlotte Hornets')
+)
+
+# Columnas de leaguedashteamstats que usa la app (unión de las medidas Base y Advanced)
+COLUMNAS_EQUIPOS = (
+    'TEAM_ID', 'TEAM_NAME', 'GP', 'W', 'L', 'W_PCT', 'AST', 'TOV', 'FG3_PCT',
+    'PACE', 'E_OFF_RATING', 'E_DEF_RATING'
+)
+
+# Generadores de payloads sintéticos por endpoint
+GENERADORES = {}
+
+
+def _nombre_seguro(texto):
+    return re.sub(r'[^A-Za-z0-9_.-]+', '_', texto)
+
+
+def clave_fixture(parametros):
+    """
+    Devuelve la clave de archivo de un fixture a partir de los parámetros de la petición.
+
+    Args:
+        parametros (dict): Parámetros de la query string (valores simples)
+
+    Returns:
+        str: Clave, p. ej. "2023-24_Advanced_Regular_Season"
+    """
+    return '_'.join(_nombre_seguro(parametros[p]) for p in PARAMETROS_CLAVE if parametros.get(p))
+
+
+def ruta_fixture(directorio, endpoint, parametros):
+    """Devuelve la ruta del fixture exacto de una petición."""
+    return os.path.join(directorio, endpoint.lower(), f"{clave_fixture(parametros)}.json")
+
+
+def guardar_fixture(directorio, endpoint, parametros, payload):
+    """
+    Guarda un payload como fixture (escritura atómica).
+
+    Args:
+        directorio (str): Carpeta raíz de fixtures
+        endpoint (str): Nombre del endpoint, p. ej. "leaguedashteamstats"
+        parametros (dict): Parámetros de la petición grabada
+        payload (dict): Respuesta JSON completa
+
+    Returns:
+        str: Ruta del fixture guardado
+    """
+    ruta = ruta_fixture(directorio, endpoint, parametros)
+    os.makedirs(os.path.dirname(ruta), exist_ok=True)
+    with open(f"{ruta}.tmp", 'w', encoding='utf-8') as archivo:
+        json.dump(payload, archivo, ensure_ascii=False)
+    os.replace(f"{ruta}.tmp", ruta)
+    return ruta
+
+
+def cargar_fixture(directorio, endpoint, parametros, sinteticos=True):
+    """
+    Busca la respuesta de una petición: fixture exacto, fixture de la temporada o sintético.
+
+    Args:
+        directorio (str): Carpeta raíz de fixtures
+        endpoint (str): Nombre del endpoint
+        parametros (dict): Parámetros de la petición
+        sinteticos (bool): Si True, genera un payload cuando no hay fixture
+
+    Returns:
+        tuple: (payload en bytes o None si no hay respuesta, origen: 'fixture' | 'sintetico' | None)
+    """
+    candidatas = [ruta_fixture(directorio, endpoint, parametros)]
+    if parametros.get('Season'):
+        candidatas.append(os.path.join(directorio, endpoint.lower(), f"{_nombre_seguro(parametros['Season'])}.json"))
+    for ruta in candidatas:
+        if os.path.exists(ruta):
+            with open(ruta, 'rb') as archivo:
+                return archivo.read(), 'fixture'
+
+    generador = GENERADORES.get(endpoint.lower())
+    if sinteticos and generador is not None:
+        return json.dumps(generador(parametros)).encode('utf-8'), 'sintetico'
+    return None, None
+
+
+def payload_resultsets(endpoint, parametros, nombre, columnas, filas):
+    """Envuelve filas en el formato de respuesta de stats.nba.com."""
+    return {
+        'resource': endpoint,
+        'parameters': parametros,
+        'resultSets': [{'name': nombre, 'headers': list(columnas), 'rowSet': filas}]
+    }
+
+
+def equipos_sinteticos(temporada):
+    """
+    Genera estadísticas plausibles y deterministas de los 30 equipos para una temporada.
+
+    Args:
+        temporada (str): Temporada en formato "YYYY-YY" (fija la semilla)
+
+    Returns:
+        list: Filas en el orden de COLUMNAS_EQUIPOS
+    """
+    rng = np.random.default_rng(int(temporada[:4]))
+    victorias = rng.integers(15, 65, len(EQUIPOS_NBA))
+    filas = []
+    for (team_id, nombre), w in zip(EQUIPOS_NBA, victorias.tolist()):
+        filas.append([
+            team_id, nombre, 82, w, 82 - w, round(w / 82, 3),
+            round(rng.normal(26, 2), 1), round(rng.normal(13, 1), 1), round(rng.normal(0.36, 0.02), 3),
+            round(rng.normal(99, 2), 2), round(rng.normal(114, 3), 1), round(rng.normal(114, 3), 1)
+        ])
+    return filas
+
+
+def _leaguedashteamstats(parametros):
+    filas = equipos_sinteticos(parametros.get('Season', '2023-24'))
+    return payload_resultsets('leaguedashteamstats', parametros, 'LeagueDashTeamStats', COLUMNAS_EQUIPOS, filas)
+
+
+GENERADORES['leaguedashteamstats'] = _leaguedashteamstats
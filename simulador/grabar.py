@@ -0,0 +1,104 @@
+"""
+Graba fixtures para el simulador desde stats.nba.com o desde los snapshots locales.
+
+- Desde la API: repite las peticiones de la app (medidas Base y Advanced) y
+  guarda cada respuesta completa tal cual.
+- Desde snapshots (--desde-snapshots): convierte los CSV de datos/snapshots,
+  que ya son datos reales descargados, en un fixture por temporada.
+
+Uso:
+    python -m simulador.grabar --temporadas 2024-25 2023-24 [--fixtures datos/fixtures]
+    python -m simulador.grabar --desde-snapshots
+"""
+
+import argparse
+
+import requests
+
+from config import (
+    FIXTURES_DIR,
+    NBA_API_BASE_URL,
+    NBA_DEFAULT_SEASON_TYPE,
+    NBA_HEADERS,
+    NBA_LEAGUE_ID,
+    REQUEST_CONNECT_TIMEOUT,
+    REQUEST_READ_TIMEOUT
+)
+from core.snapshots import cargar_snapshot, listar_snapshots
+from .fixtures import guardar_fixture, payload_resultsets
+
+ENDPOINT = 'leaguedashteamstats'
+MEDIDAS = ('Base', 'Advanced')
+
+
+def grabar_desde_api(temporadas, directorio):
+    """
+    Descarga y guarda las respuestas de ``leaguedashteamstats`` de cada temporada y medida.
+
+    Args:
+        temporadas (list): Temporadas en formato "YYYY-YY"
+        directorio (str): Carpeta raíz de fixtures
+
+    Returns:
+        list: Rutas de los fixtures guardados
+    """
+    rutas = []
+    with requests.Session() as sesion:
+        for temporada in temporadas:
+            for medida in MEDIDAS:
+                parametros = {
+                    'LeagueID': NBA_LEAGUE_ID,
+                    'MeasureType': medida,
+                    'PerMode': 'PerGame',
+                    'Season': temporada,
+                    'SeasonType': NBA_DEFAULT_SEASON_TYPE,
+                    'PORound': '0'
+                }
+                respuesta = sesion.get(
+                    NBA_API_BASE_URL, headers=NBA_HEADERS, params=parametros,
+                    timeout=(REQUEST_CONNECT_TIMEOUT, REQUEST_READ_TIMEOUT)
+                )
+                respuesta.raise_for_status()
+                rutas.append(guardar_fixture(directorio, ENDPOINT, parametros, respuesta.json()))
+    return rutas
+
+
+def grabar_desde_snapshots(directorio):
+    """
+    Convierte cada snapshot local en el fixture genérico de su temporada.
+
+    Args:
+        directorio (str): Carpeta raíz de fixtures
+
+    Returns:
+        list: Rutas de los fixtures guardados
+    """
+    rutas = []
+    for temporada in listar_snapshots():
+        df_nba = cargar_snapshot(temporada)
+        payload = payload_resultsets(
+            ENDPOINT, {'Season': temporada}, 'LeagueDashTeamStats',
+            df_nba.columns, df_nba.astype(object).where(df_nba.notna(), None).values.tolist()
+        )
+        rutas.append(guardar_fixture(directorio, ENDPOINT, {'Season': temporada}, payload))
+    return rutas
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--temporadas', nargs='*', default=[])
+    parser.add_argument('--desde-snapshots', action='store_true')
+    parser.add_argument('--fixtures', default=FIXTURES_DIR)
+    args = parser.parse_args()
+
+    if not args.temporadas and not args.desde_snapshots:
+        parser.error("Indica --temporadas o --desde-snapshots")
+
+    rutas = grabar_desde_snapshots(args.fixtures) if args.desde_snapshots else []
+    rutas += grabar_desde_api(args.temporadas, args.fixtures)
+    for ruta in rutas:
+        print(f"✅ {ruta}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,265 @@
+"""
+Servidor local que reproduce stats.nba.com con latencia y fallos configurables.
+
+Responde ``GET /stats/<endpoint>?...`` con el fixture grabado de esa petición
+(o un payload sintético determinista) y, según la configuración de fallos,
+añade latencia, devuelve 500 o 429, o retiene la respuesta hasta provocar un
+timeout en el cliente. La configuración puede cambiarse en caliente:
+
+    GET  /__estado   configuración y contadores por resultado
+    POST /__fallos   {"tasa_error": 0.1, "latencia": 0.2, ...} (campos de ConfiguracionFallos)
+
+Para apuntar la app, la exportación o la API al simulador:
+    NBA_STATS_URL=http://127.0.0.1:8700/stats streamlit run app.py
+
+Uso:
+    python -m simulador.servidor [--puerto 8700] [--latencia 0.05] [--jitter 0.02]
+                                 [--tasa-error 0] [--tasa-429 0] [--tasa-timeout 0] [--semilla 0]
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+from collections import Counter
+from dataclasses import asdict, dataclass, fields
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+from config import FIXTURES_DIR, SIMULADOR_PUERTO
+from .fixtures import cargar_fixture
+
+
+@dataclass
+class ConfiguracionFallos:
+    """
+    Comportamiento del simulador.
+
+    Attributes:
+        latencia (float): Segundos de espera antes de cada respuesta
+        jitter (float): Segundos adicionales aleatorios (uniforme entre 0 y jitter)
+        tasa_error (float): Probabilidad de responder 500
+        tasa_429 (float): Probabilidad de responder 429 (rate limit)
+        tasa_timeout (float): Probabilidad de retener la respuesta ``duracion_timeout`` segundos
+        duracion_timeout (float): Segundos que se retiene una respuesta con timeout
+        sinteticos (bool): Generar payloads cuando no hay fixture
+        semilla (int): Semilla del generador de fallos (misma semilla, misma secuencia)
+    """
+    latencia: float = 0.0
+    jitter: float = 0.0
+    tasa_error: float = 0.0
+    tasa_429: float = 0.0
+    tasa_timeout: float = 0.0
+    duracion_timeout: float = 60.0
+    sinteticos: bool = True
+    semilla: int = 0
+
+    def actualizar(self, cambios):
+        """
+        Aplica un dict de cambios validando nombres y tipos.
+
+        Todos los campos se convierten antes de aplicar ninguno: un cambio
+        inválido no deja la configuración a medias.
+
+        Raises:
+            TypeError: ``cambios`` no es un dict (p. ej. un cuerpo JSON ``[1]``)
+            ValueError: Campo desconocido o valor no convertible a su tipo
+        """
+        if not isinstance(cambios, dict):
+            raise TypeError(f"Se esperaba un objeto JSON, no {type(cambios).__name__}")
+        tipos = {campo.name: campo.type for campo in fields(self)}
+        convertidos = {}
+        for nombre, valor in cambios.items():
+            if nombre not in tipos:
+                raise ValueError(f"Campo desconocido: {nombre}")
+            convertidos[nombre] = _convertir(nombre, tipos[nombre], valor)
+        for nombre, valor in convertidos.items():
+            setattr(self, nombre, valor)
+
+
+def _convertir(nombre, tipo, valor):
+    """Convierte ``valor`` al tipo del campo; los bool solo admiten true/false/1/0."""
+    if tipo is bool:
+        if isinstance(valor, bool):
+            return valor
+        texto = str(valor).strip().lower()
+        if texto in ('true', '1'):
+            return True
+        if texto in ('false', '0'):
+            return False
+        raise ValueError(f"{nombre}: se esperaba true/false/1/0, no {valor!r}")
+    try:
+        return tipo(valor)
+    except (TypeError, ValueError):
+        raise ValueError(f"{nombre}: {valor!r} no es un {tipo.__name__} válido")
+
+
+class SimuladorNBA(ThreadingHTTPServer):
+    """Servidor HTTP con la configuración de fallos, el generador aleatorio y los contadores compartidos."""
+
+    daemon_threads = True
+
+    def __init__(self, direccion, configuracion, directorio_fixtures=FIXTURES_DIR):
+        super().__init__(direccion, ManejadorSimulador)
+        self.configuracion = configuracion
+        self.directorio_fixtures = directorio_fixtures
+        self.contadores = Counter()
+        self._rng = random.Random(configuracion.semilla)
+        self._lock = threading.Lock()
+
+    def sortear(self):
+        """
+        Decide el resultado y la latencia de una petición.
+
+        Returns:
+            tuple: (resultado: 'ok' | 'error' | '429' | 'timeout', segundos de espera)
+        """
+        c = self.configuracion
+        with self._lock:
+            espera = c.latencia + self._rng.uniform(0, c.jitter)
+            tirada = self._rng.random()
+        for resultado, tasa in (('timeout', c.tasa_timeout), ('429', c.tasa_429), ('error', c.tasa_error)):
+            if tirada < tasa:
+                return resultado, espera
+            tirada -= tasa
+        return 'ok', espera
+
+    def contar(self, resultado):
+        with self._lock:
+            self.contadores[resultado] += 1
+
+    def reiniciar_semilla(self):
+        with self._lock:
+            self._rng = random.Random(self.configuracion.semilla)
+
+
+class ManejadorSimulador(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, formato, *args):
+        pass  # Sin una línea por petición: el simulador se usa en pruebas de carga
+
+    def _enviar(self, estado, cuerpo, cabeceras=None):
+        self.send_response(estado)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(cuerpo)))
+        for nombre, valor in (cabeceras or {}).items():
+            self.send_header(nombre, valor)
+        self.end_headers()
+        self.wfile.write(cuerpo)
+
+    def _enviar_json(self, estado, datos, cabeceras=None):
+        self._enviar(estado, json.dumps(datos, ensure_ascii=False).encode('utf-8'), cabeceras)
+
+    def do_GET(self):
+        partes = urlsplit(self.path)
+        if partes.path == '/__estado':
+            self._enviar_json(200, {
+                'configuracion': asdict(self.server.configuracion),
+                'contadores': dict(self.server.contadores)
+            })
+            return
+        if not partes.path.startswith('/stats/'):
+            self._enviar_json(404, {'Message': f"Ruta desconocida: {partes.path}"})
+            return
+
+        endpoint = partes.path[len('/stats/'):].strip('/')
+        parametros = dict(parse_qsl(partes.query, keep_blank_values=True))
+        resultado, espera = self.server.sortear()
+        time.sleep(espera)
+
+        if resultado == 'timeout':
+            self.server.contar('timeout')
+            time.sleep(self.server.configuracion.duracion_timeout)
+            self.close_connection = True
+            return
+        if resultado == '429':
+            self.server.contar('429')
+            self._enviar_json(429, {'Message': 'Too Many Requests'}, {'Retry-After': '1'})
+            return
+        if resultado == 'error':
+            self.server.contar('error')
+            self._enviar_json(500, {'Message': 'An error has occurred.'})
+            return
+
+        payload, origen = cargar_fixture(
+            self.server.directorio_fixtures, endpoint, parametros, self.server.configuracion.sinteticos
+        )
+        if payload is None:
+            self.server.contar('sin_fixture')
+            self._enviar_json(400, {'Message': f"Sin fixture para {endpoint} {parametros}"})
+            return
+        self.server.contar(origen)
+        self._enviar(200, payload)
+
+    def do_POST(self):
+        if urlsplit(self.path).path != '/__fallos':
+            self._enviar_json(404, {'Message': 'Ruta desconocida'})
+            return
+        try:
+            longitud = int(self.headers.get('Content-Length', 0))
+            if longitud < 0:  # rfile.read(-n) leería hasta que el cliente cierre
+                raise ValueError('Content-Length inválido')
+            cambios = json.loads(self.rfile.read(longitud) or b'{}')
+            self.server.configuracion.actualizar(cambios)
+        except (ValueError, TypeError) as e:
+            self._enviar_json(400, {'Message': str(e)})
+            return
+        if 'semilla' in cambios:
+            self.server.reiniciar_semilla()
+        self._enviar_json(200, asdict(self.server.configuracion))
+
+
+def arrancar(host='127.0.0.1', puerto=SIMULADOR_PUERTO, configuracion=None, directorio_fixtures=FIXTURES_DIR):
+    """
+    Arranca el simulador en un hilo de fondo (útil desde benchmarks y scripts).
+
+    Args:
+        host (str): Interfaz de escucha
+        puerto (int): Puerto (0 = cualquiera libre)
+        configuracion (ConfiguracionFallos): Latencia y fallos (por defecto, ninguno)
+        directorio_fixtures (str): Carpeta raíz de fixtures
+
+    Returns:
+        SimuladorNBA: Servidor en marcha; ``server_address`` tiene el puerto real
+        y ``shutdown()`` lo detiene
+    """
+    servidor = SimuladorNBA((host, puerto), configuracion or ConfiguracionFallos(), directorio_fixtures)
+    threading.Thread(target=servidor.serve_forever, name='simulador-nba', daemon=True).start()
+    return servidor
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--puerto', type=int, default=SIMULADOR_PUERTO)
+    parser.add_argument('--fixtures', default=FIXTURES_DIR)
+    parser.add_argument('--latencia', type=float, default=0.0)
+    parser.add_argument('--jitter', type=float, default=0.0)
+    parser.add_argument('--tasa-error', type=float, default=0.0)
+    parser.add_argument('--tasa-429', type=float, default=0.0)
+    parser.add_argument('--tasa-timeout', type=float, default=0.0)
+    parser.add_argument('--duracion-timeout', type=float, default=60.0)
+    parser.add_argument('--sin-sinteticos', action='store_true', help='Responder 400 si no hay fixture grabado')
+    parser.add_argument('--semilla', type=int, default=0)
+    args = parser.parse_args()
+
+    configuracion = ConfiguracionFallos(
+        latencia=args.latencia, jitter=args.jitter, tasa_error=args.tasa_error, tasa_429=args.tasa_429,
+        tasa_timeout=args.tasa_timeout, duracion_timeout=args.duracion_timeout,
+        sinteticos=not args.sin_sinteticos, semilla=args.semilla
+    )
+    servidor = SimuladorNBA((args.host, args.puerto), configuracion, args.fixtures)
+    print(f"Simulador de stats.nba.com en http://{args.host}:{servidor.server_address[1]}/stats "
+          f"(fixtures: {args.fixtures})", flush=True)
+    try:
+        servidor.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        servidor.server_close()
+
+
+if __name__ == '__main__':
+    main()
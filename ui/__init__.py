@@ -2,7 +2,22 @@
 Módulo UI para componentes reutilizables
 """
 
-from .components import render_comparison_table, render_simple_header, render_metric_card, render_bento_grid
+from .components import (
+    render_comparison_table,
+    render_simple_header,
+    render_metric_card,
+    render_bento_grid,
+    render_leaderboard,
+    render_similar_teams,
+    render_multi_comparison_table,
+    render_page_header,
+    render_sidebar_config,
+    render_sidebar_fuente,
+    render_vs_divider,
+    render_skeleton,
+    render_panel_tiempos,
+    render_panel_caches
+)
 from .styles import apply_custom_styles
 
 __all__ = [
@@ -10,6 +25,16 @@ __all__ = [
     'render_simple_header',
     'render_metric_card',
     'render_bento_grid',
+    'render_leaderboard',
+    'render_similar_teams',
+    'render_multi_comparison_table',
+    'render_page_header',
+    'render_sidebar_config',
+    'render_sidebar_fuente',
+    'render_vs_divider',
+    'render_skeleton',
+    'render_panel_tiempos',
+    'render_panel_caches',
     'apply_custom_styles'
 ]
 
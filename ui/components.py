@@ -2,266 +2,360 @@
 Componentes UI reutilizables para la aplicación - Estilo Betting/Fintech
 """
 
+import numpy as np
 import streamlit as st
 import pandas as pd
 
+from analysis.rankings import formatear_rango
+from core.cache import describir_clave
+from core.comparaciones import comparar_equipos
+from core.metricas import formatear_valor, formato_metrica
+from core.telemetria import medido
+from .templates import (
+    DIVISOR_VS,
+    SIDEBAR_FUENTE,
+    html_badge_rango,
+    html_bento_grid,
+    html_esqueleto,
+    html_header,
+    html_header_duelo,
+    html_sidebar_config
+)
 
-def render_comparison_table(comparacion_df, equipo_a, equipo_b):
+# Estilos de celda para comparaciones (verde = mejor, rojo = peor)
+ESTILO_MEJOR = 'background-color: rgba(0, 255, 136, 0.25); color: #00ff88; font-weight: 700; font-family: monospace; border-left: 3px solid #00ff88; padding-left: 0.5rem;'
+ESTILO_PEOR = 'background-color: rgba(255, 68, 68, 0.25); color: #ff4444; font-weight: 600; font-family: monospace;'
+ESTILO_COLUMNA_MEJOR = 'color: #00d9ff; font-weight: 700; text-align: center; font-family: monospace; font-size: 1rem;'
+
+
+# Categorías de la tabla de comparación, según prioridad para betting
+CATEGORIAS_COMPARACION = {
+    "🎯 Probabilidades Clave": ["Porc. Victoria"],
+    "⚡ Eficiencia Ofensiva": ["Rating Ofensivo", "Asistencias"],
+    "🛡️ Eficiencia Defensiva": ["Rating Defensivo", "Pérdidas"],
+    "🏃 Ritmo de Juego": ["Ritmo de Juego"],
+    "📊 Stats de Creación": ["AST/TO", "3P%"]
+}
+
+
+def _nombre_corto(nombre_completo):
+    """Obtiene un nombre corto del equipo (primera palabra, o primeros 8 caracteres)."""
+    palabras = nombre_completo.split()
+    if len(palabras) > 1:
+        return palabras[0]
+    return nombre_completo[:8]
+
+
+@medido('html')
+def render_comparison_table(comparacion_df, equipo_a, equipo_b, rangos=None):
     """
     Renderiza una tabla de comparación estilo betting - compacta y high-density.
     
+    Todas las categorías van en una sola tabla. El mejor y el peor de cada
+    métrica salen de ``comparar_equipos`` (según la dirección registrada) y
+    los estilos se calculan como una matriz completa que se aplica de una vez,
+    sin callbacks por fila.
+    
     Args:
         comparacion_df (pd.DataFrame): DataFrame con datos de comparación
         equipo_a (str): Nombre del equipo A
         equipo_b (str): Nombre del equipo B
+        rangos (pd.DataFrame): Rankings de liga precalculados (opcional); si se
+            indican, cada valor muestra la posición del equipo en la liga
         
     Returns:
         None
     """
-    # Categorizar métricas según prioridad para betting
-    categorias = {
-        "🎯 Probabilidades Clave": ["Porc. Victoria"],
-        "⚡ Eficiencia Ofensiva": ["Rating Ofensivo", "Asistencias"],
-        "🛡️ Eficiencia Defensiva": ["Rating Defensivo", "Pérdidas"],
-        "🏃 Ritmo de Juego": ["Ritmo de Juego"],
-        "📊 Stats de Creación": ["AST/TO", "3P%"]
-    }
-    
-    # comparacion_df tiene estructura: índice=métricas, columnas=equipos
-    # No necesitamos transponer, trabajamos directamente con comparacion_df
-    
-    # Renderizar cada categoría
-    for categoria, metricas in categorias.items():
-        # Filtrar métricas que existen en el DataFrame
-        metricas_disponibles = [m for m in metricas if m in comparacion_df.index]
-        
-        if not metricas_disponibles:
-            continue
-        
-        st.markdown(f"### {categoria}")
-        
-        # Crear sub-dataframe con las métricas de esta categoría
-        df_categoria = comparacion_df.loc[metricas_disponibles]
-        
-        # Crear lista de datos para el DataFrame con información de mejor/peor
-        filas = []
-        datos_auxiliares = []  # Guardar información adicional para estilos
-        
-        for idx in metricas_disponibles:
-            valor_a = df_categoria.loc[idx, equipo_a]
-            valor_b = df_categoria.loc[idx, equipo_b]
-            
-            # Determinar mejor y peor
-            if 'Defensivo' in idx or 'Pérdidas' in idx:
-                es_mejor_a = valor_a < valor_b
-            else:
-                es_mejor_a = valor_a > valor_b
-            
-            # Formatear valores
-            if '%' in idx or 'Porc' in idx:
-                valor_a_str = f"{valor_a:.1%}"
-                valor_b_str = f"{valor_b:.1%}"
-            elif 'Rating' in idx:
-                valor_a_str = f"{valor_a:.2f}"
-                valor_b_str = f"{valor_b:.2f}"
-            else:
-                valor_a_str = f"{valor_a:.2f}"
-                valor_b_str = f"{valor_b:.2f}"
-            
-            # Representación clara del mejor equipo usando nombres
-            # Extraer nombre corto del equipo (primera palabra o abreviación)
-            def obtener_nombre_corto(nombre_completo):
-                """Obtiene un nombre corto del equipo"""
-                palabras = nombre_completo.split()
-                if len(palabras) > 1:
-                    # Si tiene múltiples palabras, usar la primera
-                    return palabras[0]
-                else:
-                    # Si es una sola palabra, usar primeros 8 caracteres
-                    return nombre_completo[:8]
-            
-            nombre_a_corto = obtener_nombre_corto(equipo_a)
-            nombre_b_corto = obtener_nombre_corto(equipo_b)
-            
-            # Formato más claro: nombre del equipo con flecha direccional
-            if es_mejor_a:
-                mejor_str = f"◄ {nombre_a_corto}"  # Equipo A es mejor (flecha apunta a la izquierda)
-            else:
-                mejor_str = f"{nombre_b_corto} ►"  # Equipo B es mejor (flecha apunta a la derecha)
-            
-            filas.append({
-                'Métrica': idx,
-                equipo_a: valor_a_str,
-                equipo_b: valor_b_str,
-                'Mejor': mejor_str
-            })
-            
-            # Guardar datos auxiliares
-            datos_auxiliares.append({
-                'es_mejor_a': es_mejor_a,
-                'valor_a': valor_a,
-                'valor_b': valor_b
-            })
-        
-        df_display = pd.DataFrame(filas)
-        
-        # Función para aplicar estilos por fila
-        def aplicar_estilos(row):
-            """Aplica estilos: verde para mejor, rojo para peor"""
-            fila_idx = row.name
-            aux_data = datos_auxiliares[fila_idx]
-            es_mejor_a = aux_data['es_mejor_a']
-            
-            # Crear array de estilos para cada columna
-            estilos = [''] * len(row)
-            columnas = list(row.index)
-            
-            # Índices de columnas
-            idx_metrica = columnas.index('Métrica')
-            idx_equipo_a = columnas.index(equipo_a)
-            idx_equipo_b = columnas.index(equipo_b)
-            idx_mejor = columnas.index('Mejor')
-            
-            # Estilo para columna "Mejor" - cian
-            estilos[idx_mejor] = 'color: #00d9ff; font-weight: 700; text-align: center; font-family: monospace; font-size: 1rem;'
-            
-            # Aplicar estilos según cuál es mejor
-            if es_mejor_a:
-                # Equipo A es mejor - verde
-                estilos[idx_equipo_a] = 'background-color: rgba(0, 255, 136, 0.25); color: #00ff88; font-weight: 700; font-family: monospace; border-left: 3px solid #00ff88; padding-left: 0.5rem;'
-                # Equipo B es peor - rojo
-                estilos[idx_equipo_b] = 'background-color: rgba(255, 68, 68, 0.25); color: #ff4444; font-weight: 600; font-family: monospace;'
-            else:
-                # Equipo B es mejor - verde
-                estilos[idx_equipo_b] = 'background-color: rgba(0, 255, 136, 0.25); color: #00ff88; font-weight: 700; font-family: monospace; border-left: 3px solid #00ff88; padding-left: 0.5rem;'
-                # Equipo A es peor - rojo
-                estilos[idx_equipo_a] = 'background-color: rgba(255, 68, 68, 0.25); color: #ff4444; font-weight: 600; font-family: monospace;'
-            
-            return estilos
-        
-        # Aplicar estilos
-        try:
-            df_styled = df_display.style.apply(aplicar_estilos, axis=1)
-        except Exception as e:
-            st.error(f"Error en estilos: {e}")
-            df_styled = df_display
-        
-        # Mostrar tabla
-        st.dataframe(
-            df_styled,
-            use_container_width=True,
-            hide_index=True
-        )
+    # Métricas disponibles en orden de categoría; la categoría se muestra en su primera fila
+    metricas, categorias = [], []
+    for categoria, metricas_categoria in CATEGORIAS_COMPARACION.items():
+        disponibles = [m for m in metricas_categoria if m in comparacion_df.index]
+        metricas.extend(disponibles)
+        categorias.extend([categoria] + [''] * (len(disponibles) - 1) if disponibles else [])
+    
+    if not metricas:
+        return
+    
+    # dict.fromkeys: si se elige el mismo equipo dos veces, una sola columna (todo empata)
+    df_metricas = comparacion_df.loc[metricas, list(dict.fromkeys([equipo_a, equipo_b]))]
+    resultado = comparar_equipos(df_metricas)
+    mejor_a = resultado['es_mejor'][equipo_a].to_numpy()
+    mejor_b = resultado['es_mejor'][equipo_b].to_numpy()
+    
+    # Valores formateados con el formato registrado y el badge de posición en la liga
+    columnas_equipo = {}
+    for equipo in (equipo_a, equipo_b):
+        valores = [formatear_valor(m, v) for m, v in zip(metricas, df_metricas[equipo])]
+        if rangos is not None:
+            valores = [
+                f"{valor}  {formatear_rango(rangos.loc[equipo, m])}" if m in rangos.columns else valor
+                for m, valor in zip(metricas, valores)
+            ]
+        columnas_equipo[equipo] = valores
+    
+    # Flecha hacia el mejor equipo; "=" si empatan
+    mejor = np.select(
+        [mejor_a, mejor_b],
+        [f"◄ {_nombre_corto(equipo_a)}", f"{_nombre_corto(equipo_b)} ►"],
+        default="="
+    )
+    
+    df_display = pd.DataFrame({
+        'Categoría': categorias,
+        'Métrica': metricas,
+        **columnas_equipo,
+        'Mejor': mejor
+    })
+    
+    # Matriz de estilos completa: verde para el mejor, rojo para el peor
+    estilos = pd.DataFrame('', index=df_display.index, columns=df_display.columns)
+    for equipo, es_mejor, es_peor in [
+        (equipo_a, mejor_a, resultado['es_peor'][equipo_a].to_numpy()),
+        (equipo_b, mejor_b, resultado['es_peor'][equipo_b].to_numpy())
+    ]:
+        estilos[equipo] = np.where(es_mejor, ESTILO_MEJOR, np.where(es_peor, ESTILO_PEOR, ''))
+    estilos['Mejor'] = ESTILO_COLUMNA_MEJOR
+    
+    st.dataframe(
+        df_display.style.apply(lambda _: estilos, axis=None),
+        width='stretch',
+        hide_index=True,
+        height=35 * (len(df_display) + 1) + 3
+    )
 
 
+@medido('html')
 def render_simple_header(equipo_a, equipo_b, temporada):
     """
     Renderiza un header estilo betting - compacto y funcional.
     """
-    st.markdown(f"""
-        <div style='text-align: center; padding: 1.5rem 0; border-bottom: 2px solid #00ff88; margin-bottom: 1.5rem;'>
-            <h1 style='color: #00ff88; margin: 0; font-size: 2rem; font-weight: 700; letter-spacing: 1px; font-family: monospace;'>
-                {equipo_a} <span style='color: #00d9ff; font-weight: 300;'>VS</span> {equipo_b}
-            </h1>
-            <p style='color: #b4b4ff; margin: 0.5rem 0 0 0; font-size: 0.85rem; letter-spacing: 1px; text-transform: uppercase;'>
-                Temporada {temporada}
-            </p>
-        </div>
-    """, unsafe_allow_html=True)
-
-
-def render_bento_grid(datos_a, datos_b, equipo_a, equipo_b, net_rating_a, net_rating_b, prob_a, prob_b):
+    st.markdown(html_header_duelo(equipo_a, equipo_b, temporada), unsafe_allow_html=True)
+
+
+def _badge_rango(rangos, equipo, metrica):
+    """Devuelve el HTML del badge de ranking de liga, o cadena vacía si no hay rankings."""
+    if rangos is None or metrica not in rangos.columns:
+        return ''
+    return html_badge_rango(formatear_rango(rangos.loc[equipo, metrica]))
+
+
+@medido('html')
+def render_page_header(titulo, temporada):
+    """
+    Renderiza un header de página con título y temporada, con el mismo estilo que el del duelo.
+    """
+    st.markdown(html_header(titulo, temporada), unsafe_allow_html=True)
+
+
+def render_sidebar_config(temporada, contenedor=None):
+    """
+    Renderiza el encabezado del sidebar con el badge de la temporada.
+    
+    Args:
+        temporada (str): Temporada mostrada en el badge
+        contenedor: Contenedor donde escribir (por defecto, el sidebar)
+    """
+    (contenedor or st.sidebar).markdown(html_sidebar_config(temporada), unsafe_allow_html=True)
+
+
+def render_skeleton(contenedor, estado):
+    """
+    Renderiza el esqueleto de carga (header y bloques del Bento Grid) en un placeholder.
+    
+    Args:
+        contenedor: Placeholder (``st.empty()``) que luego reemplazarán los datos
+        estado (str): Mensaje de estado de la carga
+    """
+    contenedor.markdown(html_esqueleto(estado), unsafe_allow_html=True)
+
+
+def render_sidebar_fuente():
+    """
+    Renderiza el bloque del sidebar con la fuente de los datos.
+    """
+    st.sidebar.markdown(SIDEBAR_FUENTE, unsafe_allow_html=True)
+
+
+def render_vs_divider():
+    """
+    Renderiza el separador "VS" entre los selectores de equipo.
+    """
+    st.markdown(DIVISOR_VS, unsafe_allow_html=True)
+
+
+@medido('html')
+def render_bento_grid(datos_a, datos_b, equipo_a, equipo_b, net_rating_a, net_rating_b, prob_a, prob_b, rangos=None):
     """
     Renderiza un layout Bento Grid con información clave para betting.
     
+    Todo el bloque (probabilidad, rating neto y stats clave) se envía como un
+    único mensaje HTML; el HTML se memoiza sobre los valores ya formateados.
+    
     Args:
         datos_a, datos_b: Series con datos de equipos
         equipo_a, equipo_b: Nombres de equipos
         net_rating_a, net_rating_b: Ratings netos
         prob_a, prob_b: Probabilidades de victoria
+        rangos: DataFrame de rankings de liga precalculados (opcional)
     """
-    # Bloque Principal: Probabilidades y Win Probability
-    col_main_1, col_main_2 = st.columns([2, 1])
+    def valor(datos, equipo, metrica):
+        return formatear_valor(metrica, datos[metrica], compacto=True) + _badge_rango(rangos, equipo, metrica)
     
-    with col_main_1:
-        st.markdown("### 🎯 Win Probability")
-        prob_a_pct = round(prob_a * 100, 1)
-        prob_b_pct = round(prob_b * 100, 1)
-        
-        # Barra de probabilidad visual
-        st.markdown(f"""
-        <div style='background: #0f1422; border: 1px solid #1a2332; border-radius: 8px; padding: 1rem; margin-bottom: 1rem;'>
-            <div style='display: flex; justify-content: space-between; margin-bottom: 0.5rem; font-size: 0.75rem; color: #b4b4ff;'>
-                <span><strong>{equipo_a}</strong></span>
-                <span><strong>{equipo_b}</strong></span>
-            </div>
-            <div style='display: flex; height: 40px; border-radius: 6px; overflow: hidden; background: #1a2332;'>
-                <div style='background: linear-gradient(90deg, #00ff88 0%, #00d9ff 100%); width: {prob_a_pct}%; display: flex; align-items: center; justify-content: center; color: #0a0e27; font-weight: 700; font-family: monospace; font-size: 1.1rem;'>
-                    {prob_a_pct}%
-                </div>
-                <div style='background: linear-gradient(90deg, #ff4444 0%, #ff8c00 100%); width: {prob_b_pct}%; display: flex; align-items: center; justify-content: center; color: white; font-weight: 700; font-family: monospace; font-size: 1.1rem;'>
-                    {prob_b_pct}%
-                </div>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col_main_2:
-        st.markdown("### 📊 Net Rating")
-        st.markdown(f"""
-        <div style='background: #0f1422; border: 1px solid #1a2332; border-radius: 8px; padding: 1rem;'>
-            <div style='margin-bottom: 0.75rem;'>
-                <div style='color: #b4b4ff; font-size: 0.75rem; margin-bottom: 0.25rem;'>{equipo_a}</div>
-                <div style='color: #00ff88; font-family: monospace; font-size: 1.5rem; font-weight: 700;'>{net_rating_a:+.2f}</div>
-            </div>
-            <div>
-                <div style='color: #b4b4ff; font-size: 0.75rem; margin-bottom: 0.25rem;'>{equipo_b}</div>
-                <div style='color: #ff4444; font-family: monospace; font-size: 1.5rem; font-weight: 700;'>{net_rating_b:+.2f}</div>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    # Bloque Secundario: Stats Clave Compactas
-    st.markdown("---")
-    st.markdown("### 📈 Key Stats")
-    
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.markdown(f"""
-        <div style='background: #0f1422; border: 1px solid #1a2332; border-radius: 8px; padding: 0.75rem; text-align: center;'>
-            <div style='color: #b4b4ff; font-size: 0.7rem; margin-bottom: 0.5rem; text-transform: uppercase; letter-spacing: 0.5px;'>Win Rate</div>
-            <div style='color: #00ff88; font-family: monospace; font-size: 1.25rem; font-weight: 700;'>{datos_a['Porc. Victoria']:.1%}</div>
-            <div style='color: #ff4444; font-family: monospace; font-size: 1.25rem; font-weight: 700;'>{datos_b['Porc. Victoria']:.1%}</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown(f"""
-        <div style='background: #0f1422; border: 1px solid #1a2332; border-radius: 8px; padding: 0.75rem; text-align: center;'>
-            <div style='color: #b4b4ff; font-size: 0.7rem; margin-bottom: 0.5rem; text-transform: uppercase; letter-spacing: 0.5px;'>OFF Rating</div>
-            <div style='color: #00ff88; font-family: monospace; font-size: 1.25rem; font-weight: 700;'>{datos_a['Rating Ofensivo']:.1f}</div>
-            <div style='color: #ff4444; font-family: monospace; font-size: 1.25rem; font-weight: 700;'>{datos_b['Rating Ofensivo']:.1f}</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col3:
-        st.markdown(f"""
-        <div style='background: #0f1422; border: 1px solid #1a2332; border-radius: 8px; padding: 0.75rem; text-align: center;'>
-            <div style='color: #b4b4ff; font-size: 0.7rem; margin-bottom: 0.5rem; text-transform: uppercase; letter-spacing: 0.5px;'>DEF Rating</div>
-            <div style='color: #ff4444; font-family: monospace; font-size: 1.25rem; font-weight: 700;'>{datos_a['Rating Defensivo']:.1f}</div>
-            <div style='color: #00ff88; font-family: monospace; font-size: 1.25rem; font-weight: 700;'>{datos_b['Rating Defensivo']:.1f}</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col4:
-        st.markdown(f"""
-        <div style='background: #0f1422; border: 1px solid #1a2332; border-radius: 8px; padding: 0.75rem; text-align: center;'>
-            <div style='color: #b4b4ff; font-size: 0.7rem; margin-bottom: 0.5rem; text-transform: uppercase; letter-spacing: 0.5px;'>PACE</div>
-            <div style='color: #00d9ff; font-family: monospace; font-size: 1.25rem; font-weight: 700;'>{datos_a['Ritmo de Juego']:.1f}</div>
-            <div style='color: #00d9ff; font-family: monospace; font-size: 1.25rem; font-weight: 700;'>{datos_b['Ritmo de Juego']:.1f}</div>
-        </div>
-        """, unsafe_allow_html=True)
+    # Stats clave compactas: (título, métrica, color equipo A, color equipo B)
+    tarjetas = tuple(
+        (titulo, color_a, valor(datos_a, equipo_a, metrica), color_b, valor(datos_b, equipo_b, metrica))
+        for titulo, metrica, color_a, color_b in [
+            ('Win Rate', 'Porc. Victoria', '#00ff88', '#ff4444'),
+            ('OFF Rating', 'Rating Ofensivo', '#00ff88', '#ff4444'),
+            ('DEF Rating', 'Rating Defensivo', '#ff4444', '#00ff88'),
+            ('PACE', 'Ritmo de Juego', '#00d9ff', '#00d9ff')
+        ]
+    )
+    
+    st.markdown(html_bento_grid(
+        equipo_a,
+        equipo_b,
+        round(prob_a * 100, 1),
+        round(prob_b * 100, 1),
+        formatear_valor('Rating Neto', net_rating_a),
+        formatear_valor('Rating Neto', net_rating_b),
+        tarjetas
+    ), unsafe_allow_html=True)
+
+
+def _configuracion_columna(metrica):
+    """Devuelve el formato de columna de st.dataframe según el formato registrado de la métrica."""
+    formato = formato_metrica(metrica)
+    if formato.endswith('%'):
+        return st.column_config.NumberColumn(metrica, format="percent")
+    return st.column_config.NumberColumn(metrica, format=f"%{formato}")
+
+
+@medido('html')
+def render_leaderboard(df_nba, indices_orden, temporada, rangos=None):
+    """
+    Renderiza la clasificación de la liga ordenable por cualquier métrica.
+    
+    El orden se obtiene de permutaciones precalculadas, así que cambiar la
+    columna de orden solo indexa filas por posición en lugar de ordenar el DataFrame.
+    
+    Args:
+        df_nba (pd.DataFrame): DataFrame procesado de la temporada
+        indices_orden (dict): Permutaciones {métrica: posiciones} (mejor primero)
+        temporada (str): Temporada mostrada
+        rangos (pd.DataFrame): Rankings de liga precalculados (opcional)
+    """
+    render_page_header("🏆 CLASIFICACIÓN", temporada)
+    
+    metricas = [m for m in indices_orden if m != 'Equipo']
+    col_metrica, col_orden = st.columns([3, 1])
+    
+    with col_metrica:
+        metrica = st.selectbox(
+            "ORDENAR POR",
+            metricas + ['Equipo'],
+            index=metricas.index('Porc. Victoria') if 'Porc. Victoria' in metricas else 0,
+            help="Métrica usada para ordenar la clasificación"
+        )
+    
+    with col_orden:
+        invertir = st.toggle("Invertir orden", help="Mostrar de peor a mejor")
+    
+    orden = indices_orden[metrica]
+    if invertir:
+        orden = orden[::-1]
+    
+    columnas = ['Equipo'] + ([metrica] if metrica != 'Equipo' else []) + [m for m in metricas if m != metrica]
+    tabla = df_nba.iloc[orden][columnas]
+    
+    # Posición: ranking de liga (respeta empates) si está disponible, si no el orden mostrado
+    if rangos is not None and metrica in rangos.columns:
+        posiciones = rangos[metrica].to_numpy()[orden]
+    else:
+        posiciones = np.arange(1, len(tabla) + 1)
+    tabla.insert(0, 'Pos', posiciones)
+    
+    st.dataframe(
+        tabla,
+        width='stretch',
+        hide_index=True,
+        height=min(35 * (len(tabla) + 1) + 3, 1100),
+        column_config={m: _configuracion_columna(m) for m in metricas}
+    )
+
+
+@medido('html')
+def render_similar_teams(equipo, similares, nombres):
+    """
+    Renderiza la lista de equipos históricos más parecidos a un equipo.
+    
+    Args:
+        equipo (str): Nombre del equipo de referencia
+        similares (list): Tuplas (temporada, TEAM_ID, distancia) de más a menos parecido
+        nombres (dict): Mapa {TEAM_ID: nombre de equipo}
+    """
+    st.markdown(f"#### {equipo}")
+    
+    if not similares:
+        st.info("ℹ️ Aún no hay otras temporadas almacenadas. Abre la pestaña TENDENCIA para cargarlas.")
+        return
+    
+    tabla = pd.DataFrame({
+        'Temporada': [temporada for temporada, _, _ in similares],
+        'Equipo': [nombres.get(team_id, str(team_id)) for _, team_id, _ in similares],
+        'Distancia': [distancia for _, _, distancia in similares]
+    })
+    
+    st.dataframe(
+        tabla,
+        width='stretch',
+        hide_index=True,
+        column_config={
+            'Distancia': st.column_config.ProgressColumn(
+                'Distancia',
+                help="Distancia entre perfiles estandarizados (menor = más parecido)",
+                format="%.2f",
+                min_value=0.0,
+                max_value=max(d for _, _, d in similares)
+            )
+        }
+    )
+
+
+@medido('html')
+def render_multi_comparison_table(comparacion_df, resultado):
+    """
+    Renderiza una única tabla métricas × equipos resaltando al mejor y al peor en cada métrica.
+    
+    Los estilos se calculan de una vez para toda la tabla a partir de las
+    máscaras de comparación, sin callbacks por fila.
+    
+    Args:
+        comparacion_df (pd.DataFrame): DataFrame con índice=métricas y columnas=equipos
+        resultado (dict): Resultado de ``comparar_equipos`` sobre ``comparacion_df``
+    """
+    equipos = list(comparacion_df.columns)
+    tabla = comparacion_df.assign(Mejor=resultado['mejor'], Peor=resultado['peor'])
+    
+    estilos = np.where(
+        resultado['es_mejor'].to_numpy(),
+        ESTILO_MEJOR,
+        np.where(resultado['es_peor'].to_numpy(), ESTILO_PEOR, '')
+    )
+    matriz_estilos = pd.DataFrame(estilos, index=comparacion_df.index, columns=equipos)
+    matriz_estilos['Mejor'] = ESTILO_COLUMNA_MEJOR
+    matriz_estilos['Peor'] = ESTILO_COLUMNA_MEJOR
+    
+    df_styled = tabla.style.apply(lambda _: matriz_estilos, axis=None)
+    
+    # Un formato por grupo de métricas que comparten formato registrado
+    filas_por_formato = {}
+    for metrica in comparacion_df.index:
+        filas_por_formato.setdefault(formato_metrica(metrica), []).append(metrica)
+    for formato, filas in filas_por_formato.items():
+        df_styled = df_styled.format(f'{{:{formato}}}', subset=pd.IndexSlice[filas, equipos])
+    
+    st.dataframe(df_styled, width='stretch')
 
 
 def render_metric_card(label, value, delta=None, delta_color="normal"):
@@ -275,3 +369,97 @@ def render_metric_card(label, value, delta=None, delta_color="normal"):
         delta_color (str): Color del delta ("normal", "inverse")
     """
     st.metric(label=label, value=value, delta=delta)
+
+
+def render_panel_tiempos(rerun, contenedor=None):
+    """
+    Renderiza el panel de depuración con el tiempo de cada etapa del rerun en curso.
+    
+    Las etapas que no aparecen se sirvieron desde cache en este rerun. El panel
+    de un rerun del script completo (sidebar) no cambia cuando solo se
+    re-ejecuta un fragmento; el fragmento del duelo muestra el suyo aparte.
+    
+    Args:
+        rerun (core.telemetria.Rerun): Rerun en curso (None si la instrumentación está desactivada)
+        contenedor: Contenedor donde escribir (por defecto, el sidebar)
+    """
+    if rerun is None:
+        return
+    
+    etapas = rerun.por_etapa()
+    medido_total = sum(segundos for segundos, _ in etapas.values())
+    transcurrido = rerun.transcurrido()
+    titulo = "⏱️ TIEMPOS DEL FRAGMENTO" if rerun.tipo == 'fragmento' else "⏱️ TIEMPOS POR ETAPA (RERUN COMPLETO)"
+    with (contenedor or st.sidebar).expander(titulo):
+        if etapas:
+            st.dataframe(
+                pd.DataFrame(
+                    [(etapa, segundos * 1000, cuenta) for etapa, (segundos, cuenta) in etapas.items()],
+                    columns=['Etapa', 'ms', 'Tramos']
+                ),
+                hide_index=True,
+                width='stretch',
+                column_config={'ms': st.column_config.NumberColumn(format="%.1f")}
+            )
+        else:
+            st.caption("Todas las etapas se sirvieron desde cache")
+        st.caption(
+            f"Rerun: {transcurrido * 1000:.0f} ms · en etapas: {medido_total * 1000:.0f} ms · "
+            f"resto (Streamlit, cache, layout): {max(transcurrido - medido_total, 0) * 1000:.0f} ms"
+        )
+        if rerun.tipo == 'script':
+            st.caption("No se actualiza cuando solo se re-ejecuta un fragmento (equipos, tendencia, clasificación)")
+
+
+def render_panel_caches(caches, contenedor=None, max_entradas=15):
+    """
+    Renderiza el panel de depuración con las estadísticas de cada cache y sus entradas más pesadas.
+    
+    Args:
+        caches (list): Caches del núcleo (``core.cache.listar_caches()``)
+        contenedor: Contenedor donde escribir (por defecto, el sidebar)
+        max_entradas (int): Entradas a listar, de mayor a menor tamaño
+    """
+    if not caches:
+        return
+    
+    resumenes = [cache.resumen() for cache in caches]
+    entradas = sorted(
+        ((cache.nombre, entrada) for cache in caches for entrada in cache.entradas()),
+        key=lambda item: item[1]['bytes'],
+        reverse=True
+    )[:max_entradas]
+    with (contenedor or st.sidebar).expander("🗄️ CACHES"):
+        st.dataframe(
+            pd.DataFrame(
+                [(r['nombre'], r['capa'], r['entradas'], r['bytes'] / 1024, r['aciertos'], r['fallos'],
+                  r['refrescos'], sum(r['expulsiones'].values()),
+                  None if r['tasa_aciertos'] is None else r['tasa_aciertos'] * 100)
+                 for r in resumenes],
+                columns=['Cache', 'Capa', 'Entradas', 'KB', 'Aciertos', 'Fallos', 'Refrescos', 'Expulsiones', '% Aciertos']
+            ),
+            hide_index=True,
+            width='stretch',
+            column_config={
+                'KB': st.column_config.NumberColumn(format="%.1f"),
+                '% Aciertos': st.column_config.NumberColumn(format="%.0f")
+            }
+        )
+        if entradas:
+            st.dataframe(
+                pd.DataFrame(
+                    [(nombre, describir_clave(entrada['clave']), entrada['bytes'] / 1024, entrada['edad'])
+                     for nombre, entrada in entradas],
+                    columns=['Cache', 'Entrada', 'KB', 'Edad (s)']
+                ),
+                hide_index=True,
+                width='stretch',
+                column_config={
+                    'KB': st.column_config.NumberColumn(format="%.1f"),
+                    'Edad (s)': st.column_config.NumberColumn(format="%.0f")
+                }
+            )
+        expulsiones = {
+            motivo: sum(r['expulsiones'][motivo] for r in resumenes) for motivo in resumenes[0]['expulsiones']
+        }
+        st.caption("Expulsiones: " + " · ".join(f"{motivo} {cuenta}" for motivo, cuenta in expulsiones.items()))
@@ -2,6 +2,8 @@
 Estilos CSS modulares para la aplicación - Estilo Betting/Fintech
 """
 
+import re
+
 MAIN_CSS = """
     <style>
     /* Dark Mode Base */
@@ -239,6 +241,19 @@ MAIN_CSS = """
         font-size: 0.75rem;
     }
     
+    /* Esqueleto de carga */
+    .esqueleto-bloque {
+        background: linear-gradient(90deg, #0f1422 25%, #1a2332 50%, #0f1422 75%);
+        background-size: 200% 100%;
+        border-radius: 8px;
+        animation: esqueleto-brillo 1.5s infinite;
+    }
+    
+    @keyframes esqueleto-brillo {
+        0% { background-position: 200% 0; }
+        100% { background-position: -200% 0; }
+    }
+    
     /* Expanders */
     .streamlit-expanderHeader {
         background: #1a2332;
@@ -248,7 +263,35 @@ MAIN_CSS = """
     </style>
 """
 
+
+def minificar_css(css):
+    """
+    Minifica una hoja de estilos: quita comentarios, saltos de línea y espacios innecesarios.
+    
+    Args:
+        css (str): CSS a minificar (puede incluir las etiquetas <style>)
+        
+    Returns:
+        str: CSS minificado
+    """
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.DOTALL)
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{};:,>])\s*', r'\1', css)
+    css = css.replace(';}', '}')
+    return css.strip()
+
+
+# Se minifica una sola vez, al importar el módulo
+MAIN_CSS_MIN = minificar_css(MAIN_CSS)
+
+
 def apply_custom_styles():
-    """Aplica los estilos CSS personalizados."""
+    """
+    Aplica los estilos CSS personalizados.
+    
+    Se envía la versión minificada con ``st.html``: al contener solo etiquetas
+    <style>, Streamlit la coloca fuera del layout. Solo se envía en las
+    ejecuciones completas del script; los reruns de fragmentos no la repiten.
+    """
     import streamlit as st
-    st.markdown(MAIN_CSS, unsafe_allow_html=True)
+    st.html(MAIN_CSS_MIN)
@@ -0,0 +1,197 @@
+"""
+Plantillas HTML precompiladas para los componentes de la aplicación - Estilo Betting/Fintech
+"""
+
+from functools import lru_cache
+from string import Template
+
+# Tamaño de la memoización de cada componente (combinaciones de equipos/temporadas)
+MAX_HTML_CACHE = 512
+
+
+def _compilar(html):
+    """
+    Compacta y compila una plantilla una sola vez, al importar el módulo.
+
+    Se eliminan la indentación y los saltos de línea: el HTML enviado ocupa
+    menos y Markdown no confunde líneas indentadas con bloques de código.
+    Ninguna plantilla parte un texto visible entre dos líneas.
+
+    Args:
+        html (str): HTML con marcadores ``$nombre``
+
+    Returns:
+        string.Template: Plantilla compilada
+    """
+    return Template(''.join(linea.strip() for linea in html.splitlines()))
+
+
+HEADER = _compilar("""
+    <div style='text-align: center; padding: 1.5rem 0; border-bottom: 2px solid #00ff88; margin-bottom: 1.5rem;'>
+        <h1 style='color: #00ff88; margin: 0; font-size: 2rem; font-weight: 700; letter-spacing: 1px; font-family: monospace;'>
+            $titulo
+        </h1>
+        <p style='color: #b4b4ff; margin: 0.5rem 0 0 0; font-size: 0.85rem; letter-spacing: 1px; text-transform: uppercase;'>
+            Temporada $temporada
+        </p>
+    </div>
+""")
+
+TITULO_DUELO = _compilar("""
+    $equipo_a <span style='color: #00d9ff; font-weight: 300;'>VS</span> $equipo_b
+""")
+
+BADGE_RANGO = _compilar("""
+    <span style='color: #b4b4ff; font-size: 0.7rem; font-weight: 400; margin-left: 0.35rem;'>$rango</span>
+""")
+
+BENTO_GRID = _compilar("""
+    <div style='display: grid; grid-template-columns: 2fr 1fr; gap: 1rem;'>
+        <div>
+            <h3>🎯 Win Probability</h3>
+            <div style='background: #0f1422; border: 1px solid #1a2332; border-radius: 8px; padding: 1rem; margin-bottom: 1rem;'>
+                <div style='display: flex; justify-content: space-between; margin-bottom: 0.5rem; font-size: 0.75rem; color: #b4b4ff;'>
+                    <span><strong>$equipo_a</strong></span>
+                    <span><strong>$equipo_b</strong></span>
+                </div>
+                <div style='display: flex; height: 40px; border-radius: 6px; overflow: hidden; background: #1a2332;'>
+                    <div style='background: linear-gradient(90deg, #00ff88 0%, #00d9ff 100%); width: $prob_a%; display: flex; align-items: center; justify-content: center; color: #0a0e27; font-weight: 700; font-family: monospace; font-size: 1.1rem;'>
+                        $prob_a%
+                    </div>
+                    <div style='background: linear-gradient(90deg, #ff4444 0%, #ff8c00 100%); width: $prob_b%; display: flex; align-items: center; justify-content: center; color: white; font-weight: 700; font-family: monospace; font-size: 1.1rem;'>
+                        $prob_b%
+                    </div>
+                </div>
+            </div>
+        </div>
+        <div>
+            <h3>📊 Net Rating</h3>
+            <div style='background: #0f1422; border: 1px solid #1a2332; border-radius: 8px; padding: 1rem;'>
+                <div style='margin-bottom: 0.75rem;'>
+                    <div style='color: #b4b4ff; font-size: 0.75rem; margin-bottom: 0.25rem;'>$equipo_a</div>
+                    <div style='color: #00ff88; font-family: monospace; font-size: 1.5rem; font-weight: 700;'>$neto_a</div>
+                </div>
+                <div>
+                    <div style='color: #b4b4ff; font-size: 0.75rem; margin-bottom: 0.25rem;'>$equipo_b</div>
+                    <div style='color: #ff4444; font-family: monospace; font-size: 1.5rem; font-weight: 700;'>$neto_b</div>
+                </div>
+            </div>
+        </div>
+    </div>
+    <hr/>
+    <h3>📈 Key Stats</h3>
+    <div style='display: grid; grid-template-columns: repeat(4, 1fr); gap: 1rem;'>
+        $tarjetas
+    </div>
+""")
+
+TARJETA_STAT = _compilar("""
+    <div style='background: #0f1422; border: 1px solid #1a2332; border-radius: 8px; padding: 0.75rem; text-align: center;'>
+        <div style='color: #b4b4ff; font-size: 0.7rem; margin-bottom: 0.5rem; text-transform: uppercase; letter-spacing: 0.5px;'>$titulo</div>
+        <div style='color: $color_a; font-family: monospace; font-size: 1.25rem; font-weight: 700;'>$valor_a</div>
+        <div style='color: $color_b; font-family: monospace; font-size: 1.25rem; font-weight: 700;'>$valor_b</div>
+    </div>
+""")
+
+ESQUELETO = _compilar("""
+    <div>
+        <div style='text-align: center; padding: 1.5rem 0; border-bottom: 2px solid #1a2332; margin-bottom: 1.5rem;'>
+            <div class='esqueleto-bloque' style='height: 2.4rem; width: 60%; margin: 0 auto;'></div>
+            <p style='color: #b4b4ff; margin: 0.75rem 0 0 0; font-size: 0.85rem; letter-spacing: 1px; text-transform: uppercase;'>$estado</p>
+        </div>
+        <div style='display: grid; grid-template-columns: 2fr 1fr; gap: 1rem; margin-bottom: 1.5rem;'>
+            <div class='esqueleto-bloque' style='height: 120px;'></div>
+            <div class='esqueleto-bloque' style='height: 120px;'></div>
+        </div>
+        <div style='display: grid; grid-template-columns: repeat(4, 1fr); gap: 1rem;'>
+            <div class='esqueleto-bloque' style='height: 90px;'></div>
+            <div class='esqueleto-bloque' style='height: 90px;'></div>
+            <div class='esqueleto-bloque' style='height: 90px;'></div>
+            <div class='esqueleto-bloque' style='height: 90px;'></div>
+        </div>
+    </div>
+""")
+
+SIDEBAR_CONFIG = _compilar("""
+    <h3>⚙️ CONFIG</h3>
+    <div style='text-align: center; padding: 0.75rem; background: #0f1422; border: 1px solid #00ff88; border-radius: 8px; color: #00ff88; margin-bottom: 1rem;'>
+        <div style='font-size: 0.7rem; color: #b4b4ff; text-transform: uppercase; letter-spacing: 1px; margin-bottom: 0.25rem;'>Temporada</div>
+        <div style='font-size: 1.25rem; font-weight: 700; font-family: monospace;'>$temporada</div>
+    </div>
+""")
+
+# Bloques sin variables: se compactan una vez y se envían tal cual
+SIDEBAR_FUENTE = _compilar("""
+    <div style='background: #0f1422; padding: 0.75rem; border-radius: 8px; border: 1px solid #1a2332;'>
+        <div style='font-weight: 600; margin-bottom: 0.25rem; color: #00d9ff; font-size: 0.75rem; text-transform: uppercase; letter-spacing: 0.5px;'>Fuente</div>
+        <div style='font-size: 0.7rem; color: #b4b4ff;'>
+            API Oficial NBA<br/>stats.nba.com
+        </div>
+    </div>
+""").template
+
+DIVISOR_VS = _compilar("""
+    <div style='text-align: center; font-size: 1rem; margin-top: 2rem; color: #00d9ff; font-weight: 700; letter-spacing: 2px;'>VS</div>
+""").template
+
+
+@lru_cache(maxsize=MAX_HTML_CACHE)
+def html_header(titulo, temporada):
+    """Devuelve el HTML del header de página."""
+    return HEADER.substitute(titulo=titulo, temporada=temporada)
+
+
+@lru_cache(maxsize=MAX_HTML_CACHE)
+def html_header_duelo(equipo_a, equipo_b, temporada):
+    """Devuelve el HTML del header del duelo."""
+    return html_header(TITULO_DUELO.substitute(equipo_a=equipo_a, equipo_b=equipo_b), temporada)
+
+
+def html_badge_rango(rango):
+    """Devuelve el HTML del badge de ranking de liga (por ejemplo, "#3")."""
+    return BADGE_RANGO.substitute(rango=rango)
+
+
+@lru_cache(maxsize=MAX_HTML_CACHE)
+def html_bento_grid(equipo_a, equipo_b, prob_a, prob_b, neto_a, neto_b, tarjetas):
+    """
+    Devuelve el HTML completo del Bento Grid.
+
+    Todos los argumentos son cadenas ya formateadas (y ``tarjetas`` una tupla),
+    de modo que la memoización funciona sobre valores hashables.
+
+    Args:
+        equipo_a (str): Nombre del equipo A
+        equipo_b (str): Nombre del equipo B
+        prob_a (float): Probabilidad de victoria del equipo A, en porcentaje
+        prob_b (float): Probabilidad de victoria del equipo B, en porcentaje
+        neto_a (str): Rating neto formateado del equipo A
+        neto_b (str): Rating neto formateado del equipo B
+        tarjetas (tuple): Tuplas (título, color_a, valor_a, color_b, valor_b)
+
+    Returns:
+        str: HTML del Bento Grid
+    """
+    return BENTO_GRID.substitute(
+        equipo_a=equipo_a,
+        equipo_b=equipo_b,
+        prob_a=prob_a,
+        prob_b=prob_b,
+        neto_a=neto_a,
+        neto_b=neto_b,
+        tarjetas=''.join(
+            TARJETA_STAT.substitute(titulo=titulo, color_a=color_a, valor_a=valor_a, color_b=color_b, valor_b=valor_b)
+            for titulo, color_a, valor_a, color_b, valor_b in tarjetas
+        )
+    )
+
+
+@lru_cache(maxsize=MAX_HTML_CACHE)
+def html_sidebar_config(temporada):
+    """Devuelve el HTML del encabezado del sidebar con el badge de temporada."""
+    return SIDEBAR_CONFIG.substitute(temporada=temporada)
+
+
+def html_esqueleto(estado):
+    """Devuelve el HTML del esqueleto de carga con un mensaje de estado."""
+    return ESQUELETO.substitute(estado=estado)
@@ -1,17 +1,35 @@
 """
 Módulo de utilidades para la aplicación de Análisis NBA
+
+Los nombres exportados se resuelven en el primer acceso (PEP 562), de modo que
+``import utils`` no arrastra submódulos que la página aún no necesita.
 """
 
-from .season_utils import obtener_temporada_actual, validar_temporada_disponible, generar_lista_temporadas
-from .nba_api import obtener_datos_nba, NBA_API_AVAILABLE
-from .data_processing import procesar_datos_nba
+import importlib
+
+# Nombre exportado -> submódulo que lo define
+_EXPORTACIONES = {
+    'obtener_temporada_actual': '.season_utils',
+    'validar_temporada_disponible': '.season_utils',
+    'invalidar_validacion': '.season_utils',
+    'generar_lista_temporadas': '.season_utils',
+    'obtener_datos_nba': '.nba_api',
+    'invalidar_datos_nba': '.nba_api',
+    'NBA_API_AVAILABLE': '.nba_api',
+    'procesar_datos_nba': '.data_processing'
+}
+
+__all__ = list(_EXPORTACIONES)
+
+
+def __getattr__(nombre):
+    modulo = _EXPORTACIONES.get(nombre)
+    if modulo is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
+    valor = getattr(importlib.import_module(modulo, __name__), nombre)
+    globals()[nombre] = valor  # Los siguientes accesos no pasan por __getattr__
+    return valor
 
-__all__ = [
-    'obtener_temporada_actual',
-    'validar_temporada_disponible',
-    'generar_lista_temporadas',
-    'obtener_datos_nba',
-    'NBA_API_AVAILABLE',
-    'procesar_datos_nba'
-]
 
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
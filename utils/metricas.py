@@ -0,0 +1,17 @@
+"""
+Registro de métricas (compatibilidad: el registro vive en ``core.metricas``)
+"""
+
+from core.metricas import (  # noqa: F401
+    Metrica,
+    REGISTRO_METRICAS,
+    declarar_metrica_base,
+    registrar_metrica,
+    orden_evaluacion,
+    evaluar_metricas,
+    metricas_derivadas,
+    metricas_menor_es_mejor,
+    es_menor_mejor,
+    formato_metrica,
+    formatear_valor
+)
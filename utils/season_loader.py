@@ -0,0 +1,35 @@
+"""
+Carga concurrente de varias temporadas con snapshots locales como cache
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from config import MAX_WORKERS_CARGA
+from core.fetch import descargar_temporada
+from core.snapshots import antiguedad_snapshot, snapshot_vigente
+
+
+def cargar_temporadas(temporadas, max_workers=MAX_WORKERS_CARGA, eventos=None):
+    """
+    Garantiza que haya snapshot local para cada temporada, descargando en paralelo las que falten.
+
+    Args:
+        temporadas (list): Temporadas en formato "YYYY-YY"
+        max_workers (int): Número máximo de descargas simultáneas
+        eventos (callable): Receptor ``eventos(EventoEstado)`` para las descargas
+
+    Returns:
+        dict: Mapa {temporada: bool} indicando si la temporada quedó disponible
+    """
+    disponibles = {t: snapshot_vigente(t) for t in temporadas}
+    faltantes = [t for t, ok in disponibles.items() if not ok]
+
+    if faltantes:
+        # descargar_temporada guarda el snapshot al terminar con éxito
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(faltantes))) as executor:
+            resultados = executor.map(lambda t: descargar_temporada(t, eventos=eventos), faltantes)
+            for temporada, df_nba in zip(faltantes, resultados):
+                # Si la descarga falla, un snapshot caducado sigue siendo mejor que nada
+                disponibles[temporada] = not df_nba.empty or antiguedad_snapshot(temporada) is not None
+
+    return disponibles
@@ -0,0 +1,11 @@
+"""
+Snapshots locales por temporada (compatibilidad: viven en ``core.snapshots``)
+"""
+
+from core.snapshots import (  # noqa: F401
+    guardar_snapshot,
+    cargar_snapshot,
+    listar_snapshots,
+    antiguedad_snapshot,
+    snapshot_vigente
+)